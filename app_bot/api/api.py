@@ -1,5 +1,7 @@
 # Standard library
 import os
+from collections import OrderedDict
+from typing import Optional
 
 # Third-party
 import httpx
@@ -9,6 +11,46 @@ from app_bot.logger import logger
 
 
 API_URL = os.getenv("API_URL")  # pragma: no mutate
+CONDITIONAL_CACHE_SIZE = 64  # pragma: no mutate
+
+# URL -> (ETag, JSON) of the last response of each cacheable GET.
+conditional_cache = OrderedDict()
+
+
+async def get_cached_json(client: httpx.AsyncClient, url: str):
+    """
+    GET a JSON resource, revalidating the cached copy with its ETag.
+
+    The request carries `If-None-Match` when a copy is cached; a 304
+    answer returns the copy without downloading the body again. The
+    cache keeps the most recently used URLs only.
+
+    Args:
+        client (httpx.AsyncClient): Open HTTP client.
+        url (str): Resource URL.
+
+    Returns:
+        Any: Decoded JSON body.
+
+    Raises:
+        httpx.HTTPStatusError: If the API responds with an error status.
+    """
+    cached = conditional_cache.get(url)
+    headers = {"If-None-Match": cached[0]} if cached else {}
+    resp = await client.get(url, headers=headers)
+    if cached and resp.status_code == 304:
+        logger.debug(f"Not modified: {url}")  # pragma: no mutate
+        conditional_cache.move_to_end(url)
+        return cached[1]
+    resp.raise_for_status()
+    data = resp.json()
+    etag = resp.headers.get("etag")
+    if etag:
+        conditional_cache[url] = (etag, data)
+        conditional_cache.move_to_end(url)
+        while len(conditional_cache) > CONDITIONAL_CACHE_SIZE:
+            conditional_cache.popitem(last=False)
+    return data
 
 
 async def post_scream(content: str, user_id: str):
@@ -175,6 +217,42 @@ async def confirm_scream(scream_id: int, user_id: str):
         raise
 
 
+async def moderate_screams(user_id: str, confirm: list, delete: list):
+    """
+    Confirm and delete many screams with one request.
+
+    Args:
+        user_id (str): The ID of the admin.
+        confirm (list): IDs of screams to confirm.
+        delete (list): IDs of screams to delete.
+
+    Returns:
+        dict: `confirmed` and `deleted` IDs actually applied.
+
+    Raises:
+        httpx.HTTPStatusError: If the API responds with a non-2xx status code.
+    """
+    try:
+        logger.debug(  # pragma: no mutate
+            f"Moderating {len(confirm)} confirmed and {len(delete)} "
+            f"deleted screams by user {user_id}"
+        )
+        async with httpx.AsyncClient() as client:
+            resp = await client.post(
+                f"{API_URL}/moderate",
+                json={"user_id": user_id, "confirm": confirm,
+                      "delete": delete}
+            )
+            resp.raise_for_status()
+            logger.info("Screams moderated successfully")  # pragma: no mutate
+            return resp.json()
+    except Exception as e:
+        logger.error(  # pragma: no mutate
+            f"Bulk moderation failed: {str(e)}", exc_info=True
+        )
+        raise
+
+
 async def react_to_scream(scream_id: int, emoji: str, user_id: str):
     """
     Send a reaction to a scream on behalf of a user.
@@ -211,56 +289,78 @@ async def react_to_scream(scream_id: int, emoji: str, user_id: str):
         raise
 
 
-async def get_next_scream(user_id: str):
+async def get_feed_batch(user_id: str, limit: int, after: int = 0):
     """
-    Fetch the next unseen scream for the given user from the backend API.
+    Fetch the next unseen screams for the given user in one request.
 
     Args:
         user_id (str): The external user ID.
+        limit (int): Maximum number of screams to fetch.
+        after (int): ID of the last scream already buffered by the bot.
 
     Returns:
-        dict: A JSON object containing the next scream's ID and content.
+        list: Scream dicts with `scream_id` and `content`, possibly empty.
 
     Raises:
         httpx.HTTPStatusError: If the backend API returns an error.
     """
     try:
         logger.debug(
-            f"Getting next scream for user {user_id}"
+            f"Getting {limit} screams for user {user_id}"
             )  # pragma: no mutate
         async with httpx.AsyncClient() as client:
-            resp = await client.get(f"{API_URL}/feed/{user_id}")
+            resp = await client.get(
+                f"{API_URL}/feed/{user_id}/batch",
+                params={"limit": limit, "after": after}
+            )
             resp.raise_for_status()
-            logger.info("Scream retrieved successfully")  # pragma: no mutate
-            return resp.json()
+            screams = resp.json()["screams"]
+            logger.info(
+                f"Retrieved {len(screams)} feed screams"
+                )  # pragma: no mutate
+            return screams
     except Exception as e:
         logger.error(  # pragma: no mutate
-            f"Failed to get scream: {str(e)}", exc_info=True
+            f"Failed to get feed batch: {str(e)}", exc_info=True
         )
         raise
 
 
-async def get_all_screams_for_admin(user_id: str):
+async def get_moderation_page(user_id: str, limit: int, after_id: int = 0,
+                              before_id: Optional[int] = None):
     """
-    Retrieve all unmoderated screams for the admin.
+    Claim and retrieve the admin's next batch of the moderation queue.
+
+    The backend leases the batch to the admin for a limited time, so
+    other admins get different screams.
 
     Args:
         user_id (str): The admin's user ID.
+        limit (int): Maximum number of screams on the page.
+        after_id (int): Return screams after this scream ID.
+        before_id (Optional[int]): If set, return the screams right
+            before this scream ID instead.
 
     Returns:
-        dict: List of unmoderated screams with content and IDs.
+        dict: `screams` with IDs and content in ID order, and `total`,
+        the number of unmoderated screams left this week that are not
+        leased to other admins.
 
     Raises:
-        Exception: On failure to fetch data.
+        httpx.HTTPStatusError: 404 if nothing is left to moderate,
+            403 if the user is not an admin.
     """
     try:
         logger.debug(
-            f"Getting all screams for admin {user_id}"
+            f"Getting moderation page after {after_id} for admin {user_id}"
             )  # pragma: no mutate
+        payload = {"user_id": user_id, "limit": limit, "after_id": after_id}
+        if before_id is not None:
+            payload["before_id"] = before_id
         async with httpx.AsyncClient() as client:
             resp = await client.post(
                 f"{API_URL}/screams/admin",
-                json={"user_id": user_id}
+                json=payload
             )
             resp.raise_for_status()
             logger.info(
@@ -316,12 +416,11 @@ async def get_stress_stats():
     try:
         logger.debug("Getting weekly stress stats")  # pragma: no mutate
         async with httpx.AsyncClient() as client:
-            resp = await client.get(f"{API_URL}/stress")
+            data = await get_cached_json(client, f"{API_URL}/stress")
             logger.info(
                 "Stress stats retrieved successfully"
                 )  # pragma: no mutate
-            resp.raise_for_status()
-            return resp.json()
+            return data
     except Exception as e:
         logger.error(  # pragma: no mutate
             f"Failed to get stress stats: {str(e)}", exc_info=True
@@ -342,11 +441,11 @@ async def get_top_screams(n: int = 3):
     try:
         logger.debug(f"Getting top {n} screams")  # pragma: no mutate
         async with httpx.AsyncClient() as client:
-            resp = await client.get(f"{API_URL}/top")
+            data = await get_cached_json(client, f"{API_URL}/top")
             logger.info(
                 "Top screams retrieved successfully"
                 )  # pragma: no mutate
-            return resp.json()
+            return data
     except Exception as e:
         logger.error(  # pragma: no mutate
             f"Failed to get top screams: {str(e)}", exc_info=True
@@ -369,9 +468,7 @@ async def get_history():
             "Fetching available historical weeks"
             )  # pragma: no mutate
         async with httpx.AsyncClient() as client:
-            resp = await client.get(f"{API_URL}/history")
-            resp.raise_for_status()
-            data = resp.json()
+            data = await get_cached_json(client, f"{API_URL}/history")
             return data.get("weeks", [])
     except Exception as e:
         logger.error(  # pragma: no mutate
@@ -399,9 +496,8 @@ async def get_historical_week(week_id: str):
             f"Fetching historical week {week_id}"
             )  # pragma: no mutate
         async with httpx.AsyncClient() as client:
-            resp = await client.get(f"{API_URL}/history/{week_id}")
-            resp.raise_for_status()
-            data = resp.json()
+            data = await get_cached_json(client,
+                                         f"{API_URL}/history/{week_id}")
             top_three = data.get("posts", [])[:3]
             logger.info(  # pragma: no mutate
                 f"Retrieved {len(top_three)} screams for week {week_id}"
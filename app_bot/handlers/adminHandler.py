@@ -10,22 +10,152 @@ from app_bot.api.api import (
     confirm_scream,
     create_admin,
     delete_scream,
-    get_all_screams_for_admin,
+    get_moderation_page,
+    moderate_screams,
 )
 from app_bot.FSM.admin import AdminScreamReview
 from app_bot.keyboards.adminKeyboards import deletion_keyboard_setup
 from app_bot.logger import logger
 
 
+MODERATION_PAGE_SIZE = 10  # pragma: no mutate
+
 adminRouter = Router()
 
 
+def scream_text(session: dict) -> str:
+    """
+    Render the scream an admin is currently reviewing.
+
+    Args:
+        session (dict): Moderation FSM data with the current `page`,
+            the `index` on it, the `offset` of the page in the queue, the
+            queue's `total` and, in multi-select mode, the `batch` flag
+            with the `to_confirm` and `to_delete` queues.
+
+    Returns:
+        str: Message text with the scream's position, ID and content.
+    """
+    current = session["page"][session["index"]]
+    position = session["offset"] + session["index"] + 1
+    text = (
+        f"🧠 Scream {position} out of {session['total']}:\n\n"
+        f"📌Scream_id: {current['scream_id']}\n\n"
+        f"📝Content:\n{current['content']}"
+    )
+    if session.get("batch"):
+        queued = (len(session.get("to_confirm", []))
+                  + len(session.get("to_delete", [])))
+        text += f"\n\n🗂 Multi-select: {queued} queued"
+    return text
+
+
+async def load_page(user_id: str, after_id: int = 0, before_id=None):
+    """
+    Fetch one moderation page, treating an empty queue as no page.
+
+    Args:
+        user_id (str): The admin's user ID.
+        after_id (int): Return screams after this scream ID.
+        before_id (Optional[int]): Return screams before this ID instead.
+
+    Returns:
+        Optional[dict]: The page with `screams` and `total`, or None if
+        nothing is left to moderate.
+    """
+    try:
+        page = await get_moderation_page(user_id, MODERATION_PAGE_SIZE,
+                                         after_id, before_id)
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            return None
+        raise
+    return page if page["screams"] else None
+
+
+async def flush_decisions(user_id: str, session: dict):
+    """
+    Send the decisions queued in multi-select mode with one request.
+
+    Args:
+        user_id (str): The admin's user ID.
+        session (dict): Session data whose queues are emptied.
+    """
+    confirm = session.get("to_confirm", [])
+    delete = session.get("to_delete", [])
+    if confirm or delete:
+        result = await moderate_screams(user_id, confirm, delete)
+        logger.info(f"Admin {user_id} confirmed "
+                    f"{len(result['confirmed'])} and deleted "
+                    f"{len(result['deleted'])} screams")
+    session["to_confirm"], session["to_delete"] = [], []
+
+
+async def page_after(user_id: str, session: dict, after_id: int):
+    """
+    Move a moderation session to the page following a scream.
+
+    Queued decisions are flushed first, so the new page and total
+    reflect them. Wraps around to the start of the queue after its
+    last page.
+
+    Args:
+        user_id (str): The admin's user ID.
+        session (dict): Current session data.
+        after_id (int): ID of the last scream already walked past.
+
+    Returns:
+        Optional[dict]: Session data for the new page, or None if the
+        queue is empty.
+    """
+    await flush_decisions(user_id, session)
+    offset = session["offset"] + len(session["page"])
+    page = await load_page(user_id, after_id)
+    if page is None and after_id:
+        page, offset = await load_page(user_id), 0
+    if page is None:
+        return None
+    return {**session, "page": page["screams"], "index": 0,
+            "offset": offset, "total": page["total"]}
+
+
+async def advance(user_id: str, session: dict):
+    """
+    Drop the reviewed scream from a session and move to the next one.
+
+    Moves on to the following page once the current one is used up.
+
+    Args:
+        user_id (str): The admin's user ID.
+        session (dict): Session data holding the reviewed scream.
+
+    Returns:
+        Optional[dict]: Updated session data, or None if the queue is
+        empty.
+    """
+    page = session["page"]
+    index = session["index"]
+    reviewed = page.pop(index)
+    if index < len(page):
+        session["total"] -= 1
+        return session
+    return await page_after(user_id, session, reviewed["scream_id"])
+
+
 @adminRouter.message(Command("delete"))
 async def handle_delete(msg: types.Message, state: FSMContext):
-    """Handle /delete command to start moderation session."""
-    screams = []
+    """
+    Handle /delete command to start moderation session.
+
+    The FSM state holds only the current page of the queue, the position
+    on it and the queue size; other pages are fetched by keyset while
+    navigating, so a session costs the same however many screams wait
+    for review.
+    """
+    page = None
     try:
-        screams = await get_all_screams_for_admin(str(msg.from_user.id))
+        page = await get_moderation_page(str(msg.from_user.id),
+                                         MODERATION_PAGE_SIZE)
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
             await msg.answer("🎉 All screams are already reviewed.")
@@ -38,26 +168,22 @@ async def handle_delete(msg: types.Message, state: FSMContext):
 
     try:
         user_id = str(msg.from_user.id)
-        if not screams:
+        if not page or not page["screams"]:
             logger.info("No screams available for moderation")
             await msg.answer("😴 No screams available.")
             return
         logger.info(f"Admin {user_id} started moderation session")
 
-        scream_index = 0
-        await state.update_data(screams=screams, index=scream_index)
+        session = {"page": page["screams"], "index": 0, "offset": 0,
+                   "total": page["total"], "batch": False,
+                   "to_confirm": [], "to_delete": []}
+        await state.update_data(**session)
         await state.set_state(AdminScreamReview.reviewing)
 
-        current = screams[scream_index]
-        logger.debug(f"Displaying scream {current['scream_id']} to admin")
-
-        message_text = (
-            f"🧠 Scream {scream_index + 1} out of {len(screams)}:\n\n"
-            f"📌Scream_id: {current['scream_id']}\n\n"
-            f"📝Content:\n{current['content']}"
-        )
+        logger.debug(f"Displaying scream "
+                     f"{session['page'][0]['scream_id']} to admin")
         await msg.answer(
-            text=message_text,
+            text=scream_text(session),
             reply_markup=deletion_keyboard_setup()
         )
     except Exception as e:
@@ -71,21 +197,31 @@ async def process_callback_button_back(
     state: FSMContext
 ):
     """Handle back navigation in moderation feed."""
-    data = await state.get_data()
-    scream_index = (data["index"] - 1) % len(data["screams"])
-    screams = data["screams"]
-
-    data["index"] = scream_index
-    current = screams[scream_index]
+    session = await state.get_data()
+    if session["index"] > 0:
+        session["index"] -= 1
+    elif session["offset"] == 0:
+        await callback_query.answer("⏮ This is the first scream.")
+        return
+    else:
+        user_id = str(callback_query.from_user.id)
+        await flush_decisions(user_id, session)
+        page = await load_page(user_id,
+                               before_id=session["page"][0]["scream_id"])
+        if page is None:
+            await state.update_data(**session)
+            await callback_query.answer("⏮ This is the first scream.")
+            return
+        session.update(
+            page=page["screams"],
+            index=len(page["screams"]) - 1,
+            offset=max(session["offset"] - len(page["screams"]), 0),
+            total=page["total"]
+        )
 
-    await state.update_data(screams=screams, index=scream_index)
-    message_text = (
-        f"🧠 Scream {scream_index + 1} out of {len(screams)}:\n\n"
-        f"📌Scream_id: {current['scream_id']}\n\n"
-        f"📝Content:\n{current['content']}"
-    )
+    await state.update_data(**session)
     await callback_query.message.edit_text(
-        text=message_text,
+        text=scream_text(session),
         reply_markup=deletion_keyboard_setup()
     )
 
@@ -140,6 +276,77 @@ async def handle_create_admin(msg: types.Message):
         await msg.answer("Failed to assign admin rights.")
 
 
+async def show_after_review(
+    callback_query: CallbackQuery,
+    state: FSMContext,
+    session: dict,
+    done_text: str
+):
+    """
+    Show the scream following a reviewed one as a new message.
+
+    Ends the session when the queue is empty.
+
+    Args:
+        callback_query (CallbackQuery): The moderation button press.
+        state (FSMContext): Moderation FSM state.
+        session (dict): Session data holding the reviewed scream.
+        done_text (str): Message sent once every scream is reviewed.
+    """
+    session = await advance(str(callback_query.from_user.id), session)
+    if session is None:
+        logger.info("All screams reviewed")
+        await state.clear()
+        await callback_query.message.answer(done_text)
+        return
+
+    await state.update_data(**session)
+    logger.debug(f"Showing next scream "
+                 f"{session['page'][session['index']]['scream_id']}")
+    await callback_query.message.answer(
+        text=scream_text(session),
+        reply_markup=deletion_keyboard_setup()
+    )
+
+
+async def queue_decision(
+    callback_query: CallbackQuery,
+    state: FSMContext,
+    session: dict,
+    queue: str
+):
+    """
+    Queue a multi-select decision and show the next scream in place.
+
+    Queued decisions are sent with one bulk request when the page is
+    used up, when leaving multi-select mode and on exit.
+
+    Args:
+        callback_query (CallbackQuery): The moderation button press.
+        state (FSMContext): Moderation FSM state.
+        session (dict): Session data holding the decided scream.
+        queue (str): "to_confirm" or "to_delete".
+    """
+    current = session["page"][session["index"]]
+    session[queue] = [*session.get(queue, []), current["scream_id"]]
+    logger.debug(f"Queued scream {current['scream_id']} in {queue}")
+
+    session = await advance(str(callback_query.from_user.id), session)
+    if session is None:
+        logger.info("All screams reviewed")
+        await state.clear()
+        await callback_query.message.edit_text(
+            "🎉 All screams reviewed.", reply_markup=None
+        )
+        return
+
+    await state.update_data(**session)
+    await callback_query.message.edit_text(
+        text=scream_text(session),
+        reply_markup=deletion_keyboard_setup()
+    )
+
+
 @adminRouter.callback_query(F.data.startswith('button_delete'))
 async def process_callback_button_delete(
     callback_query: CallbackQuery,
@@ -147,10 +354,11 @@ async def process_callback_button_delete(
 ):
     """Handle delete action for a scream in moderation feed."""
     try:
-        data = await state.get_data()
-        screams = data["screams"]
-        index = data["index"]
-        current = screams[index]
+        session = await state.get_data()
+        if session.get("batch"):
+            await queue_decision(callback_query, state, session, "to_delete")
+            return
+        current = session["page"][session["index"]]
         user_id = str(callback_query.from_user.id)
         logger.info(f"Admin {user_id} deleting scream {current['scream_id']}")
 
@@ -162,29 +370,8 @@ async def process_callback_button_delete(
                 text=f"🗑️ Deleted scream:\n\n{current['content']}",
                 reply_markup=None
             )
-
-            screams.pop(index)
-            if not screams:
-                logger.info("All screams reviewed")
-                await state.clear()
-                await callback_query.message.answer("✅ All screams reviewed.")
-                return
-
-            index = index % len(screams)
-            await state.update_data(screams=screams, index=index)
-
-            next_scream = screams[index]
-            logger.debug(f"Showing next scream {next_scream['scream_id']}")
-
-            message_text = (
-                f"🧠 Scream {index + 1} out of {len(screams)}:\n\n"
-                f"📌Scream_id: {next_scream['scream_id']}\n\n"
-                f"📝Content:\n{next_scream['content']}"
-            )
-            await callback_query.message.answer(
-                text=message_text,
-                reply_markup=deletion_keyboard_setup()
-            )
+            await show_after_review(callback_query, state, session,
+                                    "✅ All screams reviewed.")
         else:
             logger.warning(f"Failed to delete scream {current['scream_id']}")
             await callback_query.message.answer("🤔 Couldn't delete scream.")
@@ -203,10 +390,12 @@ async def process_callback_button_confirm(
 ):
     """Handle confirm action for a scream in moderation feed."""
     try:
-        data = await state.get_data()
-        screams = data["screams"]
-        index = data["index"]
-        current = screams[index]
+        session = await state.get_data()
+        if session.get("batch"):
+            await queue_decision(callback_query, state, session,
+                                 "to_confirm")
+            return
+        current = session["page"][session["index"]]
         user_id = str(callback_query.from_user.id)
         logger.info(
             f"Admin {user_id} confirming scream {current['scream_id']}"
@@ -220,29 +409,8 @@ async def process_callback_button_confirm(
                 text=f"✅ Confirmed scream:\n\n{current['content']}",
                 reply_markup=None
             )
-
-            screams.pop(index)
-            if not screams:
-                logger.info("All screams reviewed")
-                await state.clear()
-                await callback_query.message.answer("🎉 All screams reviewed.")
-                return
-
-            index = index % len(screams)
-            await state.update_data(screams=screams, index=index)
-
-            next_scream = screams[index]
-            logger.debug(f"Showing next scream {next_scream['scream_id']}")
-
-            message_text = (
-                f"🧠 Scream {index + 1} out of {len(screams)}:\n\n"
-                f"📌Scream_id: {next_scream['scream_id']}\n\n"
-                f"📝Content:\n{next_scream['content']}"
-            )
-            await callback_query.message.answer(
-                text=message_text,
-                reply_markup=deletion_keyboard_setup()
-            )
+            await show_after_review(callback_query, state, session,
+                                    "🎉 All screams reviewed.")
         else:
             logger.warning(f"Failed to confirm scream {current['scream_id']}")
             await callback_query.message.answer("🤔 Could not confirm scream.")
@@ -261,20 +429,27 @@ async def process_callback_button_next(
 ):
     """Handle next navigation in moderation feed."""
     try:
-        data = await state.get_data()
-        scream_index = (data["index"] + 1) % len(data["screams"])
-        screams = data["screams"]
-        current = screams[scream_index]
+        session = await state.get_data()
+        if session["index"] + 1 < len(session["page"]):
+            session["index"] += 1
+        else:
+            session = await page_after(
+                str(callback_query.from_user.id),
+                session,
+                session["page"][-1]["scream_id"]
+            )
+        if session is None:
+            await state.clear()
+            await callback_query.message.edit_text(
+                "🎉 All screams reviewed.", reply_markup=None
+            )
+            return
+        current = session["page"][session["index"]]
         logger.debug(f"Admin navigating to next scream {current['scream_id']}")
 
-        await state.update_data(screams=screams, index=scream_index)
-        message_text = (
-            f"🧠 Scream {scream_index + 1} out of {len(screams)}:\n\n"
-            f"📌Scream_id: {current['scream_id']}\n\n"
-            f"📝Content:\n{current['content']}"
-        )
+        await state.update_data(**session)
         await callback_query.message.edit_text(
-            text=message_text,
+            text=scream_text(session),
             reply_markup=deletion_keyboard_setup()
         )
     except Exception as e:
@@ -285,14 +460,46 @@ async def process_callback_button_next(
         await callback_query.answer("❌ Navigation error")
 
 
+@adminRouter.callback_query(F.data == 'button_batch')
+async def process_callback_button_batch(
+    callback_query: CallbackQuery,
+    state: FSMContext
+):
+    """
+    Toggle multi-select mode in a moderation session.
+
+    In multi-select mode ❌ and ✅ queue decisions instead of sending them
+    one by one; leaving the mode sends the queued ones.
+    """
+    try:
+        session = await state.get_data()
+        if session.get("batch"):
+            await flush_decisions(str(callback_query.from_user.id), session)
+        session["batch"] = not session.get("batch")
+        logger.debug(f"Multi-select mode set to {session['batch']}")
+
+        await state.update_data(**session)
+        await callback_query.message.edit_text(
+            text=scream_text(session),
+            reply_markup=deletion_keyboard_setup()
+        )
+    except Exception as e:
+        logger.error(
+            f"Failed to toggle multi-select: {str(e)}",
+            exc_info=True
+        )
+        await callback_query.answer("❌ Multi-select failed")
+
+
 @adminRouter.callback_query(F.data == 'button_exit')
 async def process_callback_button_exit(
     callback_query: CallbackQuery,
     state: FSMContext
 ):
-    """Handle exit action from moderation session."""
+    """Handle exit action, sending any queued multi-select decisions."""
     try:
         user_id = str(callback_query.from_user.id)
+        await flush_decisions(user_id, await state.get_data())
         logger.info(f"Admin {user_id} exited moderation mode")
         await state.clear()
         await callback_query.message.edit_text(
@@ -5,7 +5,7 @@ from aiogram.filters import Command
 # Local application
 from app_bot.api.api import get_top_screams, post_scream
 from app_bot.logger import logger
-from app_bot.utils import send_next_scream
+from app_bot.utils import feed_buffer, send_next_scream
 
 
 screamRouter = Router()
@@ -67,10 +67,13 @@ async def handle_feed(msg: types.Message):
 
     Behavior:
         - Sends temporary loading message
+        - Restarts the feed from the backend cursor, dropping screams
+        prefetched for an earlier feed session
         - Delegates retrieval to `send_next_scream()`
     """
     user_id = str(msg.from_user.id)
     logger.info(f"User {user_id} requested feed")  # pragma: no mutate
+    feed_buffer.clear(user_id)
     dummy_msg = await msg.answer("⏳ Loading your scream...")
     await send_next_scream(user_id, dummy_msg)
 
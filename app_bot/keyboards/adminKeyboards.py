@@ -16,6 +16,7 @@ def deletion_keyboard_setup() -> InlineKeyboardMarkup:
         ❌ - Delete the current scream.
         ✅ - Confirm (approve) the current scream.
         ➡️ - Navigate to the next scream.
+        🗂 Multi-select - Toggle queueing decisions for a bulk request.
         🚪 Exit - Exit moderation mode.
     """
     deletion_kb = InlineKeyboardBuilder()
@@ -25,6 +26,8 @@ def deletion_keyboard_setup() -> InlineKeyboardMarkup:
         InlineKeyboardButton(text='❌', callback_data='button_delete'),
         InlineKeyboardButton(text='✅', callback_data='button_confirm'),
         InlineKeyboardButton(text='➡️', callback_data='button_next'),
+        InlineKeyboardButton(text='🗂 Multi-select',
+                             callback_data='button_batch'),
         InlineKeyboardButton(text='🚪 Exit', callback_data='button_exit'),
     )
-    return deletion_kb.adjust(4, 1).as_markup()
+    return deletion_kb.adjust(4, 2).as_markup()
@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock
+
+from app_bot.utils import FeedBuffer
+
+
+def screams(*ids):
+    return [{"scream_id": i, "content": f"scream {i}"} for i in ids]
+
+
+@pytest.mark.asyncio
+async def test_serves_from_memory_and_refills_in_background(monkeypatch):
+    """Only an empty buffer waits for the API; low buffers refill behind."""
+    fetch = AsyncMock(side_effect=[screams(1, 2, 3, 4), screams(5, 6, 7, 8)])
+    monkeypatch.setattr("app_bot.utils.get_feed_batch", fetch)
+    buffer = FeedBuffer(batch_size=4, low_watermark=2)
+
+    served = [(await buffer.next("u"))["scream_id"] for _ in range(3)]
+    assert served == [1, 2, 3]
+    fetch.assert_awaited_once_with("u", 4, 0)
+
+    await asyncio.sleep(0)
+    fetch.assert_awaited_with("u", 4, 4)
+    served = [(await buffer.next("u"))["scream_id"] for _ in range(5)]
+    assert served == [4, 5, 6, 7, 8]
+
+
+@pytest.mark.asyncio
+async def test_refill_skips_already_buffered(monkeypatch):
+    """Screams not newer than the buffered ones are not added twice."""
+    fetch = AsyncMock(side_effect=[screams(1, 2), screams(2, 3)])
+    monkeypatch.setattr("app_bot.utils.get_feed_batch", fetch)
+    buffer = FeedBuffer(batch_size=2, low_watermark=2)
+
+    assert (await buffer.next("u"))["scream_id"] == 1
+    await asyncio.sleep(0)
+    assert [(await buffer.next("u"))["scream_id"] for _ in range(2)] == [2, 3]
+
+
+@pytest.mark.asyncio
+async def test_exhausted_feed_returns_none(monkeypatch):
+    """An empty backend batch means the feed is exhausted."""
+    monkeypatch.setattr("app_bot.utils.get_feed_batch",
+                        AsyncMock(return_value=[]))
+    assert await FeedBuffer().next("u") is None
+
+
+@pytest.mark.asyncio
+async def test_least_recent_user_evicted(monkeypatch):
+    """Buffers are kept only for the most recently active users."""
+    monkeypatch.setattr("app_bot.utils.get_feed_batch",
+                        AsyncMock(return_value=screams(1, 2, 3, 4)))
+    buffer = FeedBuffer(batch_size=4, low_watermark=1, max_users=1)
+
+    await buffer.next("a")
+    await buffer.next("b")
+    assert list(buffer._buffers) == ["b"]
+
+
+@pytest.mark.asyncio
+async def test_clear_during_refill_drops_the_batch(monkeypatch):
+    """A refill finishing after a clear neither fills nor unregisters."""
+    stale_gate, fresh_gate = asyncio.Event(), asyncio.Event()
+    gates = [stale_gate, fresh_gate]
+
+    async def fetch(user_id, limit, after):
+        if after:
+            await gates.pop(0).wait()
+            return screams(after + 1, after + 2)
+        return screams(1, 2, 3)
+
+    monkeypatch.setattr("app_bot.utils.get_feed_batch", fetch)
+    buffer = FeedBuffer(batch_size=3, low_watermark=3)
+
+    assert (await buffer.next("u"))["scream_id"] == 1
+    stale = buffer._refills["u"]
+    buffer.clear("u")
+    assert (await buffer.next("u"))["scream_id"] == 1
+    fresh = buffer._refills["u"]
+
+    stale_gate.set()
+    await stale
+    assert buffer._refills["u"] is fresh
+    assert [s["scream_id"] for s in buffer._buffers["u"]] == [2, 3]
+    fresh_gate.set()
+    await fresh
+    assert [s["scream_id"] for s in buffer._buffers["u"]] == [2, 3, 4, 5]
@@ -0,0 +1,75 @@
+import pytest
+from collections import OrderedDict
+from unittest.mock import AsyncMock, MagicMock
+
+from app_bot.api import api
+from app_bot.api.api import get_cached_json
+
+
+def make_response(status_code, data=None, etag=None):
+    """Build a fake httpx response."""
+    resp = MagicMock(status_code=status_code)
+    resp.json.return_value = data
+    resp.headers = {"etag": etag} if etag else {}
+    return resp
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    """Give each test an empty conditional cache."""
+    monkeypatch.setattr(api, "conditional_cache", OrderedDict())
+
+
+@pytest.mark.asyncio
+async def test_get_cached_json_revalidates_with_etag():
+    """
+    A response with an ETag is cached; the next request sends it in
+    If-None-Match and a 304 returns the cached JSON.
+    """
+    client = AsyncMock()
+    client.get.side_effect = [
+        make_response(200, {"weeks": [1]}, '"v1"'),
+        make_response(304),
+    ]
+
+    assert await get_cached_json(client, "http://api/history") == {
+        "weeks": [1]}
+    assert await get_cached_json(client, "http://api/history") == {
+        "weeks": [1]}
+    client.get.assert_awaited_with("http://api/history",
+                                   headers={"If-None-Match": '"v1"'})
+
+
+@pytest.mark.asyncio
+async def test_get_cached_json_replaces_changed_and_skips_untagged():
+    """A changed body replaces the copy; untagged bodies are not kept."""
+    client = AsyncMock()
+    client.get.side_effect = [
+        make_response(200, {"chart_url": "a"}, '"v1"'),
+        make_response(200, {"chart_url": "b"}, '"v2"'),
+        make_response(200, {"posts": []}),
+    ]
+
+    await get_cached_json(client, "http://api/stress")
+    assert await get_cached_json(client, "http://api/stress") == {
+        "chart_url": "b"}
+    await get_cached_json(client, "http://api/top")
+
+    assert dict(api.conditional_cache) == {
+        "http://api/stress": ('"v2"', {"chart_url": "b"})}
+
+
+@pytest.mark.asyncio
+async def test_get_cached_json_evicts_least_recently_used(monkeypatch):
+    """Only the most recently used URLs stay cached."""
+    monkeypatch.setattr(api, "CONDITIONAL_CACHE_SIZE", 2)
+    client = AsyncMock()
+    client.get.side_effect = [
+        make_response(200, {"week": n}, f'"{n}"') for n in range(3)
+    ]
+
+    for n in range(3):
+        await get_cached_json(client, f"http://api/history/{n}")
+
+    assert list(api.conditional_cache) == ["http://api/history/1",
+                                           "http://api/history/2"]
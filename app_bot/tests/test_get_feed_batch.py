@@ -2,17 +2,17 @@ import pytest
 import httpx
 from unittest.mock import AsyncMock, MagicMock
 
-from app_bot.api.api import get_next_scream
+from app_bot.api.api import get_feed_batch
 
 
 @pytest.mark.asyncio
-async def test_get_next_scream_success(monkeypatch):
-    """Test get_next_scream returns expected scream dict from backend."""
-    expected = {"scream_id": 42, "content": "Yell into the void"}
+async def test_get_feed_batch_success(monkeypatch):
+    """Test get_feed_batch returns the screams of the backend batch."""
+    batch = [{"scream_id": 42, "content": "Yell into the void"}]
 
     fake_response = MagicMock(spec=httpx.Response)
     fake_response.raise_for_status.return_value = None
-    fake_response.json.return_value = expected
+    fake_response.json.return_value = {"screams": batch}
 
     fake_client = AsyncMock()
     fake_client.get.return_value = fake_response
@@ -21,17 +21,20 @@ async def test_get_next_scream_success(monkeypatch):
 
     monkeypatch.setattr(httpx, "AsyncClient", lambda **kwargs: fake_client)
     monkeypatch.setattr("app_bot.api.api.API_URL", "http://mockserver")
-    result = await get_next_scream("user123")
+    result = await get_feed_batch("user123", 5, after=40)
 
-    assert result == expected
-    fake_client.get.assert_awaited_once_with("http://mockserver/feed/user123")
+    assert result == batch
+    fake_client.get.assert_awaited_once_with(
+        "http://mockserver/feed/user123/batch",
+        params={"limit": 5, "after": 40}
+    )
 
 
 @pytest.mark.asyncio
-async def test_get_next_scream_error(monkeypatch):
-    """Test get_next_scream raises on backend HTTP error."""
+async def test_get_feed_batch_error(monkeypatch):
+    """Test get_feed_batch raises on backend HTTP error."""
     err = httpx.HTTPStatusError("boom", request=None, response=MagicMock(
-        status_code=404
+        status_code=500
         ))
 
     fake_client = AsyncMock()
@@ -42,4 +45,4 @@ async def test_get_next_scream_error(monkeypatch):
     monkeypatch.setattr(httpx, "AsyncClient", lambda **kwargs: fake_client)
 
     with pytest.raises(httpx.HTTPStatusError):
-        await get_next_scream("ghost")
+        await get_feed_batch("ghost", 5)
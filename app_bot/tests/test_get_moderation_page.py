@@ -0,0 +1,66 @@
+import pytest
+from unittest.mock import patch, MagicMock
+import httpx
+from app_bot.api.api import get_moderation_page
+
+
+@pytest.mark.asyncio
+async def test_get_moderation_page_success():
+    """Should return the page and send the keyset cursor."""
+    mock_response = {
+        "screams": [
+            {"scream_id": 1, "content": "First scream"},
+            {"scream_id": 2, "content": "Second scream"},
+        ],
+        "total": 7
+    }
+
+    with patch.object(
+        httpx.AsyncClient,
+        "post",
+        return_value=MagicMock(
+            status_code=200,
+            json=lambda: mock_response
+        )
+    ) as post:
+        result = await get_moderation_page("admin_001", 2, after_id=5)
+
+        assert result == mock_response
+        assert post.call_args.kwargs["json"] == {
+            "user_id": "admin_001", "limit": 2, "after_id": 5
+        }
+
+
+@pytest.mark.asyncio
+async def test_get_moderation_page_before():
+    """Should send before_id when walking the queue backward."""
+    with patch.object(
+        httpx.AsyncClient,
+        "post",
+        return_value=MagicMock(
+            status_code=200,
+            json=lambda: {"screams": [], "total": 0}
+        )
+    ) as post:
+        await get_moderation_page("admin_001", 3, before_id=9)
+
+        assert post.call_args.kwargs["json"]["before_id"] == 9
+
+
+@pytest.mark.asyncio
+async def test_get_moderation_page_failure():
+    """Should raise HTTPStatusError when API call fails."""
+    mock_response = MagicMock(status_code=500)
+    mock_request = MagicMock()
+
+    with patch.object(
+        httpx.AsyncClient,
+        "post",
+        side_effect=httpx.HTTPStatusError(
+            "Request failed",
+            request=mock_request,
+            response=mock_response
+        )
+    ):
+        with pytest.raises(httpx.HTTPStatusError):
+            await get_moderation_page("admin_001", 10)
@@ -18,6 +18,8 @@ async def test_get_top_screams_success(monkeypatch):
     expected = {"posts": [{"content": "X", "votes": 5}]}
     fake_response = MagicMock(spec=httpx.Response)
     fake_response.json.return_value = expected
+    fake_response.status_code = 200
+    fake_response.headers = {}
     fake_client = AsyncMock()
     fake_client.get.return_value = fake_response
     fake_client.__aenter__.return_value = fake_client
@@ -26,7 +28,8 @@ async def test_get_top_screams_success(monkeypatch):
     monkeypatch.setattr("app_bot.api.api.API_URL", "http://mockserver")
     result = await get_top_screams()
     assert result == expected
-    fake_client.get.assert_awaited_once_with("http://mockserver/top")
+    fake_client.get.assert_awaited_once_with("http://mockserver/top",
+                                             headers={})
 
 
 @pytest.mark.asyncio
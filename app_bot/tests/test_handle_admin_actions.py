@@ -6,6 +6,7 @@ from aiogram.types import CallbackQuery
 from aiogram.fsm.context import FSMContext
 from app_bot.handlers.adminHandler import (
     handle_delete,
+    process_callback_button_batch,
     process_callback_button_back,
     process_callback_button_next,
     process_callback_button_exit,
@@ -15,6 +16,15 @@ from app_bot.handlers.adminHandler import (
 from app_bot.FSM.admin import AdminScreamReview
 
 
+def empty_queue():
+    """Mock the moderation API reporting that nothing is left."""
+    return AsyncMock(side_effect=httpx.HTTPStatusError(
+        "Not Found",
+        request=MagicMock(),
+        response=MagicMock(status_code=404)
+    ))
+
+
 @pytest.mark.asyncio
 async def test_handle_delete_all_reviewed(monkeypatch):
     """Should notify admin if all screams are already reviewed (404)."""
@@ -25,7 +35,7 @@ async def test_handle_delete_all_reviewed(monkeypatch):
 
     state = MagicMock(spec=FSMContext)
 
-    async def mock_get_all_screams_for_admin(_):
+    async def mock_get_moderation_page(*_):
         raise httpx.HTTPStatusError(
             "Not Found",
             request=MagicMock(),
@@ -33,8 +43,8 @@ async def test_handle_delete_all_reviewed(monkeypatch):
         )
 
     monkeypatch.setattr(
-        "app_bot.handlers.adminHandler.get_all_screams_for_admin",
-        mock_get_all_screams_for_admin
+        "app_bot.handlers.adminHandler.get_moderation_page",
+        mock_get_moderation_page
     )
 
     await handle_delete(msg, state)
@@ -50,8 +60,8 @@ async def test_handle_delete_no_screams(monkeypatch):
     state = MagicMock(spec=FSMContext)
 
     monkeypatch.setattr(
-        "app_bot.handlers.adminHandler.get_all_screams_for_admin",
-        AsyncMock(return_value=[])
+        "app_bot.handlers.adminHandler.get_moderation_page",
+        AsyncMock(return_value={"screams": [], "total": 0})
     )
 
     await handle_delete(msg, state)
@@ -67,8 +77,10 @@ async def test_handle_delete_internal_error(monkeypatch):
     state = MagicMock(spec=FSMContext)
 
     monkeypatch.setattr(
-        "app_bot.handlers.adminHandler.get_all_screams_for_admin",
-        AsyncMock(return_value=[{"scream_id": 1, "content": "test"}])
+        "app_bot.handlers.adminHandler.get_moderation_page",
+        AsyncMock(return_value={
+            "screams": [{"scream_id": 1, "content": "test"}], "total": 1
+        })
     )
     state.update_data = AsyncMock(side_effect=Exception("fail"))
 
@@ -89,7 +101,7 @@ async def test_handle_delete_permission_denied(monkeypatch):
     mock_response = MagicMock(status_code=403)
     mock_request = MagicMock()
 
-    async def mock_get_all_screams_for_admin(_):
+    async def mock_get_moderation_page(*_):
         raise httpx.HTTPStatusError(
             "Forbidden",
             request=mock_request,
@@ -97,8 +109,8 @@ async def test_handle_delete_permission_denied(monkeypatch):
         )
 
     monkeypatch.setattr(
-        "app_bot.handlers.adminHandler.get_all_screams_for_admin",
-        mock_get_all_screams_for_admin
+        "app_bot.handlers.adminHandler.get_moderation_page",
+        mock_get_moderation_page
     )
 
     await handle_delete(msg, state)
@@ -125,8 +137,8 @@ async def test_handle_delete_displays_first_scream(monkeypatch):
     }]
 
     monkeypatch.setattr(
-        "app_bot.handlers.adminHandler.get_all_screams_for_admin",
-        AsyncMock(return_value=fake_screams)
+        "app_bot.handlers.adminHandler.get_moderation_page",
+        AsyncMock(return_value={"screams": fake_screams, "total": 1})
     )
 
     await handle_delete(msg, state)
@@ -148,6 +160,7 @@ async def test_process_callback_button_exit():
     callback.message.edit_text = AsyncMock()
 
     state = MagicMock(spec=FSMContext)
+    state.get_data = AsyncMock(return_value={})
     state.clear = AsyncMock()
 
     await process_callback_button_exit(callback, state)
@@ -167,6 +180,7 @@ async def test_process_callback_button_exit_fail():
     callback.message.edit_text = AsyncMock(side_effect=Exception("boom"))
     callback.answer = AsyncMock()
     state = MagicMock(spec=FSMContext)
+    state.get_data = AsyncMock(return_value={})
     state.clear = AsyncMock()
 
     await process_callback_button_exit(callback, state)
@@ -184,8 +198,8 @@ async def test_process_callback_button_back():
 
     state = MagicMock(spec=FSMContext)
     state.get_data = AsyncMock(return_value={
-        "index": 1,
-        "screams": [
+        "index": 1, "offset": 0, "total": 2,
+        "page": [
             {"scream_id": 111, "content": "first"},
             {"scream_id": 222, "content": "second"}
         ]
@@ -207,8 +221,8 @@ async def test_process_callback_button_next():
 
     state = MagicMock(spec=FSMContext)
     state.get_data = AsyncMock(return_value={
-        "index": 0,
-        "screams": [
+        "index": 0, "offset": 0, "total": 2,
+        "page": [
             {"scream_id": 111, "content": "first"},
             {"scream_id": 222, "content": "second"}
         ]
@@ -251,8 +265,8 @@ async def test_process_callback_button_delete(monkeypatch):
 
     state = MagicMock(spec=FSMContext)
     state.get_data = AsyncMock(return_value={
-        "index": 0,
-        "screams": [
+        "index": 0, "offset": 0, "total": 2,
+        "page": [
             {"scream_id": 111, "content": "hello"},
             {"scream_id": 222, "content": "world"}
         ]
@@ -281,8 +295,8 @@ async def test_process_callback_button_delete_fail(monkeypatch):
 
     state = MagicMock(spec=FSMContext)
     state.get_data = AsyncMock(return_value={
-        "index": 0,
-        "screams": [{"scream_id": 1, "content": "abc"}]
+        "index": 0, "offset": 0, "total": 2,
+        "page": [{"scream_id": 1, "content": "abc"}]
     })
 
     monkeypatch.setattr(
@@ -308,8 +322,8 @@ async def test_process_callback_button_delete_all_reviewed(monkeypatch):
     initial_screams = [{"scream_id": 999, "content": "lonely scream"}]
     state = MagicMock(spec=FSMContext)
     state.get_data = AsyncMock(return_value={
-        "index": 0,
-        "screams": initial_screams
+        "index": 0, "offset": 0, "total": 2,
+        "page": initial_screams
     })
     state.clear = AsyncMock()
     state.update_data = AsyncMock()
@@ -318,6 +332,10 @@ async def test_process_callback_button_delete_all_reviewed(monkeypatch):
         "app_bot.handlers.adminHandler.delete_scream",
         AsyncMock(return_value={"status": "deleted"})
     )
+    monkeypatch.setattr(
+        "app_bot.handlers.adminHandler.get_moderation_page",
+        empty_queue()
+    )
 
     await process_callback_button_delete(callback, state)
     callback.message.answer.assert_awaited_once_with("✅ All screams reviewed.")
@@ -335,8 +353,8 @@ async def test_process_callback_button_delete_exception(monkeypatch):
 
     state = MagicMock(spec=FSMContext)
     state.get_data = AsyncMock(return_value={
-        "index": 0,
-        "screams": [{"scream_id": 555, "content": "test scream"}]
+        "index": 0, "offset": 0, "total": 2,
+        "page": [{"scream_id": 555, "content": "test scream"}]
     })
 
     monkeypatch.setattr(
@@ -360,8 +378,8 @@ async def test_process_callback_button_confirm(monkeypatch):
 
     state = MagicMock(spec=FSMContext)
     state.get_data = AsyncMock(return_value={
-        "index": 0,
-        "screams": [
+        "index": 0, "offset": 0, "total": 2,
+        "page": [
             {"scream_id": 333, "content": "confirmed"},
             {"scream_id": 444, "content": "next"}
         ]
@@ -390,8 +408,8 @@ async def test_process_callback_button_confirm_fail(monkeypatch):
 
     state = MagicMock(spec=FSMContext)
     state.get_data = AsyncMock(return_value={
-        "index": 0,
-        "screams": [{"scream_id": 2, "content": "abc"}]
+        "index": 0, "offset": 0, "total": 2,
+        "page": [{"scream_id": 2, "content": "abc"}]
     })
 
     monkeypatch.setattr(
@@ -415,8 +433,8 @@ async def test_process_callback_button_confirm_all_reviewed(monkeypatch):
 
     state = MagicMock(spec=FSMContext)
     state.get_data = AsyncMock(return_value={
-        "index": 0,
-        "screams": [{"scream_id": 101, "content": "last scream"}]
+        "index": 0, "offset": 0, "total": 2,
+        "page": [{"scream_id": 101, "content": "last scream"}]
     })
     state.clear = AsyncMock()
     state.update_data = AsyncMock()
@@ -425,6 +443,10 @@ async def test_process_callback_button_confirm_all_reviewed(monkeypatch):
         "app_bot.handlers.adminHandler.confirm_scream",
         AsyncMock(return_value={"status": "confirmed"})
     )
+    monkeypatch.setattr(
+        "app_bot.handlers.adminHandler.get_moderation_page",
+        empty_queue()
+    )
 
     await process_callback_button_confirm(callback, state)
     callback.message.answer.assert_awaited_once_with("🎉 All screams reviewed.")
@@ -443,8 +465,8 @@ async def test_process_callback_button_confirm_failed(monkeypatch):
 
     state = MagicMock(spec=FSMContext)
     state.get_data = AsyncMock(return_value={
-        "index": 0,
-        "screams": [{"scream_id": 999, "content": "broken scream"}]
+        "index": 0, "offset": 0, "total": 2,
+        "page": [{"scream_id": 999, "content": "broken scream"}]
     })
     state.update_data = AsyncMock()
 
@@ -476,3 +498,228 @@ async def test_process_callback_button_confirm_exception(monkeypatch):
     await process_callback_button_confirm(callback, state)
     callback.answer.assert_awaited_once_with("❌ Confirmation failed")
     callback.message.edit_text.assert_not_awaited()
+
+
+def make_callback(user_id=7):
+    """Build a callback query whose message can be edited and answered."""
+    callback = MagicMock(spec=CallbackQuery)
+    callback.from_user = MagicMock()
+    callback.from_user.id = user_id
+    callback.message = MagicMock()
+    callback.message.edit_text = AsyncMock()
+    callback.message.answer = AsyncMock()
+    callback.answer = AsyncMock()
+    return callback
+
+
+def make_state(session):
+    """Build an FSM state mock holding a moderation session."""
+    state = MagicMock(spec=FSMContext)
+    state.get_data = AsyncMock(return_value=session)
+    state.update_data = AsyncMock()
+    state.clear = AsyncMock()
+    return state
+
+
+@pytest.mark.asyncio
+async def test_next_loads_following_page(monkeypatch):
+    """Should fetch the next page by keyset at the end of a page."""
+    callback = make_callback()
+    state = make_state({
+        "index": 1, "offset": 0, "total": 3,
+        "page": [{"scream_id": 1, "content": "a"},
+                 {"scream_id": 2, "content": "b"}]
+    })
+    fetch = AsyncMock(return_value={
+        "screams": [{"scream_id": 5, "content": "c"}], "total": 3
+    })
+    monkeypatch.setattr(
+        "app_bot.handlers.adminHandler.get_moderation_page", fetch
+    )
+
+    await process_callback_button_next(callback, state)
+
+    assert fetch.await_args.args[2] == 2
+    state.update_data.assert_awaited_once_with(
+        page=[{"scream_id": 5, "content": "c"}],
+        index=0, offset=2, total=3, to_confirm=[], to_delete=[]
+    )
+    assert "Scream 3 out of 3" in callback.message.edit_text.call_args.kwargs[
+        "text"]
+
+
+@pytest.mark.asyncio
+async def test_next_wraps_to_first_page(monkeypatch):
+    """Should start over from the first page after the last one."""
+    callback = make_callback()
+    state = make_state({
+        "index": 0, "offset": 10, "total": 11,
+        "page": [{"scream_id": 40, "content": "last"}]
+    })
+    first = {"screams": [{"scream_id": 3, "content": "first"}], "total": 11}
+    fetch = AsyncMock(side_effect=[{"screams": [], "total": 11}, first])
+    monkeypatch.setattr(
+        "app_bot.handlers.adminHandler.get_moderation_page", fetch
+    )
+
+    await process_callback_button_next(callback, state)
+
+    assert fetch.await_args.args[2] == 0
+    assert "Scream 1 out of 11" in callback.message.edit_text.call_args.kwargs[
+        "text"]
+
+
+@pytest.mark.asyncio
+async def test_back_at_first_scream():
+    """Should stay put on the very first scream of the queue."""
+    callback = make_callback()
+    state = make_state({
+        "index": 0, "offset": 0, "total": 2,
+        "page": [{"scream_id": 1, "content": "a"}]
+    })
+
+    await process_callback_button_back(callback, state)
+
+    callback.answer.assert_awaited_once_with("⏮ This is the first scream.")
+    callback.message.edit_text.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_back_loads_previous_page(monkeypatch):
+    """Should fetch the page before the current one by keyset."""
+    callback = make_callback()
+    state = make_state({
+        "index": 0, "offset": 2, "total": 3,
+        "page": [{"scream_id": 5, "content": "c"}]
+    })
+    fetch = AsyncMock(return_value={
+        "screams": [{"scream_id": 1, "content": "a"},
+                    {"scream_id": 2, "content": "b"}],
+        "total": 3
+    })
+    monkeypatch.setattr(
+        "app_bot.handlers.adminHandler.get_moderation_page", fetch
+    )
+
+    await process_callback_button_back(callback, state)
+
+    assert fetch.await_args.args[3] == 5
+    assert "Scream 2 out of 3" in callback.message.edit_text.call_args.kwargs[
+        "text"]
+
+
+@pytest.mark.asyncio
+async def test_review_keeps_page_position(monkeypatch):
+    """Should show the next scream of the page without fetching."""
+    callback = make_callback()
+    state = make_state({
+        "index": 0, "offset": 4, "total": 9,
+        "page": [{"scream_id": 8, "content": "x"},
+                 {"scream_id": 9, "content": "y"}]
+    })
+    fetch = AsyncMock()
+    monkeypatch.setattr(
+        "app_bot.handlers.adminHandler.get_moderation_page", fetch
+    )
+    monkeypatch.setattr(
+        "app_bot.handlers.adminHandler.confirm_scream",
+        AsyncMock(return_value={"status": "confirmed"})
+    )
+
+    await process_callback_button_confirm(callback, state)
+
+    fetch.assert_not_awaited()
+    state.update_data.assert_awaited_once_with(
+        page=[{"scream_id": 9, "content": "y"}],
+        index=0, offset=4, total=8
+    )
+
+
+@pytest.mark.asyncio
+async def test_multi_select_queues_decisions(monkeypatch):
+    """Should queue decisions in place without calling the API."""
+    callback = make_callback()
+    state = make_state({
+        "index": 0, "offset": 0, "total": 3, "batch": True,
+        "to_confirm": [], "to_delete": [],
+        "page": [{"scream_id": 1, "content": "a"},
+                 {"scream_id": 2, "content": "b"}]
+    })
+    delete = AsyncMock()
+    monkeypatch.setattr("app_bot.handlers.adminHandler.delete_scream", delete)
+
+    await process_callback_button_delete(callback, state)
+
+    delete.assert_not_awaited()
+    session = state.update_data.call_args.kwargs
+    assert session["to_delete"] == [1]
+    assert session["total"] == 2
+    text = callback.message.edit_text.call_args.kwargs["text"]
+    assert "1 queued" in text and "📌Scream_id: 2" in text
+
+
+@pytest.mark.asyncio
+async def test_multi_select_flushes_at_page_end(monkeypatch):
+    """Should send queued decisions in one request before the next page."""
+    callback = make_callback()
+    state = make_state({
+        "index": 0, "offset": 0, "total": 3, "batch": True,
+        "to_confirm": [1], "to_delete": [2],
+        "page": [{"scream_id": 3, "content": "c"}]
+    })
+    bulk = AsyncMock(return_value={"confirmed": [1, 3], "deleted": [2]})
+    monkeypatch.setattr(
+        "app_bot.handlers.adminHandler.moderate_screams", bulk
+    )
+    monkeypatch.setattr(
+        "app_bot.handlers.adminHandler.get_moderation_page", empty_queue()
+    )
+
+    await process_callback_button_confirm(callback, state)
+
+    bulk.assert_awaited_once_with("7", [1, 3], [2])
+    state.clear.assert_awaited_once()
+    callback.message.edit_text.assert_awaited_once_with(
+        "🎉 All screams reviewed.", reply_markup=None
+    )
+
+
+@pytest.mark.asyncio
+async def test_multi_select_toggle_off_flushes(monkeypatch):
+    """Should send queued decisions when leaving multi-select mode."""
+    callback = make_callback()
+    state = make_state({
+        "index": 0, "offset": 0, "total": 1, "batch": True,
+        "to_confirm": [4], "to_delete": [],
+        "page": [{"scream_id": 5, "content": "e"}]
+    })
+    bulk = AsyncMock(return_value={"confirmed": [4], "deleted": []})
+    monkeypatch.setattr(
+        "app_bot.handlers.adminHandler.moderate_screams", bulk
+    )
+
+    await process_callback_button_batch(callback, state)
+
+    bulk.assert_awaited_once_with("7", [4], [])
+    session = state.update_data.call_args.kwargs
+    assert session["batch"] is False and session["to_confirm"] == []
+
+
+@pytest.mark.asyncio
+async def test_multi_select_toggle_failure(monkeypatch):
+    """Should keep the session when queued decisions cannot be sent."""
+    callback = make_callback()
+    state = make_state({
+        "index": 0, "offset": 0, "total": 1, "batch": True,
+        "to_confirm": [4], "to_delete": [],
+        "page": [{"scream_id": 5, "content": "e"}]
+    })
+    monkeypatch.setattr(
+        "app_bot.handlers.adminHandler.moderate_screams",
+        AsyncMock(side_effect=Exception("down"))
+    )
+
+    await process_callback_button_batch(callback, state)
+
+    state.update_data.assert_not_awaited()
+    callback.answer.assert_awaited_once_with("❌ Multi-select failed")
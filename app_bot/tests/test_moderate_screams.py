@@ -0,0 +1,36 @@
+import pytest
+from unittest.mock import patch, MagicMock
+import httpx
+from app_bot.api.api import moderate_screams
+
+
+@pytest.mark.asyncio
+async def test_moderate_screams_success():
+    """Should send both ID lists in one request and return the result."""
+    mock_response = {"confirmed": [1, 2], "deleted": [3]}
+
+    with patch.object(
+        httpx.AsyncClient, "post",
+        return_value=MagicMock(status_code=200, json=lambda: mock_response)
+    ) as post:
+        result = await moderate_screams("admin_001", [1, 2], [3])
+
+        assert result == mock_response
+        assert post.call_args.kwargs["json"] == {
+            "user_id": "admin_001", "confirm": [1, 2], "delete": [3]
+        }
+
+
+@pytest.mark.asyncio
+async def test_moderate_screams_failure():
+    """Should raise HTTPStatusError on API failure."""
+    with patch.object(
+        httpx.AsyncClient, "post",
+        side_effect=httpx.HTTPStatusError(
+            "Forbidden",
+            request=MagicMock(),
+            response=MagicMock(status_code=403)
+        )
+    ):
+        with pytest.raises(httpx.HTTPStatusError):
+            await moderate_screams("admin_001", [1], [])
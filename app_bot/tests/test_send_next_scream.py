@@ -1,7 +1,13 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
-from app_bot.utils import send_next_scream
+from app_bot.utils import FeedBuffer, send_next_scream
+
+
+@pytest.fixture(autouse=True)
+def fresh_buffer(monkeypatch):
+    """Give every test an empty feed buffer."""
+    monkeypatch.setattr("app_bot.utils.feed_buffer", FeedBuffer())
 
 
 @pytest.mark.asyncio
@@ -10,8 +16,8 @@ async def test_send_next_scream_success(monkeypatch):
     scream = {"scream_id": 123, "content": "This is a test scream"}
 
     monkeypatch.setattr(
-        "app_bot.utils.get_next_scream",
-        AsyncMock(return_value=scream)
+        "app_bot.utils.get_feed_batch",
+        AsyncMock(return_value=[scream])
     )
 
     fake_keyboard = MagicMock()
@@ -36,7 +42,23 @@ async def test_send_next_scream_failure(monkeypatch):
     async def fail(*args, **kwargs):
         raise RuntimeError("Feed is empty")
 
-    monkeypatch.setattr("app_bot.utils.get_next_scream", fail)
+    monkeypatch.setattr("app_bot.utils.get_feed_batch", fail)
+
+    msg = MagicMock()
+    msg.edit_text = AsyncMock()
+    await send_next_scream("u1", msg)
+    msg.edit_text.assert_awaited_with(
+        "😴 <i>No more screams in the feed for now...</i>", parse_mode="HTML"
+    )
+
+
+@pytest.mark.asyncio
+async def test_send_next_scream_exhausted(monkeypatch):
+    """Test fallback message when the feed has no screams left."""
+    monkeypatch.setattr(
+        "app_bot.utils.get_feed_batch",
+        AsyncMock(return_value=[])
+    )
 
     msg = MagicMock()
     msg.edit_text = AsyncMock()
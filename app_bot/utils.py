@@ -1,12 +1,140 @@
+# Standard library
+import asyncio
+from collections import OrderedDict, deque
+
 # Third‑party
 from aiogram import types
 
 # Local application
-from app_bot.api.api import get_next_scream
+from app_bot.api.api import get_feed_batch
 from app_bot.keyboards.baseKeyboards import reaction_keyboard
 from app_bot.logger import logger
 
 
+FEED_BATCH_SIZE = 10  # pragma: no mutate
+FEED_LOW_WATERMARK = 3  # pragma: no mutate
+FEED_MAX_USERS = 1000  # pragma: no mutate
+
+
+class FeedBuffer:
+    """
+    Per-user in-memory buffer of prefetched feed screams.
+
+    Screams are fetched from the backend in batches and served from
+    memory. When a user's buffer drops below the low watermark, the next
+    batch is fetched in the background, so most feed steps do not wait
+    for the API. Only the most recently active users keep a buffer.
+
+    Attributes:
+        batch_size (int): Number of screams fetched per request.
+        low_watermark (int): Buffer size below which a refill starts.
+        max_users (int): Number of user buffers kept before the least
+            recently used one is dropped.
+    """
+
+    def __init__(self, batch_size: int = FEED_BATCH_SIZE,
+                 low_watermark: int = FEED_LOW_WATERMARK,
+                 max_users: int = FEED_MAX_USERS):
+        """
+        Create a buffer with no users.
+
+        Args:
+            batch_size (int): Number of screams fetched per request.
+            low_watermark (int): Buffer size below which a refill starts.
+            max_users (int): Number of user buffers kept.
+        """
+        self.batch_size = batch_size
+        self.low_watermark = low_watermark
+        self.max_users = max_users
+        self._buffers = OrderedDict()
+        self._refills = {}
+
+    def _buffer(self, user_id: str) -> deque:
+        """Return the user's buffer, evicting the least recently used."""
+        if user_id in self._buffers:
+            self._buffers.move_to_end(user_id)
+        else:
+            self._buffers[user_id] = deque()
+            if len(self._buffers) > self.max_users:
+                evicted, _ = self._buffers.popitem(last=False)
+                self._refills.pop(evicted, None)
+                logger.debug(f"Feed buffer of user {evicted} evicted")
+        return self._buffers[user_id]
+
+    async def _fetch(self, user_id: str, buffer: deque) -> list:
+        """Fetch the batch of screams following the buffered ones."""
+        after = buffer[-1]["scream_id"] if buffer else 0
+        return await get_feed_batch(user_id, self.batch_size, after)
+
+    @staticmethod
+    def _extend(buffer: deque, screams: list):
+        """
+        Append fetched screams to a buffer.
+
+        Screams not newer than the last buffered one are ignored, so a
+        refill racing with another fill never duplicates entries.
+        """
+        for scream in screams:
+            if not buffer or scream["scream_id"] > buffer[-1]["scream_id"]:
+                buffer.append(scream)
+
+    async def _refill(self, user_id: str, buffer: deque):
+        """
+        Refill a buffer in the background, logging failures.
+
+        The batch is dropped if the buffer was cleared or evicted
+        meanwhile, and the task only forgets itself, not a refill
+        started for the user's new buffer.
+        """
+        task = asyncio.current_task()
+        try:
+            screams = await self._fetch(user_id, buffer)
+            if self._buffers.get(user_id) is buffer:
+                self._extend(buffer, screams)
+        except Exception as e:
+            logger.warning(f"Feed refill failed for user {user_id}: {e}")
+        finally:
+            if self._refills.get(user_id) is task:
+                del self._refills[user_id]
+
+    async def next(self, user_id: str):
+        """
+        Pop the next scream of a user's feed.
+
+        Fetches synchronously only when the buffer is empty; otherwise
+        schedules a background refill once the buffer runs low.
+
+        Args:
+            user_id (str): The Telegram user's ID.
+
+        Returns:
+            Optional[dict]: Scream with `scream_id` and `content`,
+            or None if the feed is exhausted.
+
+        Raises:
+            httpx.HTTPError: If a synchronous fetch fails.
+        """
+        buffer = self._buffer(user_id)
+        if not buffer:
+            self._extend(buffer, await self._fetch(user_id, buffer))
+        if not buffer:
+            return None
+        scream = buffer.popleft()
+        if len(buffer) < self.low_watermark and user_id not in self._refills:
+            self._refills[user_id] = asyncio.create_task(
+                self._refill(user_id, buffer)
+            )
+        return scream
+
+    def clear(self, user_id: str):
+        """Drop a user's buffered screams and forget their refill."""
+        self._buffers.pop(user_id, None)
+        self._refills.pop(user_id, None)
+
+
+feed_buffer = FeedBuffer()
+
+
 async def send_next_scream(user_id: str, message: types.Message):
     """
     Edit a message to display the next unseen scream for the user.
@@ -17,7 +145,8 @@ async def send_next_scream(user_id: str, message: types.Message):
         The Telegram message to edit with the next scream content.
 
     Behavior:
-        - Retrieves the next unseen scream via the backend API.
+        - Takes the next unseen scream from the user's feed buffer,
+        which prefetches from the backend API.
         - Edits the given message to display the scream content
         with inline reaction buttons.
         - If no screams are available or an error occurs,
@@ -25,7 +154,9 @@ async def send_next_scream(user_id: str, message: types.Message):
     """
     try:
         logger.debug(f"Sending next scream for user {user_id}")
-        scream = await get_next_scream(user_id)
+        scream = await feed_buffer.next(user_id)
+        if scream is None:
+            raise LookupError("Feed is empty")
         caption = (
             f"😱 <b>New scream:</b>\n\n"
             f"🗯️ <i>{scream['content']}</i>"
@@ -1,34 +1,45 @@
 # Standard library
 import logging
-from datetime import timedelta
-from typing import List
 
 # Third‑party
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import distinct, func, select, update
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy import distinct, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
 
 # Local application
-from app_fastapi.initializers.engine import get_session
-from app_fastapi.middlewares.admin import admin_middleware
+from app_fastapi.initializers.engine import (
+    get_read_session,
+    get_read_session_factory,
+    get_session,
+)
+from app_fastapi.initializers.writer import GroupCommitWriter, get_writer
+from app_fastapi.middlewares.admin import admin_required
 from app_fastapi.models.admin import Admin
 from app_fastapi.models.archive import Archive
-from app_fastapi.models.reaction import Reaction
 from app_fastapi.models.scream import Scream
+from app_fastapi.models.emoji import Emoji
+from app_fastapi.models.user_stats import UserStats
 from app_fastapi.schemas.requests import (
     CreateAdminRequest,
     CreateScreamRequest,
     DeleteRequest,
     GetIdRequest,
+    ModerateRequest,
+    ModerationRequest,
     ReactionRequest,
     UserRequest,
 )
 from app_fastapi.schemas.responses import (
     ArchivedWeeksResponse,
+    CacheStatsResponse,
     CreateAdminResponse,
     CreateScreamResponse,
     DeleteResponse,
+    FeedBatchResponse,
     GetMyIdResponse,
+    ModerateResponse,
+    ModerationPageResponse,
     ReactionResponse,
     ScreamResponse,
     StressStatsResponse,
@@ -36,9 +47,35 @@ from app_fastapi.schemas.responses import (
     TopScreamsResponse,
     UserStatsResponse,
 )
+from app_fastapi.tools.admins import admin_registry
+from app_fastapi.tools.archive_top import archive_week
+from app_fastapi.tools.cache import response_cache
+from app_fastapi.tools.conditional import conditional_response, render
 from app_fastapi.tools.crypt import hash_user_id
-from app_fastapi.tools.meme import generate_meme_url
-from app_fastapi.tools.time import get_bounds, get_week_start
+from app_fastapi.tools.deletes import delete_screams
+from app_fastapi.tools.dialect import insert_ignore
+from app_fastapi.tools.feed import week_feed
+from app_fastapi.tools.meme import generate_meme_url, meme_flights
+from app_fastapi.tools.moderation import (
+    claim_batch,
+    count_available,
+    ensure_not_leased,
+    leased_to_others,
+)
+from app_fastapi.tools.rollups import daily_screams
+from app_fastapi.tools.serialization import FastJSONResponse
+from app_fastapi.tools.time import (
+    current_day_id,
+    current_week_id,
+    day_label,
+)
+from app_fastapi.tools.users import get_or_create_user_id, lookup_user_id
+from app_fastapi.tools.writes import (
+    insert_reaction,
+    insert_scream,
+    insert_skip,
+    set_meme_url,
+)
 
 
 router = APIRouter()
@@ -47,14 +84,19 @@ logger = logging.getLogger("app_fastapi")
 
 @router.post("/scream", response_model=CreateScreamResponse)
 async def create_scream(data: CreateScreamRequest,
-                        session: AsyncSession = Depends(get_session)):
+                        session: AsyncSession = Depends(get_session),
+                        writer: GroupCommitWriter = Depends(get_writer)):
     """
     Create a new scream for a user.
 
+    The insert is queued on the group commit writer and committed
+    together with other concurrent writes.
+
     Args:
         data (CreateScreamRequest):
         Request containing the user's external ID and scream content.
-        session (AsyncSession): Database session dependency.
+        session (AsyncSession): Session used to resolve the user ID.
+        writer (GroupCommitWriter): Group commit writer dependency.
 
     Returns:
         CreateScreamResponse: Status and generated scream ID on success.
@@ -64,13 +106,16 @@ async def create_scream(data: CreateScreamRequest,
     """
     try:
         logger.debug(f"Creating scream for user: {data.user_id[:5]}...")
-        user_hash = hash_user_id(data.user_id)
-        scream = Scream(content=data.content, user_hash=user_hash)
-        session.add(scream)
-        await session.commit()
+        user_id = await get_or_create_user_id(session,
+                                              hash_user_id(data.user_id))
+        scream_id = await writer.submit(
+            insert_scream(data.content, user_id)
+        )
+        week_feed.add_scream(scream_id, user_id, data.content)
+        response_cache.invalidate("screams")
 
-        logger.info(f"Scream created successfully. ID: {scream.id}")
-        return {"status": "ok", "scream_id": scream.id}
+        logger.info(f"Scream created successfully. ID: {scream_id}")
+        return {"status": "ok", "scream_id": scream_id}
     except Exception as e:
         logger.error(f"Failed to create scream: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -78,14 +123,20 @@ async def create_scream(data: CreateScreamRequest,
 
 @router.post("/react", response_model=ReactionResponse)
 async def react(data: ReactionRequest,
-                session: AsyncSession = Depends(get_session)):
+                session: AsyncSession = Depends(get_session),
+                writer: GroupCommitWriter = Depends(get_writer)):
     """
     Record a reaction to a specific scream by a user.
 
+    `Emoji.SKIP` (❌) records a feed skip instead of a reaction. The insert
+    is queued on the group commit writer and committed
+    together with other concurrent writes.
+
     Args:
         data (ReactionRequest):
         Request containing the scream ID, user's external ID, and emoji.
-        session (AsyncSession): Database session dependency.
+        session (AsyncSession): Session used to resolve the user ID.
+        writer (GroupCommitWriter): Group commit writer dependency.
 
     Returns:
         ReactionResponse: Status "ok" on success.
@@ -101,26 +152,16 @@ async def react(data: ReactionRequest,
                      f"for scream {data.scream_id} "
                      f"from user {data.user_id[:5]}...")
 
-        scream = await session.get(Scream, data.scream_id)
-        if not scream:
-            logger.warning(f"Scream not found: {data.scream_id}")
-            raise HTTPException(status_code=404, detail="Scream not found")
-
-        user_hash = hash_user_id(data.user_id)
-        exists = await session.scalar(
-            select(Reaction).where(
-                Reaction.scream_id == data.scream_id,
-                Reaction.user_hash == user_hash
-            )
-        )
-        if exists:
-            logger.warning(f"User already reacted to scream {data.scream_id}")
-            raise HTTPException(status_code=409, detail="Already reacted")
-        reaction = Reaction(emoji=data.emoji,
-                            scream_id=data.scream_id,
-                            user_hash=user_hash)
-        session.add(reaction)
-        await session.commit()
+        user_id = await get_or_create_user_id(session,
+                                              hash_user_id(data.user_id))
+        if data.emoji is Emoji.SKIP:
+            job = insert_skip(data.scream_id, user_id)
+        else:
+            job = insert_reaction(data.scream_id, data.emoji, user_id)
+        await writer.submit(job)
+        week_feed.mark_seen(user_id, data.scream_id)
+        if data.emoji is not Emoji.SKIP:
+            response_cache.invalidate("reactions")
         logger.info(f"Reaction {data.emoji} added to scream {data.scream_id}")
         return {"status": "ok"}
     except HTTPException:
@@ -131,15 +172,26 @@ async def react(data: ReactionRequest,
 
 
 @router.get("/top", response_model=TopScreamsResponse)
-async def get_top_screams(n: int = 3,
-                          session: AsyncSession = Depends(get_session)):
+async def get_top_screams(
+    request: Request,
+    n: int = 3,
+    read_sessions: sessionmaker = Depends(get_read_session_factory),
+    writer: GroupCommitWriter = Depends(get_writer)
+):
     """
     Retrieve the top N screams based on the number of positive reactions.
 
+    Ranking reads the maintained `Scream.votes` counter, so no reactions
+    are joined or grouped.
+
     Args:
+        request (Request): Incoming request, for `If-None-Match`.
         n (int, optional):
         The number of top screams to retrieve. Defaults to 3.
-        session (AsyncSession, optional): Database session dependency.
+        read_sessions (sessionmaker, optional):
+            Factory of read-only sessions used for the ranking query.
+        writer (GroupCommitWriter, optional):
+            Group commit writer persisting generated meme URLs.
 
     Returns:
         dict:
@@ -152,59 +204,69 @@ async def get_top_screams(n: int = 3,
         - This endpoint returns a JSON response.
         - Meme URLs are generated asynchronously
             Saved back into the database.
+        - Responses are cached per `n` and day until a scream or
+          reaction is written; concurrent requests share one
+          computation and each missing meme is generated once.
+        - Sends a strong ETag of the body and answers a matching
+          `If-None-Match` with 304.
     """
     try:
         logger.debug(f"Fetching top {n} screams")
-        today_start, tomorrow = get_bounds()
-
-        stmt = (
-            select(Scream, func.count(Reaction.id).label("votes"))
-            .join(Reaction, Scream.id == Reaction.scream_id)
-            .where(
-                Scream.timestamp >= today_start,
-                Scream.timestamp < tomorrow,
-                Reaction.emoji != "❌"
-                )
-            .group_by(Scream.id)
-            .order_by(func.count(Reaction.id).desc())
-            .limit(n)
-        )
 
-        result = await session.execute(stmt)
-        top_n = result.all()
-
-        if not top_n:
-            logger.info("No top screams found for today")
-            return {"posts": []}
-
-        posts = []
-        for scream, votes in top_n:
-            if not scream.meme_url:
-                try:
-                    meme_url = await generate_meme_url(scream.content)
-                    scream.meme_url = meme_url
-                    await session.execute(
-                        update(Scream)
-                        .where(Scream.id == scream.id)
-                        .values(meme_url=meme_url)
+        async def make_meme(scream):
+            """Generate a scream's meme and persist its URL."""
+            meme_url = await generate_meme_url(scream.content)
+            await writer.submit(set_meme_url(scream.id, meme_url))
+            logger.debug(f"Generated meme for scream {scream.id}")
+            return meme_url
+
+        async def load():
+            """Rank today's screams and attach their memes."""
+            stmt = (
+                select(Scream)
+                .where(
+                    Scream.day_id == current_day_id(),
+                    Scream.votes > 0
                     )
-                    await session.commit()
-                    logger.debug(f"Generated meme for scream {scream.id}")
-                except Exception as e:
-                    logger.warning(f"Failed to generate meme for scream "
-                                   f"{scream.id}: {str(e)}")
-                    continue
-            posts.append(
-                TopScreamItem(
-                    id=scream.id,
-                    content=scream.content,
-                    votes=votes,
-                    meme_url=scream.meme_url
-                )
+                .order_by(Scream.votes.desc(), Scream.id)
+                .limit(n)
             )
 
-        logger.info(f"Returned {len(posts)} top screams")
-        return {"posts": posts}
+            async with read_sessions() as read_session:
+                result = await read_session.execute(stmt)
+                top_n = result.scalars().all()
+
+            if not top_n:
+                logger.info("No top screams found for today")
+                return render(TopScreamsResponse, {"posts": []})
+
+            posts = []
+            for scream in top_n:
+                meme_url = scream.meme_url
+                if not meme_url:
+                    try:
+                        meme_url = await meme_flights.do(
+                            scream.id, lambda: make_meme(scream)
+                        )
+                    except Exception as e:
+                        logger.warning(f"Failed to generate meme for scream "
+                                       f"{scream.id}: {str(e)}")
+                        continue
+                posts.append(
+                    TopScreamItem(
+                        id=scream.id,
+                        content=scream.content,
+                        votes=scream.votes,
+                        meme_url=meme_url
+                    )
+                )
+
+            logger.info(f"Returned {len(posts)} top screams")
+            return render(TopScreamsResponse, {"posts": posts})
+
+        return conditional_response(request, await response_cache.cached(
+            ("top", n, current_day_id()), ("screams", "reactions"), load
+        ))
     except Exception as e:
         logger.error(f"Failed to get top screams: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -212,7 +274,7 @@ async def get_top_screams(n: int = 3,
 
 @router.get("/stats/{user_id}", response_model=UserStatsResponse)
 async def get_user_stats(user_id: str,
-                         session: AsyncSession = Depends(get_session)):
+                         session: AsyncSession = Depends(get_read_session)):
     """
     Get user stats.
 
@@ -220,10 +282,13 @@ async def get_user_stats(user_id: str,
     including post and reaction counts and activity charts.
 
     This function:
-    - Hashes the `user_id` to match internal database storage.
-    - Computes the number of posts made each day in the last 7 days.
+    - Resolves the hashed `user_id` to the internal user ID; unknown
+      users get empty stats.
+    - Reads the number of posts made each day in the last 7 days
+      from the `user_activity_daily` rollup.
     - Generates a QuickChart URL for a bar chart of daily posts.
-    - Computes total number of screams reactions given, and reactions received.
+    - Reads total screams, reactions given and reactions received, plus
+      the received emoji histogram, from the `user_stats` row of the user.
     - Generates a QuickChart URL for a pie chart of received reactions.
 
     Args:
@@ -244,70 +309,35 @@ async def get_user_stats(user_id: str,
                 pie chart showing distribution of reaction emojis.
     """
     import urllib.parse
-    from datetime import datetime, timezone, timedelta
 
-    user_hash = hash_user_id(user_id)
-    today = datetime.now(timezone.utc).replace(hour=0, minute=0,
-                                               second=0, microsecond=0)
-    week_ago = today - timedelta(days=6)
+    first_day = current_day_id() - 6
     try:
         logger.debug(f"Getting stats for user: {user_id[:5]}...")
-        user_hash = hash_user_id(user_id)
-        _, week_ago = get_bounds(days=6, addition=False)
+        internal_id = await lookup_user_id(session, hash_user_id(user_id))
 
         daily_counts = [0] * 7
-        stmt = (
-            select(Scream.timestamp)
-            .where(Scream.user_hash == user_hash, Scream.timestamp >= week_ago)
-        )
-        result = await session.execute(stmt)
-        timestamps = result.scalars().all()
-
-        for ts in timestamps:
-            ts = ts.astimezone(timezone.utc)
-            index = (ts.date() - week_ago.date()).days
-            if 0 <= index < 7:
-                daily_counts[index] += 1
-
-        labels = [(week_ago + timedelta(days=i)).strftime(
-            '%a'
-            ) for i in range(7)]
+        stats = None
+        if internal_id is not None:
+            daily_counts = await daily_screams(session, first_day,
+                                               user_id=internal_id)
+            stats = await session.get(UserStats, internal_id)
+
+        labels = [day_label(first_day + i) for i in range(7)]
         chart_url = urllib.parse.quote(
             f"https://quickchart.io/chart?c="
             f"{{type:'bar',data:{{labels:{labels},"
             f"datasets:[{{label:'Screams',data:{daily_counts}}}]}}}}",
             safe=':/?=&'
         )
-        total_posts = await session.scalar(
-            select(func.count(Scream.id)).where(Scream.user_hash == user_hash)
-        )
-        total_reactions_given = await session.scalar(
-            select(func.count(Reaction.id)).where(
-                Reaction.user_hash == user_hash,
-                Reaction.emoji != "❌"
-            )
-        )
-        total_reactions_got = await session.scalar(
-            select(func.count(Reaction.id))
-            .join(Scream, Scream.id == Reaction.scream_id)
-            .where(
-                Scream.user_hash == user_hash,
-                Reaction.emoji != "❌"
-            )
-        )
-        reaction_counts = await session.execute(
-            select(Reaction.emoji, func.count())
-            .join(Scream, Scream.id == Reaction.scream_id)
-            .where(
-                Scream.user_hash == user_hash,
-                Reaction.emoji != "❌"
-            )
-            .group_by(Reaction.emoji)
-        )
-        emoji_data = reaction_counts.all()
+        if stats is None:
+            stats = UserStats(user_id=internal_id, screams_posted=0,
+                              reactions_given=0, reactions_got=0,
+                              skull_got=0, fire_got=0, clown_got=0)
+
+        emoji_data = stats.histogram()
         if emoji_data:
-            labels = [emoji for emoji, _ in emoji_data]
-            values = [count for _, count in emoji_data]
+            labels = list(emoji_data)
+            values = list(emoji_data.values())
         else:
             labels = ["No reactions"]
             values = [1]
@@ -321,9 +351,9 @@ async def get_user_stats(user_id: str,
 
         logger.info(f"Successfully retrieved stats for user: {user_id[:5]}...")
         return {
-            "screams_posted": total_posts,
-            "reactions_given": total_reactions_given,
-            "reactions_got": total_reactions_got,
+            "screams_posted": stats.screams_posted,
+            "reactions_given": stats.reactions_given,
+            "reactions_got": stats.reactions_got,
             "chart_url": chart_url,
             "reaction_chart_url": reaction_chart_url
         }
@@ -334,7 +364,8 @@ async def get_user_stats(user_id: str,
 
 @router.get("/stress", response_model=StressStatsResponse)
 async def get_weekly_stress_graph_all(
-    session: AsyncSession = Depends(get_session)
+    request: Request,
+    read_sessions: sessionmaker = Depends(get_read_session_factory)
 ):
     """
     Generate a weekly stress graph showing the number of screams.
@@ -342,7 +373,9 @@ async def get_weekly_stress_graph_all(
     Uses quickchart.io API for graph generation.
 
     Args:
-        session (AsyncSession, optional): Database session dependency.
+        request (Request): Incoming request, for `If-None-Match`.
+        read_sessions (sessionmaker, optional): Factory of read-only
+            sessions.
 
     Returns:
         dict: A dictionary containing:
@@ -350,115 +383,129 @@ async def get_weekly_stress_graph_all(
             The daily scream counts over the past 7 days.
 
     Behavior:
-        - Counts all screams posted in the last 7 days (UTC time).
-        - Aggregates the daily totals.
+        - Reads the daily totals of the last 7 days (UTC time) from the
+          `activity_daily` rollup, at most 7 rows.
         - Creates a bar chart using QuickChart.io and returns the chart URL.
+        - Caches the URL per day until a scream is written or deleted.
+        - Answers a matching `If-None-Match` with 304.
     """
     import urllib.parse
-    from datetime import datetime, timezone, timedelta
 
-    today = datetime.now(timezone.utc).replace(hour=0, minute=0,
-                                               second=0, microsecond=0)
-    week_ago = today - timedelta(days=6)
+    first_day = current_day_id() - 6
+
+    async def load():
+        """Build the chart URL of the last 7 days."""
+        async with read_sessions() as session:
+            daily_counts = await daily_screams(session, first_day)
 
-    daily_counts = [0] * 7
-    stmt = select(Scream.timestamp).where(Scream.timestamp >= week_ago)
+        labels = [day_label(first_day + i) for i in range(7)]
 
-    result = await session.execute(stmt)
-    timestamps = result.scalars().all()
+        chart_url = urllib.parse.quote(f"https://quickchart.io/chart?c="
+                                       f"{{type:'bar',data:{{labels:"
+                                       f"{labels},datasets:[{{label:"
+                                       f"'Screams',data:{daily_counts}"
+                                       f"}}]}}}}",
+                                       safe=':/?=&')
+        return render(StressStatsResponse, {"chart_url": chart_url})
 
-    for ts in timestamps:
-        ts = ts.astimezone(timezone.utc)
-        index = (ts.date() - week_ago.date()).days
-        if 0 <= index < 7:
-            daily_counts[index] += 1
+    return conditional_response(request, await response_cache.cached(
+        ("stress", first_day), ("screams",), load
+    ))
 
-    labels = [(week_ago + timedelta(days=i)).strftime('%a') for i in range(7)]
 
-    chart_url = urllib.parse.quote(f"https://quickchart.io/chart?c="
-                                   f"{{type:'bar',data:{{labels:{labels},"
-                                   f"datasets:[{{label:'Screams',"
-                                   f"data:{daily_counts}}}]}}}}",
-                                   safe=':/?=&')
-    return {"chart_url": chart_url}
+@router.post("/cache/stats", response_model=CacheStatsResponse)
+async def get_cache_stats(
+    data: UserRequest = Depends(admin_required(UserRequest))
+):
+    """
+    Report the counters of the read response cache.
+
+    Args:
+        data (UserRequest): User ID of the requesting admin.
+
+    Behavior:
+        - Only accessible by admins (validated by `admin_required`).
+        - Returns hits, misses and evictions since startup and the
+          number of cached responses of this process.
+    """
+    return response_cache.stats()
 
 
 @router.post("/create_admin", response_model=CreateAdminResponse)
 async def create_admin(
-    data: CreateAdminRequest,
-    session: AsyncSession = Depends(get_session),
-    _: None = Depends(admin_middleware)
+    data: CreateAdminRequest = Depends(admin_required(CreateAdminRequest)),
+    session: AsyncSession = Depends(get_session)
 ):
     """
     Assign admin privileges to a specified user.
 
     This endpoint can only be accessed by an existing admin
-    (validated via middleware).
+    (validated by `admin_required`).
     If the specified user is already an admin, returns status "already_admin".
     Otherwise, adds the user to the admin table and returns status "ok".
 
     Args:
         data (CreateAdminRequest):
-        Contains the ID of the requester and ID of the user to be promoted.
+        Contains the ID of the requester and ID of the user to be promoted;
+        the requester is checked by `admin_required`.
         session (AsyncSession): Database session, injected via dependency.
-        _ (None): Result of admin_middleware; ensures the requester is admin.
 
     Returns:
         CreateAdminResponse:
         A response object with status "ok" or "already_admin".
     """
-    user_to_admin_hash = hash_user_id(data.user_id_to_admin)
+    user_hash = hash_user_id(data.user_id_to_admin)
+    user_to_admin_id = await get_or_create_user_id(session, user_hash)
 
-    result = await session.execute(select(Admin).where(
-        Admin.user_hash == user_to_admin_hash
-        ))
-    existing_admin = result.scalar_one_or_none()
-    if existing_admin:
+    created = await insert_ignore(session, Admin,
+                                  {"user_id": user_to_admin_id},
+                                  index_elements=["user_id"])
+    await session.commit()
+    admin_registry.add(user_hash)
+    if not created:
         logger.warning(f"User already admin: {data.user_id_to_admin[:5]}...")
         return {"status": "already_admin"}
 
-    admin = Admin(user_hash=user_to_admin_hash)
-    session.add(admin)
-    await session.commit()
     logger.info(f"Successfully created admin: {data.user_id_to_admin[:5]}...")
     return {"status": "ok"}
 
 
-@router.post("/delete", response_model=DeleteResponse,
-             dependencies=[Depends(admin_middleware)])
+@router.post("/delete", response_model=DeleteResponse)
 async def delete_scream(
-    data: DeleteRequest,
-    session: AsyncSession = Depends(get_session),
-    _: None = Depends(admin_middleware)
+    data: DeleteRequest = Depends(admin_required(DeleteRequest)),
+    session: AsyncSession = Depends(get_session)
 ):
     """
     Delete a scream by its ID.
 
     This endpoint can only be accessed by users with admin privileges,
-    which are verified by the `admin_middleware`. If the scream with the
-    specified ID does not exist, a 404 error is returned.
+    which are verified by `admin_required`. If the scream with the
+    specified ID does not exist, a 404 error is returned, and if another
+    admin holds an unexpired moderation lease on it, a 409. The scream is
+    deleted with set-based statements (`tools.deletes`); its reactions
+    and skips go with it through `ON DELETE CASCADE`.
 
     Args:
         data (DeleteRequest): Contains the ID of the scream to be deleted and
             the user ID of the requester.
         session (AsyncSession):
             Database session provided via dependency injection.
-        _ (None): Result of admin_middleware; ensures the requester is admin.
 
     Returns:
         DeleteResponse: A response object with status "deleted".
     """
     try:
         logger.info(f"Deleting scream: {data.scream_id}")
+        admin_id = await lookup_user_id(session, hash_user_id(data.user_id))
+        await ensure_not_leased(session, admin_id, data.scream_id)
 
-        scream = await session.get(Scream, data.scream_id)
-
-        if not scream:
+        if not await delete_screams(session, [data.scream_id]):
             logger.warning(f"Scream not found: {data.scream_id}")
             raise HTTPException(status_code=404, detail="Scream not found")
 
-        await session.delete(scream)
         await session.commit()
+        week_feed.remove_scream(data.scream_id)
+        response_cache.invalidate("screams")
 
         logger.info(f"Successfully deleted scream: {data.scream_id}")
         return {"status": "deleted"}
@@ -500,9 +547,56 @@ async def get_my_id(data: GetIdRequest):
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+# Largest batch a client may prefetch from the feed.
+MAX_FEED_BATCH = 50
+
+
+@router.get("/feed/{user_id}/batch", response_model=FeedBatchResponse)
+async def get_feed_batch(
+    user_id: str,
+    limit: int = Query(10, ge=1, le=MAX_FEED_BATCH),
+    after: int = Query(0, ge=0),
+    session: AsyncSession = Depends(get_read_session)
+):
+    """
+    Retrieve the next unseen screams of a user's feed in one request.
+
+    Lets clients prefetch the feed instead of asking for one scream per
+    step. The batch does not mark screams as seen; they are marked when
+    the user reacts or skips.
+
+    Args:
+        user_id (str): The external user ID.
+        limit (int): Maximum number of screams, at most `MAX_FEED_BATCH`.
+        after (int): Scream ID the client has already buffered up to;
+            only unseen screams after it are returned.
+        session (AsyncSession, optional): Database session dependency.
+
+    Returns:
+        FeedBatchResponse: Up to `limit` screams, possibly none, encoded
+        directly from the rows without re-validation.
+    """
+    try:
+        logger.debug(f"Getting {limit} feed screams for user: "
+                     f"{user_id[:5]}...")
+        internal_id = await lookup_user_id(session, hash_user_id(user_id))
+        screams = [
+            {"scream_id": scream_id, "content": content}
+            for scream_id, content in await week_feed.next_screams(
+                session, internal_id, limit, after
+            )
+        ]
+        logger.info(f"Returned {len(screams)} feed screams for user: "
+                    f"{user_id[:5]}...")
+        return FastJSONResponse({"screams": screams})
+    except Exception as e:
+        logger.error(f"Failed to get feed batch: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
 @router.get("/feed/{user_id}", response_model=ScreamResponse)
 async def get_next_scream(user_id: str,
-                          session: AsyncSession = Depends(get_session)):
+                          session: AsyncSession = Depends(get_read_session)):
     """
     Retrieve user feed.
 
@@ -519,42 +613,28 @@ async def get_next_scream(user_id: str,
             - content (str): The content of the scream.
 
     Behavior:
-        - Hashes the `user_id` to compare against stored data.
-        - Retrieves the next scream
-        from this week that the user has not reacted to.
+        - Resolves the hashed `user_id` to the internal user ID.
+        - Takes the first scream of this week the user has not seen from
+        the in-memory week snapshot; reactions and skips mark screams
+        as seen.
         - Excludes the user's own screams.
     """
-    from app_fastapi.models.scream import Scream
-    from app_fastapi.models.reaction import Reaction
-
     try:
         logger.debug(f"Getting next scream for user: {user_id[:5]}...")
-        user_hash = hash_user_id(user_id)
-
-        stmt = (
-            select(Scream)
-            .outerjoin(Reaction, (Reaction.scream_id == Scream.id) &
-                       (Reaction.user_hash == user_hash))
-            .where(
-                Scream.user_hash != user_hash,
-                Reaction.id.is_(None),
-                Scream.timestamp >= get_week_start()
-            )
-            .order_by(Scream.timestamp.asc())
-            .limit(1)
-        )
+        # Unknown users have no screams or reactions to exclude.
+        internal_id = await lookup_user_id(session, hash_user_id(user_id))
 
-        result = await session.execute(stmt)
-        scream = result.scalar_one_or_none()
+        screams = await week_feed.next_screams(session, internal_id)
 
-        if not scream:
+        if not screams:
             logger.info(f"No more screams for user: {user_id[:5]}...")
             raise HTTPException(status_code=404, detail="No more screams")
 
-        logger.info(f"Returned scream {scream.id} for user: {user_id[:5]}...")
+        scream_id, content = screams[0]
+        logger.info(f"Returned scream {scream_id} for user: {user_id[:5]}...")
         return {
-            "scream_id": scream.id,
-            "content": scream.content
+            "scream_id": scream_id,
+            "content": content
         }
 
     except HTTPException:
@@ -564,52 +644,51 @@ async def get_next_scream(user_id: str,
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-@router.post("/screams/admin", response_model=List[ScreamResponse],
-             dependencies=[Depends(admin_middleware)])
+@router.post("/screams/admin", response_model=ModerationPageResponse)
 async def get_screams_admin(
-    data: UserRequest,
-    session: AsyncSession = Depends(get_session),
-    _: None = Depends(admin_middleware)
+    data: ModerationRequest = Depends(admin_required(ModerationRequest)),
+    session: AsyncSession = Depends(get_session)
 ):
     """
-    Retrieve all unmoderated screams for admin review.
+    Claim and return the admin's next batch of unmoderated screams.
 
     Args:
-        data (UserRequest): Request data containing the admin's user ID.
+        data (ModerationRequest): Admin's user ID and the page cursor.
         session (AsyncSession): Database session dependency.
-        _ (None): Middleware dependency ensuring the user is an admin.
 
     Behavior:
-        - Fetches all screams from the current week
-        that haven't been moderated.
-        - Returns a list of scream IDs and content.
+        - Counts the unmoderated screams of the current week not leased
+        to other admins and returns 404 if there are none.
+        - Leases up to `limit` of them after `after_id`, or right before
+        `before_id` if set, to the admin for `LEASE_SECONDS`, releasing
+        the admin's previous batch, and returns them in ID order.
+        Concurrent admins thus get disjoint batches, and a batch whose
+        lease lapses returns to the pool. Pages are index range scans on
+        `ix_screams_moderated_week_id_id`.
+        - Encodes the rows directly, skipping `response_model`
+        validation.
     """
     try:
         logger.info(f"Getting screams for admin: {data.user_id[:5]}...")
-        stmt = (
-            select(Scream)
-            .where(
-                Scream.timestamp >= get_week_start(),
-                Scream.moderated.is_(False)
-            )
-            .order_by(Scream.timestamp.asc())
-        )
-
-        result = await session.execute(stmt)
-        screams = result.scalars().all()
-
-        if not screams:
+        admin_id = await lookup_user_id(session, hash_user_id(data.user_id))
+        week_id = current_week_id()
+        total = await count_available(session, admin_id, week_id)
+        if not total:
             logger.info("No unmoderated screams found")
             raise HTTPException(status_code=404, detail="No screams found")
 
-        logger.info(f"Returned {len(screams)} screams for admin")
-        return [
-            {
-                "scream_id": scream.id,
-                "content": scream.content
-            }
-            for scream in screams
-        ]
+        rows = await claim_batch(session, admin_id, week_id, data.limit,
+                                 data.after_id, data.before_id)
+        await session.commit()
+
+        logger.info(f"Returned {len(rows)} of {total} screams for admin")
+        return FastJSONResponse({
+            "screams": [
+                {"scream_id": scream_id, "content": content}
+                for scream_id, content in rows
+            ],
+            "total": total,
+        })
     except HTTPException:
         raise
     except Exception as e:
@@ -618,11 +697,10 @@ async def get_screams_admin(
         raise HTTPException(status_code=500, detail="Internal server error!")
 
 
-@router.post("/confirm", dependencies=[Depends(admin_middleware)])
+@router.post("/confirm")
 async def confirm_scream(
-    data: DeleteRequest,
-    session: AsyncSession = Depends(get_session),
-    _: None = Depends(admin_middleware)
+    data: DeleteRequest = Depends(admin_required(DeleteRequest)),
+    session: AsyncSession = Depends(get_session)
 ):
     """
     Confirm a scream as reviewed.
@@ -630,14 +708,18 @@ async def confirm_scream(
     Args:
         data (DeleteRequest): Contains the scream ID to confirm.
         session (AsyncSession): Database session dependency.
-        _ (None): Middleware dependency ensuring the user is an admin.
 
     Behavior:
-        - Marks the scream as moderated in the database.
+        - Returns 409 if another admin holds an unexpired moderation
+        lease on the scream.
+        - Marks the scream as moderated in the database and releases
+        its lease.
         - Returns a confirmation status.
     """
     try:
         logger.info(f"Confirming scream: {data.scream_id}")
+        admin_id = await lookup_user_id(session, hash_user_id(data.user_id))
+        await ensure_not_leased(session, admin_id, data.scream_id)
         scream = await session.get(Scream, data.scream_id)
 
         if not scream:
@@ -645,6 +727,7 @@ async def confirm_scream(
             raise HTTPException(status_code=404, detail="Scream not found")
 
         scream.moderated = True
+        scream.claimed_by = scream.lease_expires = None
         await session.commit()
         logger.info(f"Successfully confirmed scream: {data.scream_id}")
         return {"status": "confirmed"}
@@ -655,28 +738,103 @@ async def confirm_scream(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+@router.post("/moderate", response_model=ModerateResponse)
+async def moderate_screams(
+    data: ModerateRequest = Depends(admin_required(ModerateRequest)),
+    session: AsyncSession = Depends(get_session)
+):
+    """
+    Confirm and delete many screams in one transaction.
+
+    Lets the admin bot flush a batch of moderation decisions with one
+    request, one admin check and one commit instead of a round trip
+    per scream.
+
+    Args:
+        data (ModerateRequest): IDs to confirm and IDs to delete.
+        session (AsyncSession): Database session dependency.
+
+    Behavior:
+        - Marks the screams to confirm as moderated and releases their
+          leases with one UPDATE.
+        - Deletes the screams to delete with the same set-based
+          statements as `/delete`.
+        - Ignores IDs that no longer exist and skips IDs another admin
+          holds an unexpired moderation lease on.
+
+    Returns:
+        ModerateResponse: IDs actually confirmed and deleted.
+    """
+    try:
+        logger.info(f"Moderating {len(data.confirm)} confirmed and "
+                    f"{len(data.delete)} deleted screams")
+        admin_id = await lookup_user_id(session, hash_user_id(data.user_id))
+        leased = await leased_to_others(session, admin_id,
+                                        data.confirm + data.delete)
+        if leased:
+            logger.warning(f"Skipping {len(leased)} screams leased to "
+                           f"other admins")
+        to_confirm = [i for i in data.confirm if i not in leased]
+        confirmed = []
+        if to_confirm:
+            result = await session.execute(
+                update(Scream)
+                .where(Scream.id.in_(to_confirm))
+                .values(moderated=True, claimed_by=None, lease_expires=None)
+                .returning(Scream.id)
+            )
+            confirmed = sorted(result.scalars().all())
+
+        deleted = await delete_screams(
+            session, [i for i in data.delete if i not in leased]
+        )
+        await session.commit()
+
+        for scream_id in deleted:
+            week_feed.remove_scream(scream_id)
+        if deleted:
+            response_cache.invalidate("screams")
+
+        logger.info(f"Confirmed {len(confirmed)} and deleted "
+                    f"{len(deleted)} screams")
+        return {"confirmed": confirmed, "deleted": deleted}
+    except Exception as e:
+        logger.error(f"Failed to moderate screams: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
 @router.get("/history", response_model=ArchivedWeeksResponse)
-async def get_history(session: AsyncSession = Depends(get_session)):
+async def get_history(
+    request: Request,
+    read_sessions: sessionmaker = Depends(get_read_session_factory)
+):
     """
     Retrieve all archived week identifiers.
 
     Args:
-        session (AsyncSession): Database session dependency.
+        request (Request): Incoming request, for `If-None-Match`.
+        read_sessions (sessionmaker): Factory of read-only sessions.
 
     Behavior:
         - Queries the database for distinct archived week IDs.
         - Returns them in descending order.
+        - Caches the list until a week is archived.
+        - Answers a matching `If-None-Match` with 304.
     """
-    try:
+    async def load():
+        """Read the archived week IDs."""
         stmt = select(distinct(Archive.week_id)).order_by(
             Archive.week_id.desc()
             )
-        result = await session.execute(stmt)
-        weeks = result.scalars().all()
+        async with read_sessions() as session:
+            result = await session.execute(stmt)
+            weeks = result.scalars().all()
+        return render(ArchivedWeeksResponse, {"weeks": weeks})
 
-        return {
-            "weeks": weeks
-        }
+    try:
+        return conditional_response(request, await response_cache.cached(
+            ("history",), ("archives",), load
+        ))
     except HTTPException:
         raise
     except Exception as e:
@@ -685,44 +843,61 @@ async def get_history(session: AsyncSession = Depends(get_session)):
 
 
 @router.get("/history/{week_id}", response_model=TopScreamsResponse)
-async def get_historical_week(week_id: str,
-                              session: AsyncSession = Depends(get_session)):
+async def get_historical_week(
+    request: Request,
+    week_id: int,
+    read_sessions: sessionmaker = Depends(get_read_session_factory)
+):
     """
     Retrieve archived screams for a specific week.
 
     Args:
-        week_id (str): The week identifier to retrieve data for.
-        session (AsyncSession): Database session dependency.
+        request (Request): Incoming request, for `If-None-Match`.
+        week_id (int): The week identifier to retrieve data for.
+        read_sessions (sessionmaker): Factory of read-only sessions.
 
     Behavior:
-        - Fetches archived screams for the given week ID.
+        - Reads the week's snapshot rows in place order from the
+          (week_id, place) index, without joining screams.
         - Returns scream content, vote count, and meme URL.
+        - Answers a matching `If-None-Match` with 304.
     """
     try:
         logger.info(f"Getting historical week: {week_id}")
-        stmt = select(Archive).where(Archive.week_id == week_id).order_by(
-            Archive.votes.desc()
-            )
-        result = await session.execute(stmt)
-        archives = result.scalars().all()
-
-        if not archives:
-            logger.warning(f"Archive not found for week: {week_id}")
-            raise HTTPException(status_code=404,
-                                detail="Week not found in archive")
-
-        posts = [
-            TopScreamItem(
-                id=arc.scream_id,
-                content=arc.content,
-                votes=arc.votes,
-                meme_url=arc.meme_url
+
+        async def load():
+            """Read the week's snapshot rows."""
+            stmt = (
+                select(Archive.scream_id, Archive.content, Archive.votes,
+                       Archive.meme_url)
+                .where(Archive.week_id == week_id)
+                .order_by(Archive.place)
             )
-            for arc in archives
-        ]
+            async with read_sessions() as session:
+                result = await session.execute(stmt)
+                archives = result.all()
+
+            if not archives:
+                logger.warning(f"Archive not found for week: {week_id}")
+                raise HTTPException(status_code=404,
+                                    detail="Week not found in archive")
+
+            posts = [
+                TopScreamItem(
+                    id=arc.scream_id,
+                    content=arc.content,
+                    votes=arc.votes,
+                    meme_url=arc.meme_url
+                )
+                for arc in archives
+            ]
+
+            logger.info(f"Returned {len(posts)} screams for week {week_id}")
+            return render(TopScreamsResponse, {"posts": posts})
 
-        logger.info(f"Returned {len(posts)} screams for week {week_id}")
-        return {"posts": posts}
+        return conditional_response(request, await response_cache.cached(
+            ("history", week_id), ("archives",), load
+        ))
     except HTTPException:
         raise
     except Exception as e:
@@ -730,64 +905,39 @@ async def get_historical_week(week_id: str,
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-@router.post("/history/{week_id}", dependencies=[Depends(admin_middleware)])
+@router.post("/history/{week_id}")
 async def archive_current_week(
-    week_id: str,
-    session: AsyncSession = Depends(get_session),
-    _: None = Depends(admin_middleware)
+    week_id: int,
+    data: UserRequest = Depends(admin_required(UserRequest)),
+    session: AsyncSession = Depends(get_session)
 ):
     """
     Archive the top screams of the current week under a given ID.
 
     Args:
-        week_id (str): The archive label (e.g., "2025-W18").
+        week_id (int): The archive identifier (e.g., 202518).
+        data (UserRequest): User ID of the requesting admin.
         session (AsyncSession): Database session dependency.
-        _ (None): Middleware dependency ensuring the user is an admin.
 
     Behavior:
         - Validates the archive does not already exist.
-        - Calculates top-voted screams of the current week.
-        - Stores them in the archive table.
+        - Snapshots the top-voted screams of the current week into the
+          archive table in one bulk insert.
     """
     try:
         logger.info(f"Archiving week as {week_id}")
-        existing = await session.scalar(select(Archive).where(
+        existing = await session.scalar(select(Archive.id).where(
             Archive.week_id == week_id).limit(1)
             )
         if existing:
             logger.warning(f"Week {week_id} already archived")
             raise HTTPException(status_code=409, detail="Week already exists")
 
-        week_start = get_week_start()
-        week_end = week_start + timedelta(days=7)
-
-        stmt = (
-            select(Scream, func.count(Reaction.id).label("votes"))
-            .join(Reaction, Scream.id == Reaction.scream_id)
-            .where(
-                Scream.timestamp >= week_start,
-                Scream.timestamp < week_end,
-                Reaction.emoji != "❌"
-            )
-            .group_by(Scream.id)
-            .order_by(func.count(Reaction.id).desc())
-        )
-
-        result = await session.execute(stmt)
-        top_screams = result.all()
-
-        for scream, votes in top_screams:
-            archive = Archive(
-                week_id=week_id,
-                scream_id=scream.id,
-                content=scream.content,
-                meme_url=scream.meme_url,
-                votes=votes
-            )
-            session.add(archive)
+        count = await archive_week(session, week_id, current_week_id())
         await session.commit()
-        logger.info(f"Week {week_id} archived with {len(top_screams)} screams")
-        return {"status": "archived", "count": len(top_screams)}
+        response_cache.invalidate("archives")
+        logger.info(f"Week {week_id} archived with {count} screams")
+        return {"status": "archived", "count": count}
     except HTTPException:
         raise
     except Exception as e:
@@ -0,0 +1,168 @@
+"""
+Benchmark of response encoding before and after `FastJSONResponse`.
+
+Reproduces the table of the README section "JSON serialization and
+compression". Run from the repository root with:
+
+    python -m app_fastapi.benchmarks.serialization
+"""
+
+# Standard library
+import gzip
+import random
+import timeit
+
+# Third‑party
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+# Local application
+from app_fastapi.schemas.responses import (
+    FeedBatchResponse,
+    ModerationPageResponse,
+)
+from app_fastapi.tools.serialization import FastJSONResponse
+
+
+WORDS = ("deadline", "exam", "lab", "report", "sleep", "coffee", "again",
+         "why", "professor", "quiz", "tomorrow", "project", "bug", "help",
+         "😱", "😭", "🔥", "крик", "сессия", "дедлайн")
+
+
+def _text(rng: random.Random) -> str:
+    """Return a scream-like text of 10 to 30 random words."""
+    return " ".join(rng.choices(WORDS, k=rng.randint(10, 30)))
+
+
+def admin_page(rows: int = 50, seed: int = 0) -> dict:
+    """
+    Build a `/screams/admin` payload.
+
+    Args:
+        rows (int): Screams on the page.
+        seed (int): Seed of the generated texts.
+
+    Returns:
+        dict: Payload as the endpoint builds it.
+    """
+    rng = random.Random(seed)
+    return {
+        "screams": [{"scream_id": i, "content": _text(rng)}
+                    for i in range(1, rows + 1)],
+        "total": rows,
+    }
+
+
+def archived_week(rows: int = 100, seed: int = 0) -> dict:
+    """
+    Build a `/history/{week_id}` payload.
+
+    Args:
+        rows (int): Archived screams of the week.
+        seed (int): Seed of the generated texts.
+
+    Returns:
+        dict: Payload as the endpoint builds it.
+    """
+    rng = random.Random(seed)
+    return {
+        "posts": [{"id": i, "content": _text(rng), "votes": rng.randint(0, 99),
+                   "meme_url": f"https://i.imgflip.com/{i:06}.jpg"}
+                  for i in range(1, rows + 1)],
+    }
+
+
+def encode_before(model, payload: dict) -> bytes:
+    """
+    Encode a payload the way FastAPI's default path did.
+
+    Validates it against the response model, converts it with
+    `jsonable_encoder` and renders it with the stdlib-based
+    `JSONResponse`.
+    """
+    content = jsonable_encoder(model.model_validate(payload))
+    return JSONResponse(content).body
+
+
+def encode_after(payload: dict) -> bytes:
+    """Encode a trusted payload directly with `FastJSONResponse`."""
+    return FastJSONResponse(payload).body
+
+
+def best_of(statement, number: int, repeat: int) -> float:
+    """
+    Time a callable.
+
+    Args:
+        statement (Callable[[], Any]): Code to time.
+        number (int): Calls per measurement.
+        repeat (int): Measurements taken.
+
+    Returns:
+        float: Fastest measurement in microseconds per call.
+    """
+    runs = timeit.repeat(statement, number=number, repeat=repeat)
+    return min(runs) / number * 1e6
+
+
+def timings(number: int = 2000, repeat: int = 5) -> list:
+    """
+    Measure encoding times of the endpoints returning trusted rows.
+
+    Args:
+        number (int): Calls per measurement.
+        repeat (int): Measurements taken, the fastest is kept.
+
+    Returns:
+        list: (payload, before µs, after µs) tuples.
+    """
+    payloads = [
+        ("/screams/admin, 50 screams", ModerationPageResponse,
+         admin_page()),
+        ("/feed/{user_id}/batch, 10 screams", FeedBatchResponse,
+         {"screams": admin_page(10)["screams"]}),
+    ]
+    results = []
+    for name, model, payload in payloads:
+        assert encode_before(model, payload) == encode_after(payload)
+        results.append((
+            name,
+            best_of(lambda: encode_before(model, payload), number, repeat),
+            best_of(lambda: encode_after(payload), number, repeat),
+        ))
+    return results
+
+
+def sizes() -> list:
+    """
+    Measure plain and gzipped sizes of the largest list responses.
+
+    Returns:
+        list: (payload, bytes, gzipped bytes) tuples.
+    """
+    payloads = [
+        ("/screams/admin, 50 screams", admin_page()),
+        ("/history/{week_id}, 100 screams", archived_week()),
+    ]
+    results = []
+    for name, payload in payloads:
+        body = encode_after(payload)
+        results.append((name, len(body), len(gzip.compress(body))))
+    return results
+
+
+def main():
+    """Print both measurements as Markdown tables."""
+    print("| Payload | Before | After |")
+    print("|---|---|---|")
+    for name, before, after in timings():
+        print(f"| `{name}` | {before:.0f} µs | {after:.0f} µs |")
+    print()
+    print("| Payload | Size | Gzipped |")
+    print("|---|---|---|")
+    for name, size, packed in sizes():
+        print(f"| `{name}` | {size / 1024:.1f} KB | {packed / 1024:.1f} KB |")
+
+
+if __name__ == "__main__":
+    main()
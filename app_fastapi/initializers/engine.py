@@ -4,18 +4,182 @@ from os import getenv
 from typing import AsyncGenerator
 
 # Third‑party
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 logger = logging.getLogger("app_fastapi")
 
+SQLITE_PROFILES = {
+    "safe": {
+        "journal_mode": "DELETE",
+        "synchronous": "FULL",
+        "foreign_keys": "ON",
+        "busy_timeout": 5000,
+    },
+    "performance": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 268435456,
+        "cache_size": -65536,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+        "foreign_keys": "ON",
+    },
+}
+
 db_url = getenv("DB_FILENAME") if getenv("DB_FILENAME") else ":memory:"
+db_profile = getenv("DB_PROFILE", "performance")
+db_echo = getenv("DB_ECHO", "false").lower() in ("1", "true", "yes")
+db_read_pool_size = int(getenv("DB_READ_POOL_SIZE", "10"))
+db_pool_size = int(getenv("DB_POOL_SIZE", "10"))
+db_max_overflow = int(getenv("DB_MAX_OVERFLOW", "20"))
+db_pool_pre_ping = getenv("DB_POOL_PRE_PING", "true").lower() in (
+    "1", "true", "yes"
+)
+
+
+def normalize_database_url(url: str) -> str:
+    """
+    Force the asyncpg driver onto a PostgreSQL connection URL.
+
+    Args:
+        url (str): URL such as `postgres://...` or `postgresql://...`.
+
+    Returns:
+        str: URL using the `postgresql+asyncpg` dialect.
+    """
+    for prefix in ("postgres://", "postgresql://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    return url
+
+
+databaseUrl = normalize_database_url(
+    getenv("DATABASE_URL") or "sqlite+aiosqlite:///" + db_url
+)
+is_sqlite = databaseUrl.startswith("sqlite")
+
+
+def get_sqlite_pragmas(profile: str) -> dict:
+    """
+    Return the PRAGMA settings of a named SQLite performance profile.
+
+    Args:
+        profile (str): Profile name, one of `SQLITE_PROFILES`.
+
+    Returns:
+        dict: Mapping of PRAGMA name to value.
+
+    Raises:
+        ValueError: If the profile is unknown.
+    """
+    if profile not in SQLITE_PROFILES:
+        raise ValueError(f"Unknown DB_PROFILE: {profile}")
+    return SQLITE_PROFILES[profile]
+
+
+def apply_sqlite_profile(async_engine, profile: str, read_only=False):
+    """
+    Apply a SQLite performance profile to every new engine connection.
+
+    WAL journaling lets readers proceed while a writer holds the lock,
+    `synchronous=NORMAL` drops the per-commit fsync of the WAL, and the
+    cache/mmap settings keep hot pages in memory.
+
+    Args:
+        async_engine (AsyncEngine): Engine to configure.
+        profile (str): Profile name, one of `SQLITE_PROFILES`.
+        read_only (bool): If True, leaves the journal mode to the writer
+            and rejects any write with `query_only`.
+    """
+    pragmas = dict(get_sqlite_pragmas(profile))
+    if read_only:
+        pragmas.pop("journal_mode", None)
+        pragmas["query_only"] = "ON"
+
+    @event.listens_for(async_engine.sync_engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Execute the profile PRAGMA statements on a new connection."""
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+    logger.info(f"SQLite profile applied: {profile}")
+
+
+def create_read_engine(filename: str, pool_size: int = db_read_pool_size):
+    """
+    Create a read-only engine with its own connection pool.
+
+    The database file is opened through a `mode=ro` URI, so read-heavy
+    endpoints get dedicated connections that never take the write lock.
+
+    Args:
+        filename (str): SQLite database file name.
+        pool_size (int): Number of pooled reader connections.
+
+    Returns:
+        AsyncEngine: Engine for read-only sessions.
+    """
+    read_engine = create_async_engine(
+        f"sqlite+aiosqlite:///file:{filename}?mode=ro&uri=true",
+        echo=db_echo,
+        pool_size=pool_size,
+        max_overflow=pool_size,
+    )
+    apply_sqlite_profile(read_engine, db_profile, read_only=True)
+    return read_engine
+
+
+def create_postgres_engine(url: str, pool_size: int = db_pool_size,
+                           read_only=False):
+    """
+    Create a pooled asyncpg engine for a PostgreSQL database.
+
+    Args:
+        url (str): PostgreSQL connection URL.
+        pool_size (int): Number of persistent pooled connections.
+        read_only (bool): If True, every transaction is opened read-only.
+
+    Returns:
+        AsyncEngine: Configured PostgreSQL engine.
+    """
+    connect_args = {}
+    if read_only:
+        connect_args["server_settings"] = {
+            "default_transaction_read_only": "on"
+        }
+    return create_async_engine(
+        normalize_database_url(url),
+        echo=db_echo,
+        pool_size=pool_size,
+        max_overflow=db_max_overflow,
+        pool_pre_ping=db_pool_pre_ping,
+        connect_args=connect_args,
+    )
 
-databaseUrl = "sqlite+aiosqlite:///" + db_url
 
-engine = create_async_engine(databaseUrl, echo=True)
+if is_sqlite:
+    engine = create_async_engine(databaseUrl, echo=db_echo)
+    apply_sqlite_profile(engine, db_profile)
+    # An in-memory database exists only inside the writer's connection,
+    # so readers have to share it.
+    read_engine = (engine if db_url == ":memory:"
+                   else create_read_engine(db_url))
+else:
+    engine = create_postgres_engine(databaseUrl)
+    read_engine = create_postgres_engine(
+        getenv("DATABASE_READ_URL") or databaseUrl,
+        pool_size=db_read_pool_size,
+        read_only=True,
+    )
+
 asyncSession = sessionmaker(bind=engine, expire_on_commit=False,
                             class_=AsyncSession)
+asyncReadSession = sessionmaker(bind=read_engine, expire_on_commit=False,
+                                class_=AsyncSession)
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
@@ -44,3 +208,38 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
     except Exception as e:
         logger.error(f"Database session error: {str(e)}", exc_info=True)
         raise
+
+
+async def get_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Provide a read-only database session for GET endpoints.
+
+    Yields:
+        AsyncSession:
+            An asynchronous SQLAlchemy session bound to the read-only pool.
+
+    Raises:
+        Exception: Re-raises any exception encountered while
+        instantiating or closing the session.
+    """
+    try:
+        async with asyncReadSession() as session:
+            logger.debug("Read-only database session created")
+            yield session
+    except Exception as e:
+        logger.error(f"Read session error: {str(e)}", exc_info=True)
+        raise
+
+
+def get_read_session_factory() -> sessionmaker:
+    """
+    Provide the read-only session factory for dependency injection.
+
+    Cached endpoints compute responses in tasks shared by concurrent
+    requests and refreshed in the background, which must not use a
+    session bound to one request.
+
+    Returns:
+        sessionmaker: Factory of sessions bound to the read-only pool.
+    """
+    return asyncReadSession
@@ -1,24 +1,451 @@
 # Standard library
 import logging
 
+# Third‑party
+from sqlalchemy import (
+    Integer,
+    MetaData,
+    Table,
+    case,
+    cast,
+    delete,
+    func,
+    insert,
+    inspect,
+    select,
+    text,
+)
+from sqlalchemy.schema import CreateColumn
+
 # Local application
 from app_fastapi.initializers.engine import engine
-from app_fastapi.models import Base
+from app_fastapi.models import Base, Reaction, Skip
+from app_fastapi.models.emoji import SYMBOLS, Emoji
+from app_fastapi.tools.archive_top import backfill_archives_statement
+from app_fastapi.tools.counters import rebuild_counters_statement
+from app_fastapi.tools.feed import rebuild_feed_progress_statement
+from app_fastapi.tools.rollups import rebuild_rollups
+from app_fastapi.tools.sql import epoch_now
+from app_fastapi.tools.user_stats import rebuild_user_stats
 
 logger = logging.getLogger("app_fastapi")
 
 
+def missing_tables(sync_conn) -> set:
+    """
+    Return the names of model tables that do not exist yet.
+
+    Args:
+        sync_conn (Connection): Synchronous connection provided by
+            `AsyncConnection.run_sync`.
+
+    Returns:
+        set: Table names that `create_all` is about to create.
+    """
+    inspector = inspect(sync_conn)
+    return {table.name for table in Base.metadata.sorted_tables
+            if not inspector.has_table(table.name)}
+
+
+def _epoch_from_datetime(column):
+    """Convert a legacy DATETIME column to epoch seconds."""
+    return func.coalesce(cast(func.strftime("%s", column), Integer),
+                         epoch_now())
+
+
+def _emoji_code(column):
+    """Convert a legacy emoji character column to `Emoji` codes."""
+    return case({symbol: int(emoji) for emoji, symbol in SYMBOLS.items()},
+                value=column)
+
+
+# Columns stored as integers whose older versions stored text, with the
+# expression converting the old values. Values converting to NULL, e.g.
+# emojis outside the registry, abort the migration before any rebuild.
+_CONVERTED_COLUMNS = {
+    "timestamp": _epoch_from_datetime,
+    "emoji": _emoji_code,
+}
+
+
+def _is_converted(name: str, column_type) -> bool:
+    """Tell whether a reflected column still holds pre-integer values."""
+    return name in _CONVERTED_COLUMNS \
+        and not isinstance(column_type, Integer)
+
+
+def _changed_foreign_keys(table, foreign_keys: list) -> bool:
+    """
+    Tell whether reflected foreign keys use another ON DELETE action.
+
+    Args:
+        table (Table): Model table.
+        foreign_keys (list): Foreign keys reported by the inspector.
+
+    Returns:
+        bool: True if any declared ON DELETE action differs.
+    """
+    reflected = {
+        fk["constrained_columns"][0]:
+            (fk.get("options") or {}).get("ondelete") or ""
+        for fk in foreign_keys
+    }
+    return any(
+        fk.parent.name in reflected
+        and reflected[fk.parent.name].upper() != (fk.ondelete or "").upper()
+        for fk in table.foreign_keys
+    )
+
+
+def _needs_rebuild(table, columns: dict, foreign_keys: list) -> bool:
+    """
+    Tell whether a table's database copy predates the current schema.
+
+    Legacy tables store `user_hash` instead of `user_id`, text in
+    `_CONVERTED_COLUMNS` (DATETIME timestamps, emoji characters), lack
+    generated columns, or declare other ON DELETE actions; SQLite cannot
+    change the last two with `ALTER TABLE`.
+
+    Args:
+        table (Table): Model table.
+        columns (dict): Reflected column name to type.
+        foreign_keys (list): Reflected foreign keys.
+
+    Returns:
+        bool: True if the table has to be rebuilt.
+    """
+    if "user_id" in table.c and "user_id" not in columns \
+            and "user_hash" in columns:
+        return True
+    if _changed_foreign_keys(table, foreign_keys):
+        return True
+    if any(column.computed is not None and column.name not in columns
+           for column in table.columns):
+        return True
+    return any(name in table.c and _is_converted(name, column_type)
+               for name, column_type in columns.items())
+
+
+def _legacy_tables(sync_conn) -> list:
+    """
+    Return model tables whose database copy needs a rebuild.
+
+    Args:
+        sync_conn (Connection): Synchronous database connection.
+
+    Returns:
+        list: Model tables in dependency order.
+    """
+    inspector = inspect(sync_conn)
+    tables = []
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        columns = {c["name"]: c["type"]
+                   for c in inspector.get_columns(table.name)}
+        foreign_keys = inspector.get_foreign_keys(table.name)
+        if _needs_rebuild(table, columns, foreign_keys):
+            tables.append(table)
+    return tables
+
+
+def _unconvertible_values(sync_conn, table) -> dict:
+    """
+    Count legacy values of a table that `_CONVERTED_COLUMNS` cannot map.
+
+    Args:
+        sync_conn (Connection): Synchronous database connection.
+        table (Table): Model table with the target schema.
+
+    Returns:
+        dict: "table.column=value" to number of rows holding it.
+    """
+    old = Table(table.name, MetaData(), autoload_with=sync_conn)
+    found = {}
+    for column in old.columns:
+        if column.name not in table.c \
+                or not _is_converted(column.name, column.type):
+            continue
+        converted = _CONVERTED_COLUMNS[column.name](column)
+        rows = sync_conn.execute(
+            select(column, func.count()).where(converted.is_(None))
+            .group_by(column)
+        )
+        for value, count in rows:
+            found[f"{table.name}.{column.name}={value!r}"] = count
+    return found
+
+
+def _check_convertible(sync_conn, tables: list):
+    """
+    Refuse to rebuild tables holding values the new schema cannot store.
+
+    Args:
+        sync_conn (Connection): Synchronous database connection.
+        tables (list): Model tables about to be rebuilt.
+
+    Raises:
+        ValueError: Listing every unconvertible value and its row count.
+    """
+    found = {}
+    for table in tables:
+        found.update(_unconvertible_values(sync_conn, table))
+    if found:
+        details = ", ".join(f"{value} ({count} rows)"
+                            for value, count in found.items())
+        logger.error(f"Legacy rows hold unconvertible values: {details}")
+        raise ValueError(
+            f"Legacy migration aborted, no conversion for: {details}. "
+            f"Update or delete these rows and restart."
+        )
+
+
+def _source_columns(table, old, users):
+    """
+    Map each stored column of the new table to an expression on the old.
+
+    Args:
+        table (Table): Model table with the target schema.
+        old (Table): Reflected legacy table.
+        users (Table): The users table.
+
+    Returns:
+        tuple: (column names, select expressions, whether `users` is
+        used).
+    """
+    names, exprs, uses_users = [], [], False
+    for column in table.columns:
+        if column.computed is not None:
+            continue
+        if column.name == "user_id" and "user_id" not in old.c:
+            expr, uses_users = users.c.id, True
+        elif column.name not in old.c:
+            continue
+        elif _is_converted(column.name, old.c[column.name].type):
+            expr = _CONVERTED_COLUMNS[column.name](old.c[column.name])
+        else:
+            expr = old.c[column.name]
+        names.append(column.name)
+        exprs.append(expr)
+    return names, exprs, uses_users
+
+
+def _rebuild_table(sync_conn, table, temp_metadata):
+    """
+    Recreate a legacy table with the current schema, keeping its rows.
+
+    Follows SQLite's table rebuild procedure: create the new table under
+    a temporary name, copy the rows (resolving user hashes through
+    `users` and converting `_CONVERTED_COLUMNS`), drop the old table and
+    rename the new one.
+
+    Args:
+        sync_conn (Connection): Synchronous database connection.
+        table (Table): Model table with the target schema.
+        temp_metadata (MetaData): Metadata holding the temporary copies.
+    """
+    users = Base.metadata.tables["users"]
+    old = Table(table.name, MetaData(), autoload_with=sync_conn)
+
+    if "user_hash" in old.c and table is not users:
+        sync_conn.execute(
+            insert(users).prefix_with("OR IGNORE").from_select(
+                ["user_hash"],
+                select(old.c.user_hash).where(old.c.user_hash.isnot(None))
+                .distinct()
+            )
+        )
+    for index in inspect(sync_conn).get_indexes(table.name):
+        sync_conn.execute(text(f'DROP INDEX "{index["name"]}"'))
+
+    new = table.to_metadata(temp_metadata, name=f"_new_{table.name}")
+    new.create(sync_conn)
+    names, exprs, uses_users = _source_columns(table, old, users)
+    source = select(*exprs).select_from(old)
+    if uses_users:
+        source = source.join(users, old.c.user_hash == users.c.user_hash)
+    sync_conn.execute(insert(new).from_select(names, source))
+    old.drop(sync_conn)
+    sync_conn.execute(text(f"ALTER TABLE {new.name} RENAME TO {table.name}"))
+    logger.info(f"Table {table.name} rebuilt with the current schema")
+
+
+def rebuild_legacy_tables(sync_conn) -> list:
+    """
+    Rebuild tables created by older versions of the schema.
+
+    Moves stored user hashes to `users.id` references, DATETIME
+    timestamps to epoch integers with generated day/week columns, and
+    emoji characters to `Emoji` codes.
+    Must run on a connection without an open transaction, because
+    foreign keys are switched off while tables are rebuilt; otherwise
+    dropping a parent table would cascade into its children.
+
+    Args:
+        sync_conn (Connection): Synchronous connection provided by
+            `AsyncConnection.run_sync`.
+
+    Returns:
+        list: Names of the rebuilt tables.
+
+    Raises:
+        NotImplementedError: If legacy tables exist on a non-SQLite database.
+        ValueError: If legacy rows hold values that cannot be converted,
+            e.g. emojis outside the registry; nothing is changed then.
+    """
+    tables = _legacy_tables(sync_conn)
+    if not tables:
+        return []
+    if sync_conn.dialect.name != "sqlite":
+        raise NotImplementedError(
+            "Automatic legacy table migration is only implemented for SQLite"
+        )
+    _check_convertible(sync_conn, tables)
+
+    sync_conn.execute(text("PRAGMA foreign_keys=OFF"))
+    temp_metadata = MetaData()
+    for table in Base.metadata.sorted_tables:
+        table.to_metadata(temp_metadata)
+    for table in tables:
+        _rebuild_table(sync_conn, table, temp_metadata)
+    sync_conn.commit()
+    sync_conn.execute(text("PRAGMA foreign_keys=ON"))
+    return [table.name for table in tables]
+
+
+async def move_skip_reactions(conn) -> int:
+    """
+    Move ❌ rows stored as reactions into the skips table.
+
+    Older versions recorded feed skips as reactions. The rows are copied
+    and deleted with Core statements, so no counter events fire; the
+    caller rebuilds counters afterwards.
+
+    Args:
+        conn (AsyncConnection): Database connection in a transaction.
+
+    Returns:
+        int: Number of moved skips.
+    """
+    skipped = Reaction.emoji == Emoji.SKIP
+    await conn.execute(
+        insert(Skip).from_select(
+            ["user_id", "scream_id"],
+            select(Reaction.user_id, Reaction.scream_id).where(skipped)
+        )
+    )
+    result = await conn.execute(delete(Reaction).where(skipped))
+    logger.info(f"Moved {result.rowcount} skips out of reactions")
+    return result.rowcount
+
+
+def add_missing_columns(sync_conn) -> list:
+    """
+    Add columns declared on the models that existing tables lack.
+
+    Like indexes, new columns are only created with a fresh table. Each
+    missing column is added with `ALTER TABLE ... ADD COLUMN`, so it must
+    be nullable or carry a server default.
+
+    Args:
+        sync_conn (Connection): Synchronous connection provided by
+            `AsyncConnection.run_sync`.
+
+    Returns:
+        list: Added columns as "table.column" strings.
+    """
+    inspector = inspect(sync_conn)
+    added = []
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {c["name"] for c in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            spec = CreateColumn(column).compile(dialect=sync_conn.dialect)
+            sync_conn.execute(
+                text(f"ALTER TABLE {table.name} ADD COLUMN {spec}")
+            )
+            added.append(f"{table.name}.{column.name}")
+            logger.info(f"Column added: {table.name}.{column.name}")
+    return added
+
+
+def create_missing_indexes(sync_conn):
+    """
+    Create every index declared on the models that is not yet present.
+
+    `Base.metadata.create_all` only emits indexes together with a freshly
+    created table, so databases created before an index was declared never
+    receive it. This function fills that gap for existing tables.
+
+    Args:
+        sync_conn (Connection): Synchronous connection provided by
+            `AsyncConnection.run_sync`.
+    """
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(sync_conn, checkfirst=True)
+            logger.debug(f"Index ensured: {index.name}")
+
+
+async def migrate_legacy_tables() -> list:
+    """
+    Rebuild legacy tables outside of a transaction.
+
+    The rebuild toggles `PRAGMA foreign_keys`, which SQLite ignores inside
+    a transaction, so it runs on a plain connection and commits itself.
+
+    Returns:
+        list: Names of the rebuilt tables.
+    """
+    async with engine.connect() as conn:
+        return await conn.run_sync(rebuild_legacy_tables)
+
+
+async def backfill(conn, created: list, migrated: list, added: list):
+    """
+    Fill derived data that tables or columns new to this database lack.
+
+    Args:
+        conn (AsyncConnection): Database connection in a transaction.
+        created (list): Names of the tables created by this startup.
+        migrated (list): Names of the rebuilt legacy tables.
+        added (list): Added columns as "table.column" strings.
+    """
+    moved = "skips" in created and await move_skip_reactions(conn)
+    if "screams.votes" in added or "screams" in migrated or moved:
+        await conn.execute(rebuild_counters_statement())
+    if "archives.content" in added or "archives" in migrated:
+        await conn.execute(backfill_archives_statement())
+    if "user_feed_progress" in created:
+        await conn.execute(rebuild_feed_progress_statement())
+    if "activity_daily" in created:
+        await rebuild_rollups(conn)
+    if "user_stats" in created:
+        await rebuild_user_stats(conn)
+
+
 async def init_db():
     """
     Initialize the database.
 
-    Creating all tables defined in the SQLAlchemy models.
+    Creating all tables and indexes defined in the SQLAlchemy models.
 
     This function:
       - Logs the start of the initialization process.
       - Opens an asynchronous connection to the database engine.
       - Executes the `Base.metadata.create_all` method within transaction
         to create any missing tables based on the model definitions.
+      - Rebuilds legacy tables storing user hashes or DATETIME
+        timestamps, so they reference `users.id` and store epoch seconds.
+      - Adds columns and indexes missing on already existing tables.
+      - Moves ❌ reactions of older versions into the skips table.
+      - Fills newly added scream reaction counters from the reactions.
+      - Copies scream snapshots into archive rows written before them.
+      - Backfills newly created feed cursor, activity rollup and user
+        stats tables.
       - Logs success or failure of the operation.
       - Propagates any exceptions encountered during setup.
 
@@ -28,7 +455,13 @@ async def init_db():
     try:
         logger.info("Initializing database")
         async with engine.begin() as conn:
+            created = await conn.run_sync(missing_tables)
             await conn.run_sync(Base.metadata.create_all)
+        migrated = await migrate_legacy_tables()
+        async with engine.begin() as conn:
+            added = await conn.run_sync(add_missing_columns)
+            await conn.run_sync(create_missing_indexes)
+            await backfill(conn, created, migrated, added)
         logger.info("Database initialized successfully")
     except Exception as e:
         logger.error(f"Database initialization failed: {str(e)}",
@@ -0,0 +1,229 @@
+# Standard library
+import asyncio
+import logging
+from os import getenv
+from typing import Any, Awaitable, Callable
+
+# Third‑party
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Local application
+from app_fastapi.initializers.engine import asyncSession
+
+
+logger = logging.getLogger("app_fastapi")
+
+WriteJob = Callable[[AsyncSession], Awaitable[Any]]
+
+
+class GroupCommitWriter:
+    """
+    Single writer task that commits queued insert jobs in groups.
+
+    Endpoints submit jobs (coroutines taking a session) and await their
+    result. The writer collects jobs for up to `max_delay` seconds or
+    `max_batch` items, runs them in one transaction and commits once,
+    so a burst of inserts costs one lock acquisition and one fsync.
+
+    A job reports a per-request outcome (e.g. HTTPException for a
+    missing scream) by raising before it touches the session; such
+    errors are delivered to that caller only. A database error aborts
+    the group, which is then retried job by job so one bad row cannot
+    fail its neighbours.
+
+    Attributes:
+        max_batch (int): Maximum number of jobs per transaction.
+        max_delay (float): Seconds to wait for more jobs after the first.
+    """
+
+    def __init__(self, session_factory, max_batch=64, max_delay=0.005):
+        """
+        Create a writer bound to a session factory.
+
+        Args:
+            session_factory (sessionmaker): Factory for write sessions.
+            max_batch (int): Maximum number of jobs per transaction.
+            max_delay (float): Seconds to wait for more jobs.
+        """
+        self.session_factory = session_factory
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._queue = None
+        self._task = None
+        self._loop = None
+
+    async def submit(self, job: WriteJob):
+        """
+        Queue a write job and wait for its result.
+
+        Args:
+            job (WriteJob): Coroutine function receiving the shared session.
+
+        Returns:
+            Any: The value returned by the job once its group committed.
+
+        Raises:
+            Exception: Whatever the job raised, or the database error that
+            prevented its commit.
+        """
+        self._ensure_running()
+        future = self._loop.create_future()
+        await self._queue.put((job, future))
+        return await future
+
+    async def stop(self):
+        """Let queued jobs finish, then stop the writer task."""
+        if self._task is None or self._task.done():
+            return
+        if self._loop is not asyncio.get_running_loop():
+            self._task = None
+            return
+        await self._queue.join()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        logger.info("Group commit writer stopped")
+
+    def _ensure_running(self):
+        """Start the writer task on the current event loop if needed."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._task and not self._task.done():
+            return
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._task = loop.create_task(self._run())
+        logger.info("Group commit writer started")
+
+    async def _run(self):
+        """Collect queued jobs into groups and commit them forever."""
+        while True:
+            batch = await self._collect()
+            try:
+                await self._commit_group(batch)
+            except Exception as e:
+                logger.error(f"Group commit failed: {str(e)}", exc_info=True)
+                for _, future in batch:
+                    _resolve(future, None, e)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _collect(self):
+        """
+        Wait for a job, then gather more until the batch is full or late.
+
+        Returns:
+            list: (job, future) pairs forming the next group.
+        """
+        batch = [await self._queue.get()]
+        deadline = self._loop.time() + self.max_delay
+        while len(batch) < self.max_batch:
+            timeout = deadline - self._loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(
+                    await asyncio.wait_for(self._queue.get(), timeout)
+                )
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _commit_group(self, batch):
+        """
+        Run a group of jobs in one transaction and resolve their futures.
+
+        Args:
+            batch (list): (job, future) pairs.
+        """
+        outcomes = []
+        try:
+            async with self.session_factory() as session:
+                for job, _ in batch:
+                    outcomes.append(await self._run_job(job, session))
+                await session.commit()
+        except SQLAlchemyError as e:
+            logger.warning(f"Group of {len(batch)} writes failed, "
+                           f"retrying one by one: {str(e)}")
+            for item in batch:
+                await self._commit_single(item)
+            return
+
+        logger.debug(f"Committed {len(batch)} writes in one transaction")
+        for (_, future), (result, error) in zip(batch, outcomes):
+            _resolve(future, result, error)
+
+    async def _commit_single(self, item):
+        """
+        Run one job in its own transaction after a failed group.
+
+        Args:
+            item (tuple): (job, future) pair.
+        """
+        job, future = item
+        try:
+            async with self.session_factory() as session:
+                result, error = await self._run_job(job, session)
+                await session.commit()
+        except SQLAlchemyError as e:
+            result, error = None, e
+        _resolve(future, result, error)
+
+    @staticmethod
+    async def _run_job(job, session):
+        """
+        Run a job, separating caller errors from database errors.
+
+        Args:
+            job (WriteJob): Job to run.
+            session (AsyncSession): Session of the current group.
+
+        Returns:
+            tuple: (result, error) where error is a caller-level exception.
+
+        Raises:
+            SQLAlchemyError: If the shared transaction became unusable.
+        """
+        try:
+            return await job(session), None
+        except SQLAlchemyError:
+            raise
+        except Exception as e:
+            return None, e
+
+
+def _resolve(future, result, error):
+    """
+    Deliver a job outcome to its waiting caller.
+
+    Args:
+        future (asyncio.Future): Future awaited by the caller.
+        result (Any): Job result.
+        error (Exception | None): Error to raise in the caller instead.
+    """
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+writer = GroupCommitWriter(
+    asyncSession,
+    max_batch=int(getenv("WRITE_BATCH_SIZE", "64")),
+    max_delay=int(getenv("WRITE_BATCH_DELAY_MS", "5")) / 1000,
+)
+
+
+def get_writer() -> GroupCommitWriter:
+    """
+    Provide the application writer for dependency injection.
+
+    Returns:
+        GroupCommitWriter: The process-wide group commit writer.
+    """
+    return writer
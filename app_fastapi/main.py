@@ -7,16 +7,25 @@ import os
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from dotenv import load_dotenv
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
 import uvicorn
 
 # Local application
 from app_fastapi.api import endpoints
 from app_fastapi.initializers.engine import get_session
 from app_fastapi.initializers.migration import init_db
+from app_fastapi.initializers.writer import writer
 from app_fastapi.models.admin import Admin
+from app_fastapi.tools.admins import admin_registry
 from app_fastapi.tools.archive_top import archive_top_job
 from app_fastapi.tools.crypt import hash_user_id
-from sqlalchemy import select
+from app_fastapi.tools.dialect import insert_ignore
+from app_fastapi.tools.serialization import (
+    GZIP_MINIMUM_SIZE,
+    FastJSONResponse,
+)
+from app_fastapi.tools.user_stats import rebuild_user_stats_job
+from app_fastapi.tools.users import get_or_create_user_id
 
 
 logger = logging.getLogger("app_fastapi")
@@ -30,7 +39,9 @@ app = FastAPI(
         "Anonymous student scream platform with memes, "
         "reactions, analytics & moderation"
     ),
+    default_response_class=FastJSONResponse,
 )
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE)
 
 
 @app.on_event("startup")
@@ -47,6 +58,9 @@ async def startup():
     - Checks if an admin with the corresponding user
       hash already exists in the database.
     - If no admin exist, a new default admin is added to the database.
+    - Loads the admin registry, so admin checks need no queries.
+    - Starts the scheduler running the weekly archive and the nightly
+      user stats rebuild; it is stopped on application shutdown.
     """
     try:
         logger.info("Starting application initialization")
@@ -54,21 +68,23 @@ async def startup():
         logger.info("Database initialized successfully")
 
         async for session in get_session():
+            await admin_registry.load(session)
             user_id = os.getenv("DEFAULT_ADMIN_ID")
             if not user_id:
                 logger.warning("DEFAULT_ADMIN_ID not found in .env")
                 return
 
-            user_hash = hash_user_id(user_id)
             logger.debug(f"Checking admin for user: {user_id[:5]}...")
+            user_hash = hash_user_id(user_id)
+            internal_id = await get_or_create_user_id(session, user_hash)
 
-            result = await session.execute(select(Admin).where(
-                Admin.user_hash == user_hash))
-            admin_exists = result.scalar_one_or_none()
+            created = await insert_ignore(session, Admin,
+                                          {"user_id": internal_id},
+                                          index_elements=["user_id"])
+            await session.commit()
+            admin_registry.add(user_hash)
 
-            if admin_exists is None:
-                session.add(Admin(user_hash=user_hash))
-                await session.commit()
+            if created:
                 logger.info(f"Default admin {user_id[:5]}... was added")
             else:
                 logger.info(f"Admin {user_id[:5]}... already exists")
@@ -81,15 +97,36 @@ async def startup():
             minute=59,
             timezone='UTC'
         )
+        scheduler.add_job(
+            rebuild_user_stats_job,
+            'cron',
+            hour=3,
+            minute=0,
+            timezone='UTC'
+        )
         scheduler.start()
+        app.state.scheduler = scheduler
         logger.info("Scheduler started")
         logger.info("Application startup completed successfully")
     except Exception as e:
         logger.critical(f"Application startup failed: {str(e)}", exc_info=True)
-        raise
-    finally:
         if 'scheduler' in locals() and scheduler.running:
             scheduler.shutdown()
+        raise
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    """
+    Application shutdown event handler.
+
+    Stops the scheduler and flushes writes still queued on the group
+    commit writer before the process exits.
+    """
+    scheduler = getattr(app.state, "scheduler", None)
+    if scheduler is not None and scheduler.running:
+        scheduler.shutdown()
+    await writer.stop()
 
 app.include_router(endpoints.router)
 
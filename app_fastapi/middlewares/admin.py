@@ -1,68 +1,67 @@
 # Standard library
-import json
 import logging
 
 # Third‑party
-from fastapi import Depends, HTTPException, Request
-from sqlalchemy import select
+from fastapi import Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
 # Local application
 from app_fastapi.initializers.engine import get_session
-from app_fastapi.models.admin import Admin
+from app_fastapi.tools.admins import admin_registry
 from app_fastapi.tools.crypt import hash_user_id
 
 
 logger = logging.getLogger("app_fastapi")
 
 
-async def admin_middleware(request: Request,
-                           session: AsyncSession = Depends(get_session),):
+def admin_required(model):
     """
-    Check if the requesting user is an admin.
+    Build a dependency that validates an admin request body.
 
-    Parses the request body to extract `user_id`, hashes it, and verifies
-    its presence in the Admin table. Raises 403 if the user is not an admin.
-    Also restores the request body for reuse after reading.
+    The returned dependency takes the endpoint's request model as its
+    body, so FastAPI parses and validates the body once, and checks the
+    model's `user_id` against the in-memory admin registry. Endpoints
+    declare it in place of their body parameter and receive the
+    validated model from it.
 
     Args:
-        request (Request): Incoming HTTP request.
-        session (AsyncSession): Async DB session.
+        model (Type[BaseModel]): Request model with a `user_id` field.
 
-    Raises:
-        HTTPException: 400 for invalid JSON, 403 for unauthorized access.
+    Returns:
+        Callable: Dependency returning the validated request model.
     """
-    try:
-        body_bytes = await request.body()
-        json_data = json.loads(body_bytes)
-
-        user_id = json_data.get("user_id")
-        if not user_id:
-            logger.warning("Missing user_id in request")
-            raise HTTPException(status_code=400, detail="Missing user_id")
-
-        logger.debug(f"Checking admin rights for user: {user_id}...")
-
-        user_hash = hash_user_id(user_id)
-
-        result = await session.execute(select(Admin).where(
-            Admin.user_hash == user_hash)
-            )
-        admin = result.scalar_one_or_none()
-
-        if admin is None:
-            logger.warning(f"Unauthorized admin access "
-                           f"attempt by user: {user_id}...")
-            raise HTTPException(status_code=403,
-                                detail="Unauthorized: not an admin")
-
-        logger.debug(f"Admin access granted for user: {user_id}...")
-
-        async def receive():
-            return {"type": "http.request", "body": body_bytes}
-        request._receive = receive
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Admin middleware error: {str(e)}", exc_info=True)
-        raise HTTPException(status_code=500, detail="Internal server error")
+    async def admin_guard(data: model,
+                          session: AsyncSession = Depends(get_session)):
+        """
+        Check if the requesting user is an admin.
+
+        Args:
+            data (BaseModel): Validated request body.
+            session (AsyncSession): Session used only when the registry
+                has to be reloaded.
+
+        Returns:
+            BaseModel: The request body.
+
+        Raises:
+            HTTPException: 403 for unauthorized access.
+        """
+        try:
+            logger.debug(f"Checking admin rights for user: "
+                         f"{data.user_id[:5]}...")
+            if not await admin_registry.is_admin(session,
+                                                 hash_user_id(data.user_id)):
+                logger.warning(f"Unauthorized admin access "
+                               f"attempt by user: {data.user_id[:5]}...")
+                raise HTTPException(status_code=403,
+                                    detail="Unauthorized: not an admin")
+            logger.debug(f"Admin access granted for user: "
+                         f"{data.user_id[:5]}...")
+            return data
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Admin middleware error: {str(e)}", exc_info=True)
+            raise HTTPException(status_code=500,
+                                detail="Internal server error")
+    return admin_guard
@@ -1,6 +1,14 @@
 from .base import Base
+from .user import User
+from .admin import Admin
 from .scream import Scream
 from .reaction import Reaction
+from .skip import Skip
 from .archive import Archive
+from .activity import ActivityDaily, ActivityHourly, UserActivityDaily
+from .user_stats import UserStats
+from .user_feed import UserFeedProgress
 
-__all__ = ["Base", "Scream", "Reaction", "Archive"]
+__all__ = ["Base", "User", "Admin", "Scream", "Reaction", "Skip", "Archive",
+           "ActivityDaily", "ActivityHourly", "UserActivityDaily",
+           "UserStats", "UserFeedProgress"]
@@ -0,0 +1,154 @@
+# Standard library
+import logging
+
+# Third‑party
+from sqlalchemy import ForeignKey, Integer, event
+from sqlalchemy.orm import Mapped, mapped_column
+
+# Local application
+from app_fastapi.tools.dialect import upsert_increment
+from app_fastapi.tools.time import day_bucket, hour_bucket
+from .base import Base
+from .reaction import Reaction
+from .scream import Scream
+
+
+logger = logging.getLogger("app_fastapi.models")
+
+
+class ActivityHourly(Base):
+    """
+    Global number of screams and reactions per hour.
+
+    Rows are incremented on every scream or reaction insert and can be
+    rebuilt from the raw tables with `tools.rollups`.
+
+    Attributes:
+        hour (int): Primary key, hours since the Unix epoch (UTC).
+        screams (int): Screams posted during the hour.
+        reactions (int): Reactions given during the hour.
+    """
+
+    __tablename__ = "activity_hourly"
+
+    hour: Mapped[int] = mapped_column(Integer, primary_key=True,
+                                      autoincrement=False)
+    screams: Mapped[int] = mapped_column(Integer, nullable=False,
+                                         default=0, server_default="0")
+    reactions: Mapped[int] = mapped_column(Integer, nullable=False,
+                                           default=0, server_default="0")
+
+    def __repr__(self):
+        logger.debug(f"ActivityHourly representation: hour={self.hour}")
+        return (
+            f"<ActivityHourly(hour={self.hour}, screams={self.screams}, "
+            f"reactions={self.reactions})>"
+        )
+
+
+class ActivityDaily(Base):
+    """
+    Global number of screams and reactions per day.
+
+    Attributes:
+        day (int): Primary key, days since the Unix epoch (UTC).
+        screams (int): Screams posted during the day.
+        reactions (int): Reactions given during the day.
+    """
+
+    __tablename__ = "activity_daily"
+
+    day: Mapped[int] = mapped_column(Integer, primary_key=True,
+                                     autoincrement=False)
+    screams: Mapped[int] = mapped_column(Integer, nullable=False,
+                                         default=0, server_default="0")
+    reactions: Mapped[int] = mapped_column(Integer, nullable=False,
+                                           default=0, server_default="0")
+
+    def __repr__(self):
+        logger.debug(f"ActivityDaily representation: day={self.day}")
+        return (
+            f"<ActivityDaily(day={self.day}, screams={self.screams}, "
+            f"reactions={self.reactions})>"
+        )
+
+
+class UserActivityDaily(Base):
+    """
+    Number of screams posted and reactions given by a user per day.
+
+    Attributes:
+        user_id (int): Foreign key to the user (primary key part).
+        day (int): Days since the Unix epoch (primary key part).
+        screams (int): Screams the user posted that day.
+        reactions (int): Reactions the user gave that day.
+    """
+
+    __tablename__ = "user_activity_daily"
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"),
+                                         primary_key=True)
+    day: Mapped[int] = mapped_column(Integer, primary_key=True,
+                                     autoincrement=False)
+    screams: Mapped[int] = mapped_column(Integer, nullable=False,
+                                         default=0, server_default="0")
+    reactions: Mapped[int] = mapped_column(Integer, nullable=False,
+                                           default=0, server_default="0")
+
+    def __repr__(self):
+        logger.debug(f"UserActivityDaily representation: day={self.day}, "
+                     f"user_id={self.user_id}")
+        return (
+            f"<UserActivityDaily(user={self.user_id}, "
+            f"day={self.day}, screams={self.screams})>"
+        )
+
+
+def record_activity(connection, column, timestamp, user_id, delta):
+    """
+    Add one scream or reaction to every rollup table.
+
+    Args:
+        connection (Connection): Connection of the current flush.
+        column (str): "screams" or "reactions".
+        timestamp (int): When the row was created, in epoch seconds.
+        user_id (int): ID of the acting user.
+        delta (int): +1 for an insert, -1 for a delete.
+    """
+    if timestamp is None:
+        return
+    day = day_bucket(timestamp)
+    deltas = {column: delta}
+    upsert_increment(connection, ActivityHourly,
+                     {"hour": hour_bucket(timestamp)}, deltas)
+    upsert_increment(connection, ActivityDaily, {"day": day}, deltas)
+    upsert_increment(connection, UserActivityDaily,
+                     {"user_id": user_id, "day": day}, deltas)
+
+
+@event.listens_for(Scream, "after_insert")
+def count_scream_activity(mapper, connection, target):
+    """Count a new scream in the rollups."""
+    record_activity(connection, "screams", target.timestamp,
+                    target.user_id, 1)
+
+
+@event.listens_for(Scream, "after_delete")
+def uncount_scream_activity(mapper, connection, target):
+    """Remove a deleted scream from the rollups."""
+    record_activity(connection, "screams", target.timestamp,
+                    target.user_id, -1)
+
+
+@event.listens_for(Reaction, "after_insert")
+def count_reaction_activity(mapper, connection, target):
+    """Count a new reaction in the rollups."""
+    record_activity(connection, "reactions", target.timestamp,
+                    target.user_id, 1)
+
+
+@event.listens_for(Reaction, "after_delete")
+def uncount_reaction_activity(mapper, connection, target):
+    """Remove a deleted reaction from the rollups."""
+    record_activity(connection, "reactions", target.timestamp,
+                    target.user_id, -1)
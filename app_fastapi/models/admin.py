@@ -2,7 +2,7 @@
 import logging
 
 # Third‑party
-from sqlalchemy import String
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column
 
 # Local application
@@ -18,26 +18,31 @@ class Admin(Base):
 
     Attributes:
         id (int): The unique identifier for the admin user.
-        user_hash (str): A hashed value representing the admin's user identity.
+        user_id (int): Foreign key to the admin's user identity.
     Methods:
         __repr__():
             Returns a string representation of the Admin object, including
-            its unique identifier and user hash for display purposes.
+            its unique identifier and user ID for display purposes.
     Table schema:
         - id (Primary Key): Integer, auto-generated unique identifier.
-        - user_hash (String, Non-nullable):
-            hashed value for admin's user identity.
+        - user_id (Integer, Non-nullable, Unique):
+            reference to the admin's row in `users`.
     """
 
     __tablename__ = "admin"
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    user_hash: Mapped[str] = mapped_column(String, nullable=False)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"),
+                                         nullable=False)
+
+    __table_args__ = (
+        Index("ix_admin_user_id", "user_id", unique=True),
+    )
 
     def __repr__(self):
         logger.debug(f"Admin representation: id={self.id}, "
-                     f"user_hash={self.user_hash[:5]}...")
-        return f"<Admin(id={self.id}, user={self.user_hash[:5]}...)>"
+                     f"user_id={self.user_id}")
+        return f"<Admin(id={self.id}, user={self.user_id})>"
 
     def __str__(self):
         logger.debug(f"Admin string representation: id={self.id}")
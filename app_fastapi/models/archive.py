@@ -1,8 +1,9 @@
 # Standard library
 import logging
+from typing import Optional
 
 # Third‑party
-from sqlalchemy import ForeignKey, Integer
+from sqlalchemy import ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 # Local application
@@ -16,27 +17,51 @@ class Archive(Base):
     """
     Represents an archived top scream for a given week.
 
+    Each row is a frozen snapshot of the scream at archiving time, so
+    reading a week never joins `screams` and keeps working after the
+    original scream is deleted.
+
     Attributes:
         id (int): Primary key.
-        scream_id (int): Foreign key to the original scream.
-        week_id (int): Identifier for the week archive in format.
+        scream_id (Optional[int]): Foreign key to the original scream;
+            set to NULL when that scream is deleted.
+        week_id (int): Identifier of the archived week (e.g. 202518).
         place (int): Rank or position in that week's top list.
+        content (str): Scream text at archiving time.
+        votes (int): Positive reactions at archiving time.
+        meme_url (Optional[str]): Meme of the scream at archiving time.
         scream (Scream): Relationship to the original scream object.
     Methods:
         __repr__(): Returns a string representation of the Archive object,
         including its unique identifier and scream_id for future usage.
+
+    Indexes:
+        - ix_archives_week_id_place: unique, ordered reads of a single
+          archived week; on PostgreSQL it also includes the snapshot
+          columns so the read is index-only.
     """
 
     __tablename__ = "archives"
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    scream_id: Mapped[int] = mapped_column(ForeignKey("screams.id",
-                                                      ondelete="CASCADE"))
+    scream_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("screams.id", ondelete="SET NULL"), nullable=True
+    )
     week_id: Mapped[int] = mapped_column(Integer, nullable=False)
     place: Mapped[int] = mapped_column(Integer, nullable=False)
+    content: Mapped[str] = mapped_column(String, nullable=False,
+                                         server_default="")
+    votes: Mapped[int] = mapped_column(Integer, nullable=False,
+                                       default=0, server_default="0")
+    meme_url: Mapped[Optional[str]] = mapped_column(String, nullable=True)
 
     scream = relationship("Scream", back_populates="archives")
 
+    __table_args__ = (
+        Index("ix_archives_week_id_place", "week_id", "place", unique=True,
+              postgresql_include=["content", "votes", "meme_url"]),
+    )
+
     def __repr__(self):
         logger.debug(f"Archive representation: id={self.id}, "
                      f"scream_id={self.scream_id}")
@@ -0,0 +1,80 @@
+# Standard library
+import logging
+from enum import IntEnum
+
+# Third‑party
+from sqlalchemy import SmallInteger
+from sqlalchemy.types import TypeDecorator
+
+
+logger = logging.getLogger("app_fastapi.models")
+
+
+class Emoji(IntEnum):
+    """
+    Registry of the emojis users can answer a scream with.
+
+    Reactions store the small integer code instead of the multi-byte
+    symbol, so their rows and indexes stay small and filters and
+    GROUP BY compare integers. Symbols are translated at the API
+    boundary (see `schemas.requests.ReactionRequest`).
+
+    Members:
+        SKIP (❌): Hides the scream from the feed; stored as a `Skip`.
+        SKULL (💀), FIRE (🔥), CLOWN (🤡): Reactions.
+    """
+
+    SKIP = 0
+    SKULL = 1
+    FIRE = 2
+    CLOWN = 3
+
+    @property
+    def symbol(self) -> str:
+        """Return the emoji character of the member."""
+        return SYMBOLS[self]
+
+    @classmethod
+    def from_symbol(cls, symbol: str) -> "Emoji":
+        """
+        Look up the member of an emoji character.
+
+        Args:
+            symbol (str): Emoji character, e.g. "🔥".
+
+        Returns:
+            Emoji: The matching member.
+
+        Raises:
+            ValueError: If the emoji is not in the registry.
+        """
+        for member, member_symbol in SYMBOLS.items():
+            if member_symbol == symbol:
+                return member
+        raise ValueError(f"Unsupported emoji: {symbol}")
+
+    def __str__(self):
+        return self.symbol
+
+
+SYMBOLS = {
+    Emoji.SKIP: "❌",
+    Emoji.SKULL: "💀",
+    Emoji.FIRE: "🔥",
+    Emoji.CLOWN: "🤡",
+}
+
+
+class EmojiType(TypeDecorator):
+    """Store an `Emoji` as its SMALLINT code."""
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        """Convert a member to its code."""
+        return None if value is None else int(value)
+
+    def process_result_value(self, value, dialect):
+        """Convert a stored code back to its member."""
+        return None if value is None else Emoji(value)
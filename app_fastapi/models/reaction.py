@@ -1,28 +1,46 @@
 # Standard library
 import logging
-from datetime import datetime
 
 # Third‑party
-from sqlalchemy import ForeignKey, String, UniqueConstraint
+from sqlalchemy import (
+    ForeignKey,
+    Index,
+    Integer,
+    UniqueConstraint,
+    event,
+    update,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 # Local application
+from app_fastapi.tools.sql import epoch_now
 from .base import Base
+from .emoji import Emoji, EmojiType
+from .scream import Scream
 
 
 logger = logging.getLogger("app_fastapi.models")
 
+COUNTER_COLUMNS = {
+    Emoji.SKULL: "skull_count",
+    Emoji.FIRE: "fire_count",
+    Emoji.CLOWN: "clown_count",
+}
+
 
 class Reaction(Base):
     """
     Represents a user reaction (emoji) to a scream.
 
+    Every reaction is a vote; feed skips are stored as `Skip` rows.
+
     Attributes:
         id (int): Primary key.
-        emoji (str): The emoji character used in the reaction.
-        timestamp (datetime): When the reaction was created.
+        emoji (Emoji): The reaction, stored as its SMALLINT code.
+        timestamp (int): When the reaction was created, in epoch seconds;
+            set by the database on insert.
         scream_id (int): Foreign key to the associated scream.
-        user_hash (str): Hashed identifier of the reacting user.
+        user_id (int): Foreign key to the reacting user.
 
     Methods:
         __repr__(): Return a debug representation of the Reaction instance.
@@ -31,22 +49,37 @@ class Reaction(Base):
     Constraints:
         - Each user may react at most once per scream
         (enforced by unique constraint).
+
+    Counters:
+        Inserting or deleting a reaction adjusts the counters of its
+        scream in the same transaction (see `Scream`).
+
+    Indexes:
+        - ix_reactions_scream_id_emoji: covering index for vote counting.
+        - ix_reactions_user_id_emoji: covering index for reactions given.
     """
 
     __tablename__ = "reactions"
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    emoji: Mapped[str] = mapped_column(String, nullable=False)
-    timestamp: Mapped[datetime] = mapped_column(default=datetime.utcnow)
+    emoji: Mapped[Emoji] = mapped_column(EmojiType, nullable=False)
+    timestamp: Mapped[int] = mapped_column(Integer, nullable=False,
+                                           server_default=epoch_now())
     scream_id: Mapped[int] = mapped_column(ForeignKey("screams.id",
                                                       ondelete="CASCADE"))
-    user_hash: Mapped[str] = mapped_column(String, nullable=False)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"),
+                                         nullable=False)
 
     scream = relationship("Scream", back_populates="reactions")
 
+    # Fetch the server-side timestamp on insert for the rollup events.
+    __mapper_args__ = {"eager_defaults": True}
+
     __table_args__ = (
-        UniqueConstraint("scream_id", "user_hash",
+        UniqueConstraint("scream_id", "user_id",
                          name="one_reaction_per_user_per_post"),
+        Index("ix_reactions_scream_id_emoji", "scream_id", "emoji"),
+        Index("ix_reactions_user_id_emoji", "user_id", "emoji"),
     )
 
     def __repr__(self):
@@ -57,3 +90,41 @@ class Reaction(Base):
     def __str__(self):
         logger.debug(f"Reaction string representation: id={self.id}")
         return f"Reaction(id={self.id}, emoji={self.emoji})"
+
+
+def counter_values(emoji: Emoji, delta: int) -> dict:
+    """
+    Build the scream counter changes caused by one reaction.
+
+    Args:
+        emoji (Emoji): Emoji of the reaction.
+        delta (int): +1 for an added reaction, -1 for a removed one.
+
+    Returns:
+        dict: Mapping of Scream column name to its new value expression.
+    """
+    values = {"votes": Scream.votes + delta}
+    column = COUNTER_COLUMNS.get(emoji)
+    if column:
+        values[column] = getattr(Scream, column) + delta
+    return values
+
+
+@event.listens_for(Reaction, "after_insert")
+def count_reaction(mapper, connection, target):
+    """Increment the counters of the scream that received a reaction."""
+    connection.execute(
+        update(Scream)
+        .where(Scream.id == target.scream_id)
+        .values(**counter_values(target.emoji, 1))
+    )
+
+
+@event.listens_for(Reaction, "after_delete")
+def uncount_reaction(mapper, connection, target):
+    """Decrement the counters of the scream that lost a reaction."""
+    connection.execute(
+        update(Scream)
+        .where(Scream.id == target.scream_id)
+        .values(**counter_values(target.emoji, -1))
+    )
@@ -1,13 +1,20 @@
 # Standard library
 import logging
-from datetime import datetime, timezone
 from typing import Optional
 
 # Third‑party
-from sqlalchemy import Boolean, String
+from sqlalchemy import (
+    Boolean,
+    Computed,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 # Local application
+from app_fastapi.tools.sql import epoch_now
 from .base import Base
 
 
@@ -21,43 +28,106 @@ class Scream(Base):
     Attributes:
         id (int): Primary key.
         content (str): The text content of the scream.
-        timestamp (datetime): When the scream was posted (UTC).
-        user_hash (str): Hashed identifier of the posting user.
+        timestamp (int): When the scream was posted, in epoch seconds;
+            set by the database on insert.
+        day_id (int): Generated, days since the Unix epoch (UTC).
+        week_id (int): Generated, Monday-based weeks since the epoch.
+        user_id (int): Foreign key to the posting user.
         meme_url (Optional[str]): URL to a generated meme image.
         moderated (bool): Whether the scream has been reviewed by an admin.
+        claimed_by (Optional[int]): Admin holding the scream in a
+            moderation batch, see `tools.moderation`.
+        lease_expires (Optional[int]): Epoch second when the claim lapses
+            and the scream returns to the moderation pool.
+        votes (int): Number of reactions.
+        skull_count (int): Number of 💀 reactions.
+        fire_count (int): Number of 🔥 reactions.
+        clown_count (int): Number of 🤡 reactions.
+        skip_count (int): Number of feed skips.
         reactions (List[Reaction]): All reactions on this scream.
         archives (List[Archive]):
-            Archive entries if this scream made a top list.
+            Archive snapshots if this scream made a top list.
 
     Methods:
         __repr__(): Return a debug representation of the Scream instance.
         __str__(): Return a simple string identifier for the Scream instance.
+
+    Indexes:
+        - ix_screams_day_id_votes: daily ranking for /top.
+        - ix_screams_week_id_votes: weekly ranking for archiving.
+        - ix_screams_week_id_id: feed of the current week in posting order.
+        - ix_screams_user_id_timestamp: per-user stats and feed exclusion.
+        - ix_screams_moderated_week_id_id: keyset pages of the admin
+          moderation queue.
+        - ix_screams_claimed_by: batch currently claimed by an admin.
+
+    Counters:
+        The reaction counters are maintained by the Reaction model in the
+        same flush as the reaction itself; `tools.counters` rebuilds them.
     """
 
     __tablename__ = "screams"
 
     id: Mapped[int] = mapped_column(primary_key=True)
     content: Mapped[str] = mapped_column(String, nullable=False)
-    timestamp: Mapped[datetime] = mapped_column(
-        default=datetime.now(timezone.utc)
-        )
-    user_hash: Mapped[str] = mapped_column(String, nullable=False)
+    timestamp: Mapped[int] = mapped_column(Integer, nullable=False,
+                                           server_default=epoch_now())
+    day_id: Mapped[int] = mapped_column(
+        Integer, Computed("timestamp / 86400", persisted=True)
+    )
+    week_id: Mapped[int] = mapped_column(
+        Integer, Computed("(timestamp / 86400 + 3) / 7", persisted=True)
+    )
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"),
+                                         nullable=False)
     meme_url: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     moderated: Mapped[bool] = mapped_column(Boolean,
                                             nullable=False,
                                             default=False)
+    claimed_by: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("users.id"), nullable=True
+    )
+    lease_expires: Mapped[Optional[int]] = mapped_column(Integer,
+                                                         nullable=True)
+    votes: Mapped[int] = mapped_column(Integer, nullable=False,
+                                       default=0, server_default="0")
+    skull_count: Mapped[int] = mapped_column(Integer, nullable=False,
+                                             default=0, server_default="0")
+    fire_count: Mapped[int] = mapped_column(Integer, nullable=False,
+                                            default=0, server_default="0")
+    clown_count: Mapped[int] = mapped_column(Integer, nullable=False,
+                                             default=0, server_default="0")
+    skip_count: Mapped[int] = mapped_column(Integer, nullable=False,
+                                            default=0, server_default="0")
 
+    # Reactions go with the scream through ON DELETE CASCADE; deleting a
+    # scream never loads them.
     reactions = relationship("Reaction", back_populates="scream",
-                             cascade="all, delete-orphan")
+                             cascade="all, delete-orphan",
+                             passive_deletes=True)
+    # Archived snapshots outlive the scream; the database nulls the link.
     archives = relationship("Archive", back_populates="scream",
-                            cascade="all, delete-orphan")
+                            passive_deletes=True)
+
+    # Fetch the server-side timestamp and generated columns on insert.
+    __mapper_args__ = {"eager_defaults": True}
+
+    __table_args__ = (
+        Index("ix_screams_day_id_votes", "day_id", "votes"),
+        Index("ix_screams_week_id_votes", "week_id", "votes"),
+        Index("ix_screams_week_id_id", "week_id", "id"),
+        Index("ix_screams_user_id_timestamp", "user_id", "timestamp"),
+        Index("ix_screams_moderated_week_id_id",
+              "moderated", "week_id", "id"),
+        Index("ix_screams_claimed_by", "claimed_by"),
+    )
 
     def __repr__(self):
         logger.debug(f"Scream representation: id={self.id}, "
-                     f"user_hash={self.user_hash[:5]}...")
+                     f"user_id={self.user_id}")
         return (
             f"<Scream(id={self.id}, content={self.content[:15]}..., "
-            f"user={self.user_hash[:5]}...)>"
+            f"user={self.user_id})>"
         )
 
     def __str__(self):
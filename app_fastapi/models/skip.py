@@ -0,0 +1,73 @@
+# Standard library
+import logging
+
+# Third‑party
+from sqlalchemy import ForeignKey, Index, event, update
+from sqlalchemy.orm import Mapped, mapped_column
+
+# Local application
+from .base import Base
+from .scream import Scream
+
+
+logger = logging.getLogger("app_fastapi.models")
+
+
+class Skip(Base):
+    """
+    Records that a user skipped a scream in the feed.
+
+    Skips only hide a scream from the user's feed, so they are kept out
+    of `reactions`: the reactions table and its indexes hold real votes
+    only, and aggregations need no emoji filter.
+
+    Attributes:
+        user_id (int): Primary key part, foreign key to the skipping user.
+        scream_id (int): Primary key part, foreign key to the scream.
+
+    Methods:
+        __repr__(): Return a debug representation of the Skip instance.
+
+    Counters:
+        Inserting a skip increments `Scream.skip_count` in the same flush.
+
+    Indexes:
+        - ix_skips_scream_id: cascading deletes of a scream's skips.
+    """
+
+    __tablename__ = "skips"
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"),
+                                         primary_key=True)
+    scream_id: Mapped[int] = mapped_column(
+        ForeignKey("screams.id", ondelete="CASCADE"), primary_key=True
+    )
+
+    __table_args__ = (
+        Index("ix_skips_scream_id", "scream_id"),
+    )
+
+    def __repr__(self):
+        logger.debug(f"Skip representation: user_id={self.user_id}, "
+                     f"scream_id={self.scream_id}")
+        return f"<Skip(user={self.user_id}, scream={self.scream_id})>"
+
+
+@event.listens_for(Skip, "after_insert")
+def count_skip(mapper, connection, target):
+    """Increment the skip counter of the skipped scream."""
+    connection.execute(
+        update(Scream)
+        .where(Scream.id == target.scream_id)
+        .values(skip_count=Scream.skip_count + 1)
+    )
+
+
+@event.listens_for(Skip, "after_delete")
+def uncount_skip(mapper, connection, target):
+    """Decrement the skip counter of the scream whose skip was removed."""
+    connection.execute(
+        update(Scream)
+        .where(Scream.id == target.scream_id)
+        .values(skip_count=Scream.skip_count - 1)
+    )
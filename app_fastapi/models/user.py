@@ -0,0 +1,41 @@
+# Standard library
+import logging
+
+# Third‑party
+from sqlalchemy import Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+# Local application
+from .base import Base
+
+
+logger = logging.getLogger("app_fastapi.models")
+
+
+class User(Base):
+    """
+    Maps a hashed user identity to a compact integer ID.
+
+    Every other table references users by `users.id`, so rows and
+    indexes store a small integer instead of the 64-character hash.
+
+    Attributes:
+        id (int): Primary key referenced by the other tables.
+        user_hash (str): SHA-256 hash of the external user ID.
+
+    Indexes:
+        - ix_users_user_hash: unique, resolves a hash to its ID.
+    """
+
+    __tablename__ = "users"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    user_hash: Mapped[str] = mapped_column(String, nullable=False)
+
+    __table_args__ = (
+        Index("ix_users_user_hash", "user_hash", unique=True),
+    )
+
+    def __repr__(self):
+        logger.debug(f"User representation: id={self.id}")
+        return f"<User(id={self.id}, user={self.user_hash[:5]}...)>"
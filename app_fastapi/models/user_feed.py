@@ -2,10 +2,13 @@
 import logging
 
 # Third‑party
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, ForeignKey, Integer, event
 
 # Local application
+from app_fastapi.tools.dialect import upsert_max
 from .base import Base
+from .reaction import Reaction
+from .skip import Skip
 
 
 logger = logging.getLogger("app_fastapi.models")
@@ -15,8 +18,13 @@ class UserFeedProgress(Base):
     """
     Tracks the last-seen scream for each user, to serve a personalized feed.
 
+    The feed returns screams with an ID above `last_seen_id`, so finding
+    the next scream is a primary key range read that does not depend on
+    how many reactions the user has given. The cursor advances whenever
+    the user reacts to or skips a scream, in the same flush.
+
     Attributes:
-        user_hash (str): Primary key, hashed identifier of the user.
+        user_id (int): Primary key, foreign key to the user.
         last_seen_id (int): ID of the most recently seen scream.
 
     Methods:
@@ -25,16 +33,25 @@ class UserFeedProgress(Base):
 
     __tablename__ = "user_feed_progress"
 
-    user_hash = Column(String, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
     last_seen_id = Column(Integer, default=0)
 
     def __repr__(self):
         logger.debug(
             f"UserFeedProgress representation: "
-            f"user_hash={self.user_hash[:5]}..., "
+            f"user_id={self.user_id}, "
             f"last_seen_id={self.last_seen_id}"
             )
         return (
-            f"<UserFeedProgress(user={self.user_hash[:5]}..., "
+            f"<UserFeedProgress(user={self.user_id}, "
             f"last_seen={self.last_seen_id})>"
         )
+
+
+@event.listens_for(Reaction, "after_insert")
+@event.listens_for(Skip, "after_insert")
+def advance_feed_cursor(mapper, connection, target):
+    """Move the reacting user's feed past the scream reacted to."""
+    upsert_max(connection, UserFeedProgress,
+               {"user_id": target.user_id},
+               {"last_seen_id": target.scream_id})
@@ -0,0 +1,137 @@
+# Standard library
+import logging
+
+# Third‑party
+from sqlalchemy import ForeignKey, Integer, event, select
+from sqlalchemy.orm import Mapped, mapped_column
+
+# Local application
+from app_fastapi.tools.dialect import upsert_increment
+from .base import Base
+from .emoji import Emoji
+from .reaction import Reaction
+from .scream import Scream
+
+
+logger = logging.getLogger("app_fastapi.models")
+
+RECEIVED_COLUMNS = {
+    Emoji.SKULL: "skull_got",
+    Emoji.FIRE: "fire_got",
+    Emoji.CLOWN: "clown_got",
+}
+
+
+class UserStats(Base):
+    """
+    Lifetime activity totals of a single user.
+
+    Rows are incremented on every scream or reaction write, so
+    `/stats/{user_id}` reads them with one primary-key lookup. A nightly
+    job (`tools.user_stats`) rebuilds the table from the raw rows.
+
+    Attributes:
+        user_id (int): Primary key, foreign key to the user.
+        screams_posted (int): Screams the user posted.
+        reactions_given (int): Reactions the user gave.
+        reactions_got (int): Reactions received on the user's screams.
+        skull_got (int): 💀 reactions received.
+        fire_got (int): 🔥 reactions received.
+        clown_got (int): 🤡 reactions received.
+    """
+
+    __tablename__ = "user_stats"
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"),
+                                         primary_key=True)
+    screams_posted: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    reactions_given: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    reactions_got: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    skull_got: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    fire_got: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    clown_got: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+
+    def histogram(self) -> dict:
+        """
+        Return received reactions per emoji.
+
+        Returns:
+            dict: Mapping of emoji character to count, without empty
+            entries.
+        """
+        counts = {emoji.symbol: getattr(self, column)
+                  for emoji, column in RECEIVED_COLUMNS.items()}
+        return {emoji: count for emoji, count in counts.items() if count}
+
+    def __repr__(self):
+        logger.debug(f"UserStats representation: "
+                     f"user_id={self.user_id}")
+        return (
+            f"<UserStats(user={self.user_id}, "
+            f"screams={self.screams_posted}, "
+            f"given={self.reactions_given}, got={self.reactions_got})>"
+        )
+
+
+def record_reaction_stats(connection, target, delta):
+    """
+    Apply one reaction to the giver's and the receiver's stats.
+
+    Args:
+        connection (Connection): Connection of the current flush.
+        target (Reaction): Inserted or deleted reaction.
+        delta (int): +1 for an insert, -1 for a delete.
+    """
+    upsert_increment(connection, UserStats,
+                     {"user_id": target.user_id},
+                     {"reactions_given": delta})
+
+    author = connection.scalar(
+        select(Scream.user_id).where(Scream.id == target.scream_id)
+    )
+    if author is None:
+        return
+    received = {"reactions_got": delta}
+    if target.emoji in RECEIVED_COLUMNS:
+        received[RECEIVED_COLUMNS[target.emoji]] = delta
+    upsert_increment(connection, UserStats, {"user_id": author}, received)
+
+
+@event.listens_for(Scream, "after_insert")
+def count_posted_scream(mapper, connection, target):
+    """Count a new scream for its author."""
+    upsert_increment(connection, UserStats,
+                     {"user_id": target.user_id},
+                     {"screams_posted": 1})
+
+
+@event.listens_for(Scream, "after_delete")
+def uncount_posted_scream(mapper, connection, target):
+    """Remove a deleted scream from its author's stats."""
+    upsert_increment(connection, UserStats,
+                     {"user_id": target.user_id},
+                     {"screams_posted": -1})
+
+
+@event.listens_for(Reaction, "after_insert")
+def count_reaction_stats(mapper, connection, target):
+    """Count a new reaction for its giver and receiver."""
+    record_reaction_stats(connection, target, 1)
+
+
+@event.listens_for(Reaction, "after_delete")
+def uncount_reaction_stats(mapper, connection, target):
+    """Remove a deleted reaction from its giver's and receiver's stats."""
+    record_reaction_stats(connection, target, -1)
@@ -1,13 +1,26 @@
 # Standard library
 import logging
+from typing import List, Optional
 
 # Third‑party
-from pydantic import BaseModel, constr
+from pydantic import (
+    BaseModel,
+    Field,
+    constr,
+    field_validator,
+    model_validator,
+)
 from typing_extensions import Annotated
 
+# Local application
+from app_fastapi.models.emoji import Emoji
+
 
 logger = logging.getLogger("app_fastapi.schemas")
 
+MAX_MODERATION_PAGE = 50
+MAX_MODERATION_BATCH = 100
+
 
 class CreateScreamRequest(BaseModel):
     """
@@ -73,16 +86,27 @@ class ReactionRequest(BaseModel):
     """
     Request model for reacting to a scream.
 
+    The emoji is sent as its character and translated to the `Emoji`
+    registry here; characters outside the registry are rejected with 422.
+
     Attributes:
         scream_id (int): ID of the scream to react to.
-        emoji (str): Emoji reaction.
+        emoji (Emoji): Emoji reaction.
         user_id (str): ID of the user reacting.
     """
 
     scream_id: int
-    emoji: str
+    emoji: Emoji
     user_id: str
 
+    @field_validator("emoji", mode="before")
+    @classmethod
+    def parse_emoji(cls, value):
+        """Translate an emoji character to its registry member."""
+        if isinstance(value, Emoji):
+            return value
+        return Emoji.from_symbol(value)
+
     def __repr__(self):
         logger.debug(
             f"ReactionRequest representation: user_id={self.user_id[:5]}..., "
@@ -131,3 +155,63 @@ class UserRequest(BaseModel):
         logger.debug(f"UserRequest representation: "
                      f"user_id={self.user_id[:5]}...")
         return f"<UserRequest(user={self.user_id[:5]}...)>"
+
+
+class ModerationRequest(BaseModel):
+    """
+    Request model for one page of the admin moderation queue.
+
+    Pages are keyset-paginated on the scream ID: `after_id` walks the
+    queue forward, `before_id` walks it backward from a page's first
+    scream.
+
+    Attributes:
+        user_id (str): ID of the admin.
+        after_id (int): Only return screams with a greater ID.
+        before_id (Optional[int]): If set, return the screams right
+            before this ID instead, still in ascending order.
+        limit (int): Page size, at most `MAX_MODERATION_PAGE`.
+    """
+
+    user_id: str
+    after_id: Annotated[int, Field(ge=0)] = 0
+    before_id: Annotated[Optional[int], Field(ge=1)] = None
+    limit: Annotated[int, Field(ge=1, le=MAX_MODERATION_PAGE)] = 10
+
+    def __repr__(self):
+        logger.debug(f"ModerationRequest representation: "
+                     f"user_id={self.user_id[:5]}...")
+        return (
+            f"<ModerationRequest(user={self.user_id[:5]}..., "
+            f"after={self.after_id}, limit={self.limit})>"
+        )
+
+
+class ModerateRequest(BaseModel):
+    """
+    Request model for moderating many screams in one transaction.
+
+    Attributes:
+        user_id (str): ID of the admin.
+        confirm (List[int]): IDs of screams to mark as reviewed.
+        delete (List[int]): IDs of screams to delete.
+    """
+
+    user_id: str
+    confirm: Annotated[List[int], Field(max_length=MAX_MODERATION_BATCH)] = []
+    delete: Annotated[List[int], Field(max_length=MAX_MODERATION_BATCH)] = []
+
+    @model_validator(mode="after")
+    def check_disjoint(self):
+        """Reject screams that are both confirmed and deleted."""
+        if set(self.confirm) & set(self.delete):
+            raise ValueError("A scream cannot be confirmed and deleted")
+        return self
+
+    def __repr__(self):
+        logger.debug(f"ModerateRequest representation: "
+                     f"user_id={self.user_id[:5]}...")
+        return (
+            f"<ModerateRequest(user={self.user_id[:5]}..., "
+            f"confirm={len(self.confirm)}, delete={len(self.delete)})>"
+        )
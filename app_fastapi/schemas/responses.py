@@ -1,6 +1,6 @@
 # Standard library
 import logging
-from typing import List
+from typing import List, Optional
 
 # Third-party
 from pydantic import BaseModel
@@ -78,16 +78,16 @@ class TopScreamItem(BaseModel):
     """Schema for single top scream item.
 
     Attributes:
-        id: Scream ID
+        id: Scream ID, None for archived screams since deleted
         content: Text content
         votes: Number of positive reactions
-        meme_url: URL to meme image
+        meme_url: URL to meme image, if any
     """
 
-    id: int
+    id: Optional[int]
     content: str
     votes: int
-    meme_url: str
+    meme_url: Optional[str]
 
     def __repr__(self):
         logger.debug(f"TopScreamItem id={self.id}, votes={self.votes}")
@@ -189,3 +189,78 @@ class ScreamResponse(BaseModel):
     def __repr__(self):
         logger.debug(f"ScreamResponse id={self.scream_id}")
         return f"<ScreamResponse({self.scream_id})>"
+
+
+class FeedBatchResponse(BaseModel):
+    """Response model for a prefetched batch of feed screams.
+
+    Attributes:
+        screams: Next unseen screams in feed order
+    """
+
+    screams: List[ScreamResponse]
+
+    def __repr__(self):
+        logger.debug(f"FeedBatchResponse screams={len(self.screams)}")
+        return f"<FeedBatchResponse({len(self.screams)} screams)>"
+
+
+class ModerationPageResponse(BaseModel):
+    """Response model for one page of the admin moderation queue.
+
+    Attributes:
+        screams: Unmoderated screams of the page in ID order
+        total: Unmoderated screams of the week across all pages
+    """
+
+    screams: List[ScreamResponse]
+    total: int
+
+    def __repr__(self):
+        logger.debug(f"ModerationPageResponse screams={len(self.screams)}")
+        return (f"<ModerationPageResponse({len(self.screams)} "
+                f"of {self.total})>")
+
+
+class ModerateResponse(BaseModel):
+    """Response model for bulk moderation.
+
+    Attributes:
+        confirmed: IDs of screams marked as reviewed
+        deleted: IDs of screams deleted
+    """
+
+    confirmed: List[int]
+    deleted: List[int]
+
+    def __repr__(self):
+        logger.debug(f"ModerateResponse confirmed={len(self.confirmed)}, "
+                     f"deleted={len(self.deleted)}")
+        return (f"<ModerateResponse({len(self.confirmed)} confirmed, "
+                f"{len(self.deleted)} deleted)>")
+
+
+class CacheStatsResponse(BaseModel):
+    """Response model for the read cache counters.
+
+    Attributes:
+        hits: Lookups served from the cache, fresh or stale
+        stale_hits: Hits served stale while refreshed in the background
+        misses: Lookups that waited for the response
+        coalesced: Callers that joined a computation already running
+        evictions: Entries dropped because the cache was full
+        entries: Responses currently cached
+    """
+
+    hits: int
+    stale_hits: int
+    misses: int
+    coalesced: int
+    evictions: int
+    entries: int
+
+    def __repr__(self):
+        logger.debug(f"CacheStatsResponse hits={self.hits}, "
+                     f"misses={self.misses}")
+        return (f"<CacheStatsResponse({self.hits} hits, "
+                f"{self.misses} misses)>")
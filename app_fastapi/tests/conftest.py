@@ -1,8 +1,18 @@
 import os
 import pytest
 from app_fastapi.main import app
-from app_fastapi.initializers.engine import get_session as real_get_session
+from app_fastapi.initializers.engine import (
+    apply_sqlite_profile,
+    get_read_session as real_get_read_session,
+    get_read_session_factory,
+    get_session as real_get_session,
+    normalize_database_url,
+)
+from app_fastapi.initializers.writer import writer
 from app_fastapi.models.base import Base
+from app_fastapi.tools.admins import admin_registry
+from app_fastapi.tools.cache import response_cache
+from app_fastapi.tools.users import get_or_create_user_id
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 from fastapi.testclient import TestClient
@@ -10,8 +20,12 @@ from fastapi.testclient import TestClient
 
 os.environ["DB_FILENAME"] = ":memory:"
 
-TEST_DB_URL = "sqlite+aiosqlite:///:memory:"
-engine = create_async_engine(TEST_DB_URL, echo=False)
+# Point TEST_DATABASE_URL at a local PostgreSQL to run the suite there.
+TEST_DB_URL = os.getenv("TEST_DATABASE_URL",
+                        "sqlite+aiosqlite:///:memory:")
+engine = create_async_engine(normalize_database_url(TEST_DB_URL), echo=False)
+if TEST_DB_URL.startswith("sqlite"):
+    apply_sqlite_profile(engine, "performance")
 TestingSessionLocal = sessionmaker(bind=engine,
                                    class_=AsyncSession,
                                    expire_on_commit=False)
@@ -31,6 +45,20 @@ async def override_get_session():
         yield session
 
 
+async def make_user(user_hash: str) -> int:
+    """
+    Return the ID of a test user, registering it on first use.
+
+    Args:
+        user_hash (str): Hash identifying the user.
+
+    Returns:
+        int: The user's ID in the test database.
+    """
+    async with TestingSessionLocal() as session:
+        return await get_or_create_user_id(session, user_hash)
+
+
 @pytest.fixture(scope="session", autouse=True)
 async def prepare_database():
     """
@@ -48,16 +76,26 @@ async def prepare_database():
 
 
 @pytest.fixture
-def client():
+def client(monkeypatch):
     """
     Provide a test client for making HTTP requests to the FastAPI app.
 
-    Overrides the real database session dependency with an in-memory test
-        session.
+    Overrides the real read and write session dependencies and the read
+        session factory with an in-memory test session, points the group
+        commit writer at it and empties the response cache and the admin
+        registry, since tests also write the database directly.
     Yields:
         TestClient: A FastAPI test client instance configured for testing.
     """
     app.dependency_overrides[real_get_session] = override_get_session
+    app.dependency_overrides[real_get_read_session] = override_get_session
+    app.dependency_overrides[get_read_session_factory] = (
+        lambda: TestingSessionLocal
+    )
+    monkeypatch.setattr(writer, "session_factory", TestingSessionLocal)
+    response_cache.clear()
     with TestClient(app) as c:
+        # Startup loaded the registry from the application database.
+        admin_registry.reset()
         yield c
     app.dependency_overrides.clear()
@@ -1,12 +1,12 @@
 from app_fastapi.models.admin import Admin
 from app_fastapi.tools.crypt import hash_user_id
 from unittest.mock import patch
-from .conftest import TestingSessionLocal
+from .conftest import TestingSessionLocal, make_user
 
 
 async def test_admin_middleware_valid(client):
     async with TestingSessionLocal() as session:
-        admin = Admin(user_hash=hash_user_id("admin12345"))
+        admin = Admin(user_id=await make_user(hash_user_id("admin12345")))
         session.add(admin)
         await session.commit()
 
@@ -25,8 +25,9 @@ async def test_admin_middleware_invalid_json(client):
 
 async def test_admin_middleware_missing_user_id(client):
     response = client.post("/create_admin", json={})
-    assert response.status_code == 400
-    assert response.json() == {"detail": "Missing user_id"}
+    assert response.status_code == 422
+    assert ["body", "user_id"] in [error["loc"]
+                                   for error in response.json()["detail"]]
 
 
 async def test_admin_middleware_non_admin(client):
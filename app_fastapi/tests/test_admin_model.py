@@ -1,17 +1,19 @@
 import pytest
 from app_fastapi.models.admin import Admin
 from sqlalchemy import select
-from app_fastapi.tests.conftest import TestingSessionLocal
+from app_fastapi.tests.conftest import TestingSessionLocal, make_user
 
 
 @pytest.fixture
 async def admin_fixture():
+    user_id = await make_user("hashed_admin_12345")
     async with TestingSessionLocal() as session:
-        admin = Admin(user_hash="hashed_admin_12345")
-        session.add(admin)
-        await session.commit()
+        # user_id is unique, so later tests reuse the first test's row.
+        stmt = select(Admin).where(Admin.user_id == user_id)
+        if (await session.execute(stmt)).scalars().first() is None:
+            session.add(Admin(user_id=user_id))
+            await session.commit()
 
-        stmt = select(Admin).where(Admin.id == admin.id)
         db_admin = await session.execute(stmt)
 
         return db_admin.scalars().first()
@@ -21,7 +23,7 @@ async def test_create_admin(admin_fixture):
     db_admin = admin_fixture
 
     assert db_admin is not None
-    assert db_admin.user_hash == "hashed_admin_12345"
+    assert db_admin.user_id == await make_user("hashed_admin_12345")
 
 
 async def test_admin_repr(admin_fixture):
@@ -29,7 +31,7 @@ async def test_admin_repr(admin_fixture):
 
     repr_str = repr(db_admin)
     assert "Admin(id=" in repr_str
-    assert "user=hashe..." in repr_str
+    assert f"user={db_admin.user_id})" in repr_str
 
 
 async def test_admin_str(admin_fixture):
@@ -0,0 +1,97 @@
+# Local application
+from app_fastapi.models.admin import Admin
+from app_fastapi.tools.admins import AdminRegistry
+from app_fastapi.tools.crypt import hash_user_id
+from .conftest import TestingSessionLocal, make_user
+
+
+class FakeClock:
+    """Monotonic clock advanced by hand."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class CountingSession:
+    """Session wrapper counting the statements it runs."""
+
+    def __init__(self, session):
+        self.session = session
+        self.queries = 0
+
+    async def scalars(self, statement):
+        self.queries += 1
+        return await self.session.scalars(statement)
+
+
+async def _grant(user_hash: str):
+    """Make a user an admin directly in the database."""
+    user_id = await make_user(user_hash)
+    async with TestingSessionLocal() as session:
+        session.add(Admin(user_id=user_id))
+        await session.commit()
+
+
+async def test_registry_answers_known_admins_from_memory():
+    """After the load, admin checks run no queries."""
+    await _grant(hash_user_id("registry_admin"))
+    registry = AdminRegistry(ttl=60, clock=FakeClock())
+    async with TestingSessionLocal() as db:
+        session = CountingSession(db)
+        assert await registry.is_admin(session,
+                                       hash_user_id("registry_admin"))
+        loads = session.queries
+        for _ in range(3):
+            assert await registry.is_admin(session,
+                                           hash_user_id("registry_admin"))
+        assert session.queries == loads
+
+
+async def test_registry_rejects_unknown_hashes_from_memory():
+    """
+    Non-admins are rejected without queries; admins granted elsewhere
+    after the load are recognised once the set expires.
+    """
+    clock = FakeClock()
+    registry = AdminRegistry(ttl=10, clock=clock)
+    async with TestingSessionLocal() as db:
+        session = CountingSession(db)
+        assert not await registry.is_admin(session,
+                                           hash_user_id("registry_late"))
+        loads = session.queries
+
+        await _grant(hash_user_id("registry_late"))
+        assert not await registry.is_admin(session,
+                                           hash_user_id("registry_late"))
+        assert session.queries == loads
+
+        clock.now = 11
+        assert await registry.is_admin(session,
+                                       hash_user_id("registry_late"))
+
+
+async def test_registry_reloads_after_ttl():
+    """An expired set is reloaded, dropping hashes no longer admin."""
+    clock = FakeClock()
+    registry = AdminRegistry(ttl=10, clock=clock)
+    async with TestingSessionLocal() as session:
+        await registry.load(session)
+        registry.add("revoked")
+        assert await registry.is_admin(session, "revoked")
+
+        clock.now = 11
+        assert not await registry.is_admin(session, "revoked")
+
+
+async def test_create_admin_registers_the_new_admin(client):
+    """A granted admin may use admin endpoints right away."""
+    await _grant(hash_user_id("registry_granter"))
+    resp = client.post("/create_admin", json={
+        "user_id": "registry_granter", "user_id_to_admin": "registry_new"})
+    assert resp.json() == {"status": "ok"}
+
+    resp = client.post("/history/199906", json={"user_id": "registry_new"})
+    assert resp.status_code == 200
@@ -1,18 +1,21 @@
 import pytest
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from app_fastapi.models.archive import Archive
 from app_fastapi.models.scream import Scream
-from app_fastapi.tests.conftest import TestingSessionLocal
+from app_fastapi.tests.conftest import TestingSessionLocal, make_user
 
 
 @pytest.fixture
 async def archive_and_scream():
+    user_id = await make_user("1ywe162")
     async with TestingSessionLocal() as session:
-        scream = Scream(user_hash="1ywe162", content="Test scream content")
+        scream = Scream(user_id=user_id, content="Test scream content")
         session.add(scream)
         await session.commit()
 
-        archive = Archive(scream_id=scream.id, week_id=202501, place=1)
+        await session.execute(delete(Archive).where(Archive.week_id == 202501))
+        archive = Archive(scream_id=scream.id, week_id=202501, place=1,
+                          content=scream.content, votes=0)
         session.add(archive)
         await session.commit()
 
@@ -28,6 +31,7 @@ async def test_create_archive(archive_and_scream):
     assert db_archive.scream_id == 1
     assert db_archive.week_id == 202501
     assert db_archive.place == 1
+    assert db_archive.content == "Test scream content"
 
 
 async def test_archive_repr(archive_and_scream):
@@ -38,3 +42,16 @@ async def test_archive_repr(archive_and_scream):
     assert "scream_id=2" in repr_str
     assert "week=202501" in repr_str
     assert "place=1" in repr_str
+
+
+async def test_archive_survives_scream_deletion(archive_and_scream):
+    db_archive = archive_and_scream
+
+    async with TestingSessionLocal() as session:
+        await session.delete(await session.get(Scream, db_archive.scream_id))
+        await session.commit()
+
+        archive = await session.get(Archive, db_archive.id,
+                                    populate_existing=True)
+    assert archive.scream_id is None
+    assert archive.content == "Test scream content"
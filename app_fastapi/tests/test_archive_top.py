@@ -4,44 +4,97 @@ from datetime import datetime, timezone
 
 # Third‑party
 import pytest
-from sqlalchemy import select, func
+from sqlalchemy import delete, select
 
 # Local application
 import app_fastapi.tools.archive_top as archive_module
 from app_fastapi.tools.archive_top import archive_top_job
 from app_fastapi.models.scream import Scream
 from app_fastapi.models.archive import Archive
-from .conftest import TestingSessionLocal
+from .conftest import TestingSessionLocal, make_user
 
 
-@pytest.mark.asyncio
-async def test_archive_top_handles_no_reactions(monkeypatch):
+FIXED_NOW = datetime(2025, 5, 10, tzinfo=timezone.utc)
+WEEK_ID = 202519
+
+
+@pytest.fixture
+def run_job(monkeypatch):
     """
-    archive_top_job should still create Archive entries
-    There are no reactions.
+    Run archive_top_job at a fixed time against the test database.
+
+    Returns:
+        Callable: Coroutine function running the job to completion.
     """
     monkeypatch.setattr(archive_module, "asyncSession", TestingSessionLocal)
 
-    fixed_now = datetime(2025, 5, 10, tzinfo=timezone.utc)
-
     class FakeDateTime(datetime):
         @classmethod
         def now(cls, tz=None):
-            return fixed_now
+            return FIXED_NOW
     monkeypatch.setattr(archive_module, "datetime", FakeDateTime)
 
+    async def _run():
+        inner_tasks = []
+        monkeypatch.setattr(asyncio,
+                            "create_task",
+                            lambda coro: inner_tasks.append(coro) or coro)
+        archive_top_job()
+        await inner_tasks[0]
+    return _run
+
+
+async def archived(week_id):
     async with TestingSessionLocal() as session:
-        session.add(Scream(content="lonely", user_hash="u"))
+        result = await session.execute(
+            select(Archive).where(Archive.week_id == week_id)
+            .order_by(Archive.place)
+        )
+        return result.scalars().all()
+
+
+@pytest.mark.asyncio
+async def test_archive_top_handles_no_reactions(run_job):
+    """
+    Screams of the week without positive reactions are not archived.
+    """
+    user_id = await make_user("u")
+    async with TestingSessionLocal() as session:
+        session.add(Scream(content="lonely", user_id=user_id,
+                           timestamp=int(FIXED_NOW.timestamp())))
         await session.commit()
 
-    inner_tasks = []
-    monkeypatch.setattr(asyncio,
-                        "create_task",
-                        lambda coro: inner_tasks.append(coro) or coro)
+    await run_job()
+
+    assert await archived(WEEK_ID) == []
 
-    archive_top_job()
-    await inner_tasks[0]
 
+@pytest.mark.asyncio
+async def test_archive_top_snapshots_ranked_screams(run_job, client):
+    """
+    The top screams are stored with their place and a content snapshot.
+    """
+    user_id = await make_user("u")
     async with TestingSessionLocal() as session:
-        cnt = await session.scalar(select(func.count(Archive.id)))
-    assert cnt == 2
+        await session.execute(
+            delete(Archive).where(Archive.week_id == WEEK_ID)
+        )
+        for content, votes in [("meh", 1), ("best", 5), ("good", 3),
+                               ("fourth", 1)]:
+            session.add(Scream(content=content, user_id=user_id,
+                               votes=votes, meme_url=f"{content}.png",
+                               timestamp=int(FIXED_NOW.timestamp())))
+        await session.commit()
+
+    await run_job()
+
+    rows = [(a.place, a.content, a.votes, a.meme_url)
+            for a in await archived(WEEK_ID)]
+    assert rows == [(1, "best", 5, "best.png"),
+                    (2, "good", 3, "good.png"),
+                    (3, "meh", 1, "meh.png")]
+
+    resp = client.get(f"/history/{WEEK_ID}")
+    assert resp.status_code == 200
+    assert [p["content"] for p in resp.json()["posts"]] == \
+        ["best", "good", "meh"]
@@ -0,0 +1,12 @@
+# Local application
+from app_fastapi.benchmarks import serialization
+
+
+def test_serialization_benchmark_runs():
+    """The harness encodes identical bodies both ways and measures them."""
+    timings = serialization.timings(number=1, repeat=1)
+    assert [name for name, *_ in timings] == [
+        "/screams/admin, 50 screams", "/feed/{user_id}/batch, 10 screams",
+    ]
+    assert all(before > 0 and after > 0 for _, before, after in timings)
+    assert all(packed < size for _, size, packed in serialization.sizes())
@@ -0,0 +1,326 @@
+# Standard library
+import asyncio
+import json
+from datetime import datetime, timezone
+
+# Third‑party
+import pytest
+from fastapi import Request
+
+# Local application
+from app_fastapi.api import endpoints
+from app_fastapi.initializers.writer import writer
+from app_fastapi.models.admin import Admin
+from app_fastapi.models.emoji import Emoji
+from app_fastapi.models.reaction import Reaction
+from app_fastapi.models.scream import Scream
+from app_fastapi.schemas.responses import ArchivedWeeksResponse
+from app_fastapi.tools.cache import ResponseCache, SingleFlight, response_cache
+from app_fastapi.tools.conditional import render
+from app_fastapi.tools.crypt import hash_user_id
+from app_fastapi.tools.time import day_bucket, epoch_seconds
+from .conftest import TestingSessionLocal, make_user
+
+
+# A fixed day far from other tests' data.
+DAY = epoch_seconds(datetime(2001, 3, 7, 10, 0, tzinfo=timezone.utc))
+DAY2 = epoch_seconds(datetime(2001, 3, 8, 10, 0, tzinfo=timezone.utc))
+REQUEST = Request({"type": "http", "headers": [], "path": "/top"})
+
+
+class FakeClock:
+    """Monotonic clock advanced by hand."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+async def test_response_cache_ttl_lru_and_tags():
+    """
+    Entries expire after the TTL, the least recently used one is evicted
+    when full and invalidating a tag drops only entries built from it.
+    """
+    clock = FakeClock()
+    cache = ResponseCache(max_entries=2, ttl=10, stale=0, clock=clock)
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        return {"n": len(calls)}
+
+    assert await cache.cached(("top", 1), ("screams",), compute) == {"n": 1}
+    assert await cache.cached(("top", 1), ("screams",), compute) == {"n": 1}
+    clock.now = 11
+    assert await cache.cached(("top", 1), ("screams",), compute) == {"n": 2}
+
+    cache.set(("history",), {"weeks": []}, ("archives",))
+    cache.get(("top", 1))
+    cache.set(("stress", 1), {"chart_url": "x"}, ("screams",))
+    assert cache.get(("history",)) is None
+    assert cache.evictions == 1
+
+    assert cache.invalidate("archives") == 0
+    assert cache.invalidate("screams") == 2
+    assert cache.stats() == {"hits": 2, "stale_hits": 0, "misses": 3,
+                             "coalesced": 0, "evictions": 1, "entries": 0}
+
+
+async def test_response_cache_skips_values_raced_by_a_write():
+    """A value computed across an invalidation is returned, not stored."""
+    cache = ResponseCache()
+
+    async def compute():
+        cache.invalidate("screams")
+        return {"posts": []}
+
+    assert await cache.cached(("top", 1), ("screams",), compute) == {
+        "posts": []}
+    assert cache.stats()["entries"] == 0
+
+
+async def test_unrelated_write_keeps_a_concurrent_fill():
+    """
+    Invalidating the tags of /stress while /history is computed does
+    not keep the history response from being stored.
+    """
+    cache = ResponseCache()
+
+    async def compute():
+        cache.invalidate("screams")
+        return {"weeks": [1]}
+
+    await cache.cached(("history",), ("archives",), compute)
+    assert cache.get(("history",)) == {"weeks": [1]}
+
+    generation = cache.generation(("archives",))
+    cache.invalidate("screams", "reactions")
+    cache.set(("history", 2), {"weeks": []}, ("archives",), generation)
+    assert cache.get(("history", 2)) == {"weeks": []}
+
+
+async def test_response_cache_does_not_store_errors():
+    """A read raising, e.g. a 404, is recomputed on the next lookup."""
+    cache = ResponseCache()
+
+    async def compute():
+        raise LookupError
+
+    for _ in range(2):
+        with pytest.raises(LookupError):
+            await cache.cached(("history", 1), ("archives",), compute)
+    assert cache.stats()["misses"] == 2
+
+
+async def test_concurrent_misses_share_one_computation():
+    """
+    Identical concurrent misses run the computation once, but misses
+    after an invalidation do not join a computation started before it.
+    """
+    cache = ResponseCache()
+    release = asyncio.Event()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        n = len(calls)
+        await release.wait()
+        return {"n": n}
+
+    first = [asyncio.ensure_future(cache.cached(("top", 3), ("screams",),
+                                                compute))
+             for _ in range(5)]
+    await asyncio.sleep(0)
+    cache.invalidate("screams")
+    late = asyncio.ensure_future(cache.cached(("top", 3), ("screams",),
+                                              compute))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert [await task for task in first] == [{"n": 1}] * 5
+    assert await late == {"n": 2}
+    assert cache.stats()["coalesced"] == 4
+    assert cache.get(("top", 3)) == {"n": 2}
+
+
+async def test_stale_entry_is_served_while_one_refresh_runs():
+    """
+    Past its TTL an entry is served stale, refreshed by a single
+    background task, and dropped once the stale window ends too.
+    """
+    clock = FakeClock()
+    cache = ResponseCache(ttl=10, stale=20, clock=clock)
+    release = asyncio.Event()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        if len(calls) > 1:
+            await release.wait()
+        return {"n": len(calls)}
+
+    assert await cache.cached(("stress", 1), ("screams",), compute) == {
+        "n": 1}
+    clock.now = 15
+    for _ in range(3):
+        assert await cache.cached(("stress", 1), ("screams",),
+                                  compute) == {"n": 1}
+    release.set()
+    await asyncio.sleep(0)
+
+    assert calls == [1, 1]
+    assert await cache.cached(("stress", 1), ("screams",), compute) == {
+        "n": 2}
+    assert cache.stats()["stale_hits"] == 3
+
+    clock.now = 50
+    assert cache.get(("stress", 1)) is None
+
+
+async def test_writes_to_other_tags_keep_shared_results():
+    """
+    Concurrent misses and a stale refresh store their one shared result
+    although writes to other tags happen while they run.
+    """
+    clock = FakeClock()
+    cache = ResponseCache(ttl=10, stale=20, clock=clock)
+    release = asyncio.Event()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await release.wait()
+        return {"n": len(calls)}
+
+    misses = [asyncio.ensure_future(cache.cached(("history",), ("archives",),
+                                                 compute))
+              for _ in range(5)]
+    await asyncio.sleep(0)
+    for tag in ("screams", "reactions", "screams"):
+        cache.invalidate(tag)
+        misses.append(asyncio.ensure_future(
+            cache.cached(("history",), ("archives",), compute)))
+        await asyncio.sleep(0)
+    release.set()
+
+    assert [await task for task in misses] == [{"n": 1}] * 8
+    assert cache.get(("history",)) == {"n": 1}
+
+    clock.now = 15
+    assert await cache.cached(("history",), ("archives",), compute) == {
+        "n": 1}
+    cache.invalidate("screams")
+    await asyncio.sleep(0)
+    assert calls == [1, 1]
+    assert cache.get(("history",)) == {"n": 2}
+
+
+async def test_single_flight_survives_a_cancelled_caller():
+    """Cancelling one caller leaves the shared task running for others."""
+    flights = SingleFlight()
+    release = asyncio.Event()
+
+    async def compute():
+        await release.wait()
+        return "url"
+
+    leader = asyncio.ensure_future(flights.do(1, compute))
+    follower = asyncio.ensure_future(flights.do(1, compute))
+    await asyncio.sleep(0)
+    leader.cancel()
+    release.set()
+
+    assert await follower == "url"
+    assert 1 not in flights
+
+
+async def test_concurrent_top_generates_each_meme_once(monkeypatch):
+    """Concurrent /top computations call Imgflip once per scream."""
+    calls = []
+
+    async def fake_gen(content):
+        calls.append(content)
+        await asyncio.sleep(0.01)
+        return "url"
+    monkeypatch.setattr(endpoints, "generate_meme_url", fake_gen)
+    monkeypatch.setattr(endpoints, "current_day_id",
+                        lambda: day_bucket(DAY2))
+    monkeypatch.setattr(writer, "session_factory", TestingSessionLocal)
+    author = await make_user("cache_meme_author")
+    fan = await make_user("cache_meme_fan")
+    async with TestingSessionLocal() as session:
+        scream = Scream(content="meme me", user_id=author, timestamp=DAY2)
+        session.add(scream)
+        await session.commit()
+        session.add(Reaction(scream_id=scream.id, emoji=Emoji.FIRE,
+                             user_id=fan, timestamp=DAY2))
+        await session.commit()
+
+    response_cache.clear()
+    results = await asyncio.gather(*(
+        endpoints.get_top_screams(REQUEST, n, TestingSessionLocal, writer)
+        for n in (1, 2, 3, 3)
+    ))
+
+    assert calls == ["meme me"]
+    assert {post["meme_url"] for r in results
+            for post in json.loads(r.body)["posts"]} == {"url"}
+    async with TestingSessionLocal() as session:
+        stored = await session.get(Scream, scream.id)
+        assert stored.meme_url == "url"
+    await writer.stop()
+
+
+async def test_top_is_cached_until_written(client, monkeypatch):
+    """
+    Repeated /top reads hit the cache, posted screams and reactions
+    invalidate it and /cache/stats reports the counters to admins.
+    """
+    async def fake_gen(content):
+        return "url"
+    monkeypatch.setattr("app_fastapi.api.endpoints.generate_meme_url",
+                        fake_gen)
+    monkeypatch.setattr("app_fastapi.api.endpoints.current_day_id",
+                        lambda: day_bucket(DAY))
+    author = await make_user(hash_user_id("cache_author"))
+    admin = await make_user(hash_user_id("cache_stats_admin"))
+    async with TestingSessionLocal() as session:
+        scream = Scream(content="cached?", user_id=author, timestamp=DAY)
+        session.add_all([scream, Admin(user_id=admin)])
+        await session.commit()
+
+    assert client.get("/top").json() == {"posts": []}
+    assert client.get("/top").json() == {"posts": []}
+    resp = client.post("/cache/stats", json={"user_id": "cache_author"})
+    assert resp.status_code == 403
+    resp = client.post("/cache/stats", json={"user_id": "cache_stats_admin"})
+    assert resp.json() == {
+        "hits": 1, "stale_hits": 0, "misses": 1, "coalesced": 0,
+        "evictions": 0, "entries": 1}
+
+    client.post("/react", json={"user_id": "cache_fan",
+                                "scream_id": scream.id, "emoji": "🔥"})
+    posts = client.get("/top").json()["posts"]
+    assert [post["id"] for post in posts] == [scream.id]
+
+    client.post("/scream", json={"user_id": "cache_author",
+                                 "content": "invalidates"})
+    assert response_cache.stats()["entries"] == 0
+
+
+async def test_history_is_invalidated_by_archiving(client):
+    """Archiving a week drops the cached week list."""
+    admin = await make_user(hash_user_id("cache_admin"))
+    async with TestingSessionLocal() as session:
+        session.add(Admin(user_id=admin))
+        await session.commit()
+    response_cache.set(("history",),
+                       render(ArchivedWeeksResponse, {"weeks": [1]}),
+                       ("archives",))
+    assert client.get("/history").json() == {"weeks": [1]}
+
+    resp = client.post("/history/199903", json={"user_id": "cache_admin"})
+    assert resp.status_code == 200
+    assert client.get("/history").json() != {"weeks": [1]}
@@ -0,0 +1,78 @@
+# Standard library
+from datetime import datetime, timezone
+
+# Local application
+from app_fastapi.models.archive import Archive
+from app_fastapi.schemas.responses import ArchivedWeeksResponse
+from app_fastapi.tools.cache import response_cache
+from app_fastapi.tools.conditional import etag_matches, render
+from app_fastapi.tools.time import day_bucket, epoch_seconds
+from .conftest import TestingSessionLocal
+
+
+# A fixed day far from other tests' data.
+DAY = epoch_seconds(datetime(2001, 5, 2, 10, 0, tzinfo=timezone.utc))
+
+
+def test_render_derives_strong_etag_from_body():
+    """Equal payloads share an ETag, different payloads do not."""
+    first = render(ArchivedWeeksResponse, {"weeks": [2, 1]})
+    assert first.body == b'{"weeks":[2,1]}'
+    assert first.etag == render(ArchivedWeeksResponse,
+                                {"weeks": [2, 1]}).etag
+    assert first.etag != render(ArchivedWeeksResponse, {"weeks": [2]}).etag
+    assert first.etag.startswith('"') and first.etag.endswith('"')
+
+
+def test_etag_matches_lists_weak_tags_and_wildcard():
+    """If-None-Match matches any listed tag, W/ prefixed or not, or *."""
+    assert not etag_matches(None, '"a"')
+    assert not etag_matches('"b"', '"a"')
+    assert etag_matches('"b", W/"a"', '"a"')
+    assert etag_matches("*", '"a"')
+
+
+def test_top_revalidates_with_if_none_match(client, monkeypatch):
+    """
+    /top sends an ETag and Cache-Control; a matching If-None-Match gets
+    an empty 304 until a write changes the body.
+    """
+    monkeypatch.setattr("app_fastapi.api.endpoints.current_day_id",
+                        lambda: day_bucket(DAY))
+    first = client.get("/top")
+    etag = first.headers["etag"]
+    assert first.json() == {"posts": []}
+    assert first.headers["cache-control"] == "no-cache"
+
+    again = client.get("/top", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["etag"] == etag
+
+    other = client.get("/top", params={"n": 5},
+                       headers={"If-None-Match": '"stale"'})
+    assert other.status_code == 200
+
+
+async def test_history_week_etag_changes_with_archive(client):
+    """A week's ETag is stable until its snapshot rows change."""
+    async with TestingSessionLocal() as session:
+        session.add(Archive(week_id=199904, place=1, content="old",
+                            votes=2))
+        await session.commit()
+    first = client.get("/history/199904")
+    etag = first.headers["etag"]
+    assert client.get("/history/199904", headers={
+        "If-None-Match": etag}).status_code == 304
+
+    async with TestingSessionLocal() as session:
+        session.add(Archive(week_id=199904, place=2, content="new",
+                            votes=1))
+        await session.commit()
+    # Direct writes bypass the endpoints, which would invalidate.
+    response_cache.invalidate("archives")
+
+    changed = client.get("/history/199904", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert len(changed.json()["posts"]) == 2
@@ -0,0 +1,74 @@
+# Third‑party
+from sqlalchemy import update
+
+# Local application
+from app_fastapi.models.emoji import Emoji
+from app_fastapi.models.reaction import Reaction
+from app_fastapi.models.scream import Scream
+from app_fastapi.models.skip import Skip
+from app_fastapi.tools.counters import rebuild_counters
+from .conftest import TestingSessionLocal, make_user
+
+
+async def _counters(scream_id):
+    async with TestingSessionLocal() as session:
+        scream = await session.get(Scream, scream_id)
+        return (scream.votes, scream.skull_count, scream.fire_count,
+                scream.clown_count, scream.skip_count)
+
+
+async def test_counters_follow_reaction_inserts_and_deletes():
+    """
+    Reaction inserts and deletes, and skips, adjust the scream counters.
+    """
+    ids = [await make_user(name) for name in ("author", "c1", "c2", "c3")]
+    async with TestingSessionLocal() as session:
+        scream = Scream(content="counted", user_id=ids[0])
+        session.add(scream)
+        await session.commit()
+        session.add_all([
+            Reaction(scream_id=scream.id, emoji=Emoji.SKULL, user_id=ids[1]),
+            Reaction(scream_id=scream.id, emoji=Emoji.FIRE, user_id=ids[2]),
+            Skip(scream_id=scream.id, user_id=ids[3]),
+        ])
+        await session.commit()
+        scream_id = scream.id
+
+    assert await _counters(scream_id) == (2, 1, 1, 0, 1)
+
+    async with TestingSessionLocal() as session:
+        reaction = await session.scalar(
+            Reaction.__table__.select()
+            .with_only_columns(Reaction.id)
+            .where(Reaction.scream_id == scream_id,
+                   Reaction.emoji == Emoji.FIRE)
+        )
+        await session.delete(await session.get(Reaction, reaction))
+        await session.commit()
+
+    assert await _counters(scream_id) == (1, 1, 0, 0, 1)
+
+
+async def test_rebuild_counters_repairs_drift():
+    """
+    The repair command recomputes counters from raw reactions.
+    """
+    author, fan = await make_user("author"), await make_user("d1")
+    async with TestingSessionLocal() as session:
+        scream = Scream(content="drifted", user_id=author)
+        session.add(scream)
+        await session.commit()
+        session.add(Reaction(scream_id=scream.id, emoji=Emoji.CLOWN,
+                             user_id=fan))
+        await session.commit()
+        await session.execute(
+            update(Scream).where(Scream.id == scream.id)
+            .values(votes=42, clown_count=0)
+        )
+        await session.commit()
+        scream_id = scream.id
+
+        await rebuild_counters(session)
+        await session.commit()
+
+    assert await _counters(scream_id) == (1, 0, 0, 1, 0)
@@ -0,0 +1,127 @@
+# Standard library
+from datetime import datetime, timezone
+
+# Third‑party
+from sqlalchemy import func, select
+
+# Local application
+from app_fastapi.models.activity import (
+    ActivityDaily,
+    ActivityHourly,
+    UserActivityDaily,
+)
+from app_fastapi.models.admin import Admin
+from app_fastapi.models.archive import Archive
+from app_fastapi.models.emoji import Emoji
+from app_fastapi.models.reaction import Reaction
+from app_fastapi.models.scream import Scream
+from app_fastapi.models.skip import Skip
+from app_fastapi.models.user_stats import UserStats
+from app_fastapi.tools.crypt import hash_user_id
+from app_fastapi.tools.deletes import delete_screams
+from app_fastapi.tools.time import day_bucket, epoch_seconds, hour_bucket
+from .conftest import TestingSessionLocal, make_user
+
+
+# A fixed day far from other tests' data.
+DAY = epoch_seconds(datetime(2002, 6, 12, 9, 15, tzinfo=timezone.utc))
+
+
+async def _seed(prefix: str, week_id: int, fans: int = 3):
+    """Post two screams of one author; fans react to and archive one."""
+    author = await make_user(f"{prefix}_author")
+    fan_ids = [await make_user(f"{prefix}_fan{n}") for n in range(fans)]
+    async with TestingSessionLocal() as session:
+        doomed = Scream(content="doomed", user_id=author, timestamp=DAY)
+        kept = Scream(content="kept", user_id=author, timestamp=DAY)
+        session.add_all([doomed, kept])
+        await session.commit()
+        emojis = [Emoji.FIRE, Emoji.SKULL, Emoji.FIRE]
+        session.add_all([
+            Reaction(scream_id=doomed.id, emoji=emojis[n % 3],
+                     user_id=fan, timestamp=DAY)
+            for n, fan in enumerate(fan_ids)
+        ])
+        session.add_all([
+            Reaction(scream_id=kept.id, emoji=Emoji.CLOWN,
+                     user_id=fan_ids[0], timestamp=DAY),
+            Skip(scream_id=doomed.id, user_id=author),
+            Archive(scream_id=doomed.id, week_id=week_id, place=1,
+                    content="doomed", votes=fans),
+        ])
+        await session.commit()
+    return author, fan_ids, doomed.id, kept.id
+
+
+async def test_set_based_delete_reverses_stats_and_rollups():
+    """
+    Deleting a scream subtracts exactly its share from stats and
+    rollups, as the per-row events would.
+    """
+    author, fans, doomed, _ = await _seed("setdel", 199901)
+    async with TestingSessionLocal() as session:
+        daily = await session.get(ActivityDaily, day_bucket(DAY))
+        before = (daily.screams, daily.reactions)
+
+        assert await delete_screams(session, [doomed]) == [doomed]
+        await session.commit()
+
+        stats = await session.get(UserStats, author, populate_existing=True)
+        assert (stats.screams_posted, stats.reactions_got) == (1, 1)
+        assert (stats.fire_got, stats.skull_got, stats.clown_got) == (0, 0, 1)
+        first = await session.get(UserStats, fans[0], populate_existing=True)
+        second = await session.get(UserStats, fans[1],
+                                   populate_existing=True)
+        assert (first.reactions_given, second.reactions_given) == (1, 0)
+
+        daily = await session.get(ActivityDaily, day_bucket(DAY),
+                                  populate_existing=True)
+        assert (daily.screams, daily.reactions) == (before[0] - 1,
+                                                    before[1] - 3)
+        hourly = await session.get(ActivityHourly, hour_bucket(DAY),
+                                   populate_existing=True)
+        assert (hourly.screams, hourly.reactions) == (daily.screams,
+                                                      daily.reactions)
+        fan_day = await session.get(UserActivityDaily,
+                                    (fans[1], day_bucket(DAY)),
+                                    populate_existing=True)
+        assert fan_day.reactions == 0
+
+
+async def test_set_based_delete_cascades_rows():
+    """
+    Deleting a scream removes its reactions and skips, detaches its
+    archive rows, and leaves other and unknown screams alone.
+    """
+    _, _, doomed, kept = await _seed("setdel_rows", 199907)
+    async with TestingSessionLocal() as session:
+        assert await delete_screams(session, [doomed, 10 ** 9]) == [doomed]
+        await session.commit()
+
+        for model in (Reaction, Skip):
+            assert await session.scalar(
+                select(func.count()).select_from(model)
+                .where(model.scream_id == doomed)
+            ) == 0
+        archive = await session.scalar(
+            select(Archive).where(Archive.week_id == 199907)
+        )
+        assert archive.scream_id is None
+        assert await session.get(Scream, kept) is not None
+
+
+async def test_delete_endpoint_uses_set_based_path(client):
+    """/delete removes a scream with reactions and 404s on unknown IDs."""
+    _, fans, doomed, _ = await _seed("setdel_api", 199902, fans=2)
+    admin = await make_user(hash_user_id("setdel_admin"))
+    async with TestingSessionLocal() as session:
+        session.add(Admin(user_id=admin))
+        await session.commit()
+
+    body = {"user_id": "setdel_admin", "scream_id": doomed}
+    assert client.post("/delete", json=body).json() == {"status": "deleted"}
+    assert client.post("/delete", json=body).status_code == 404
+
+    async with TestingSessionLocal() as session:
+        stats = await session.get(UserStats, fans[1])
+        assert stats.reactions_given == 0
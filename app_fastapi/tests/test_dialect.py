@@ -0,0 +1,45 @@
+# Third‑party
+import pytest
+from sqlalchemy import func, select
+
+# Local application
+from app_fastapi.models.user import User
+from app_fastapi.tools.dialect import dialect_insert, insert_ignore
+from .conftest import TestingSessionLocal
+
+
+async def test_insert_ignore_skips_existing_row():
+    """
+    A second insert of the same unique key is ignored, not an error.
+    """
+    async with TestingSessionLocal() as session:
+        first = await insert_ignore(session, User,
+                                    {"user_hash": "dialect_user"},
+                                    index_elements=["user_hash"])
+        second = await insert_ignore(session, User,
+                                     {"user_hash": "dialect_user"},
+                                     index_elements=["user_hash"])
+        await session.commit()
+        count = await session.scalar(
+            select(func.count(User.id))
+            .where(User.user_hash == "dialect_user")
+        )
+
+    assert first is True
+    assert second is False
+    assert count == 1
+
+
+def test_unsupported_dialect_rejected():
+    """
+    Databases without ON CONFLICT support raise NotImplementedError.
+    """
+    class FakeSession:
+        def get_bind(self):
+            class Bind:
+                class dialect:
+                    name = "mssql"
+            return Bind()
+
+    with pytest.raises(NotImplementedError):
+        dialect_insert(FakeSession(), User)
@@ -0,0 +1,63 @@
+# Third‑party
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+# Local application
+from app_fastapi.initializers.engine import (
+    apply_sqlite_profile,
+    create_read_engine,
+    get_sqlite_pragmas,
+)
+
+
+async def test_performance_profile_applied(tmp_path):
+    """
+    Every new connection should run with the performance PRAGMAs.
+    """
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'profile.db'}"
+    )
+    apply_sqlite_profile(engine, "performance")
+
+    async with engine.connect() as conn:
+        journal = await conn.scalar(text("PRAGMA journal_mode"))
+        synchronous = await conn.scalar(text("PRAGMA synchronous"))
+        foreign_keys = await conn.scalar(text("PRAGMA foreign_keys"))
+        temp_store = await conn.scalar(text("PRAGMA temp_store"))
+    await engine.dispose()
+
+    assert journal == "wal"
+    assert synchronous == 1
+    assert foreign_keys == 1
+    assert temp_store == 2
+
+
+def test_unknown_profile_rejected():
+    """
+    An unknown DB_PROFILE must fail loudly instead of being ignored.
+    """
+    with pytest.raises(ValueError):
+        get_sqlite_pragmas("turbo")
+
+
+async def test_read_engine_sees_writes_but_rejects_them(tmp_path):
+    """
+    The read-only pool must read committed data and refuse to write.
+    """
+    filename = str(tmp_path / "readers.db")
+    writer = create_async_engine(f"sqlite+aiosqlite:///{filename}")
+    apply_sqlite_profile(writer, "performance")
+    async with writer.begin() as conn:
+        await conn.execute(text("CREATE TABLE t (id INTEGER PRIMARY KEY)"))
+        await conn.execute(text("INSERT INTO t (id) VALUES (1)"))
+
+    reader = create_read_engine(filename, pool_size=2)
+    async with reader.connect() as conn:
+        assert await conn.scalar(text("SELECT count(*) FROM t")) == 1
+        with pytest.raises(OperationalError):
+            await conn.execute(text("INSERT INTO t (id) VALUES (2)"))
+
+    await reader.dispose()
+    await writer.dispose()
@@ -0,0 +1,192 @@
+# Standard library
+from datetime import datetime, timezone
+
+# Third‑party
+import pytest
+from sqlalchemy import select
+
+# Local application
+from app_fastapi.models.scream import Scream
+from app_fastapi.models.user_feed import UserFeedProgress
+from app_fastapi.tools import feed as feed_module
+from app_fastapi.tools.crypt import hash_user_id
+from app_fastapi.tools.feed import WeekFeed, week_feed
+from app_fastapi.tools.time import day_bucket, week_of_day
+from .conftest import TestingSessionLocal, make_user
+
+
+PAST = int(datetime(2024, 3, 5, tzinfo=timezone.utc).timestamp())
+PAST_WEEK = week_of_day(day_bucket(PAST))
+SYNC_PAST = int(datetime(2024, 4, 9, tzinfo=timezone.utc).timestamp())
+
+
+@pytest.fixture(autouse=True)
+def fresh_snapshot():
+    """Start every test with an empty week snapshot."""
+    week_feed.reset()
+    yield
+    week_feed.reset()
+
+
+def post_scream(client, user_id, content):
+    resp = client.post("/scream", json={"user_id": user_id,
+                                        "content": content})
+    assert resp.status_code == 200
+    return resp.json()["scream_id"]
+
+
+def react(client, user_id, scream_id, emoji):
+    resp = client.post("/react", json={"user_id": user_id,
+                                       "scream_id": scream_id,
+                                       "emoji": emoji})
+    assert resp.status_code == 200
+
+
+def test_feed_follows_cursor(client):
+    """
+    The feed serves screams after the reader's cursor in posting order,
+    skips the reader's own screams, and advances on reactions and skips.
+    """
+    older = post_scream(client, "feed_author", "older")
+    first = post_scream(client, "feed_author", "first")
+    post_scream(client, "feed_reader", "own")
+    second = post_scream(client, "feed_author", "second")
+
+    react(client, "feed_reader", first, "❌")
+    resp = client.get("/feed/feed_reader")
+    assert resp.status_code == 200
+    assert resp.json() == {"scream_id": second, "content": "second"}
+
+    react(client, "feed_reader", second, "🔥")
+    assert client.get("/feed/feed_reader").status_code == 404
+
+    # Reacting to an older scream does not move the cursor back.
+    react(client, "feed_reader", older, "💀")
+    assert client.get("/feed/feed_reader").status_code == 404
+
+    # A skip is stored apart from reactions but still counts as answered.
+    resp = client.post("/react", json={"user_id": "feed_reader",
+                                       "scream_id": first, "emoji": "🔥"})
+    assert resp.status_code == 409
+
+
+async def test_cursor_only_moves_forward(client):
+    """
+    The stored cursor is the highest scream ID the user reacted to.
+    """
+    first = post_scream(client, "cursor_author", "first")
+    second = post_scream(client, "cursor_author", "second")
+    react(client, "cursor_reader", second, "🔥")
+    react(client, "cursor_reader", first, "🔥")
+
+    user_id = await make_user(hash_user_id("cursor_reader"))
+    async with TestingSessionLocal() as session:
+        cursor = await session.scalar(
+            select(UserFeedProgress.last_seen_id)
+            .where(UserFeedProgress.user_id == user_id)
+        )
+    assert cursor == second
+
+
+def test_feed_batch(client):
+    """
+    A batch lists the screams after the cursor and after the client's
+    buffered position, in order and up to the limit.
+    """
+    ids = [post_scream(client, "batch_author", f"scream {i}")
+           for i in range(4)]
+    react(client, "batch_reader", ids[0], "❌")
+
+    resp = client.get("/feed/batch_reader/batch", params={"limit": 2})
+    assert resp.status_code == 200
+    assert [s["scream_id"] for s in resp.json()["screams"]] == ids[1:3]
+
+    resp = client.get("/feed/batch_reader/batch",
+                      params={"limit": 2, "after": ids[2]})
+    assert resp.json() == {"screams": [{"scream_id": ids[3],
+                                        "content": "scream 3"}]}
+
+    resp = client.get("/feed/batch_reader/batch", params={"limit": 0})
+    assert resp.status_code == 422
+
+
+async def test_week_snapshot_bit_scan(monkeypatch):
+    """
+    The snapshot loads the week once, then serves unseen screams from
+    memory, skipping own, seen and removed screams.
+    """
+    monkeypatch.setattr(feed_module, "current_week_id", lambda: PAST_WEEK)
+    author = await make_user("snapshot_author")
+    reader = await make_user("snapshot_reader")
+    async with TestingSessionLocal() as session:
+        screams = [Scream(content=f"s{i}", timestamp=PAST,
+                          user_id=reader if i == 1 else author)
+                   for i in range(4)]
+        session.add_all(screams)
+        await session.commit()
+        ids = [scream.id for scream in screams]
+
+        assert await week_feed.next_screams(session, reader, limit=10) == \
+            [(ids[0], "s0"), (ids[2], "s2"), (ids[3], "s3")]
+
+        week_feed.mark_seen(reader, ids[0])
+        week_feed.remove_scream(ids[2])
+        week_feed.add_scream(ids[3] + 100, author, "new")
+        assert await week_feed.next_screams(session, reader, limit=10) == \
+            [(ids[3], "s3"), (ids[3] + 100, "new")]
+        assert await week_feed.next_screams(session, reader,
+                                            after=ids[3]) == \
+            [(ids[3] + 100, "new")]
+
+
+async def test_week_snapshot_reloads_on_rollover(monkeypatch):
+    """
+    A new week, or screams reported out of ID order, trigger a reload.
+    """
+    week = {"id": PAST_WEEK}
+    monkeypatch.setattr(feed_module, "current_week_id", lambda: week["id"])
+    async with TestingSessionLocal() as session:
+        await week_feed.next_screams(session, None)
+        assert week_feed.week_id == PAST_WEEK
+
+        week_feed.add_scream(1, 1, "older than the snapshot")
+        assert week_feed.week_id is None
+
+        week["id"] = PAST_WEEK + 1
+        assert await week_feed.next_screams(session, None) == []
+        assert week_feed.week_id == PAST_WEEK + 1
+
+
+async def test_week_snapshot_syncs_with_other_replicas(monkeypatch):
+    """
+    A due sync picks up screams, deletions and cursors written by
+    another replica directly in the database.
+    """
+    week = week_of_day(day_bucket(SYNC_PAST))
+    monkeypatch.setattr(feed_module, "current_week_id", lambda: week)
+    now = {"t": 0.0}
+    feed = WeekFeed(sync_seconds=10, clock=lambda: now["t"])
+    author = await make_user("sync_author")
+    reader = await make_user("sync_reader")
+    async with TestingSessionLocal() as session:
+        first = Scream(content="first", timestamp=SYNC_PAST, user_id=author)
+        session.add(first)
+        await session.commit()
+        assert await feed.next_screams(session, reader) == \
+            [(first.id, "first")]
+
+        second = Scream(content="second", timestamp=SYNC_PAST,
+                        user_id=author)
+        third = Scream(content="third", timestamp=SYNC_PAST,
+                       user_id=author)
+        session.add_all([second, third])
+        session.add(UserFeedProgress(user_id=reader, last_seen_id=first.id))
+        await session.commit()
+        await session.delete(second)
+        await session.commit()
+        assert await feed.next_screams(session, reader) == \
+            [(first.id, "first")]
+
+        now["t"] = 10.0
+        assert await feed.next_screams(session, reader, limit=5) == \
+            [(third.id, "third")]
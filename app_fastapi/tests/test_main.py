@@ -18,7 +18,7 @@ async def test_scheduler_startup():
             await startup()
         # Ensure scheduler is started
         mock_scheduler.assert_called_once()
-        mock_scheduler.return_value.add_job.assert_called_once()
+        assert mock_scheduler.return_value.add_job.call_count == 2
         mock_scheduler.return_value.start.assert_called_once()
 
 
@@ -0,0 +1,156 @@
+# Standard library
+from unittest.mock import patch
+
+# Third‑party
+import pytest
+from sqlalchemy import inspect, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+# Local application
+from app_fastapi.initializers import migration
+from app_fastapi.initializers.engine import apply_sqlite_profile
+from app_fastapi.initializers.migration import (
+    add_missing_columns,
+    create_missing_indexes,
+)
+from app_fastapi.models import Base
+
+
+async def test_indexes_added_to_existing_tables():
+    """
+    Tables created before the indexes were declared must receive them.
+    """
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.execute(text(
+            "CREATE TABLE screams (id INTEGER PRIMARY KEY, content VARCHAR, "
+            "timestamp INTEGER, "
+            "day_id INTEGER GENERATED ALWAYS AS (timestamp / 86400) STORED, "
+            "week_id INTEGER GENERATED ALWAYS AS "
+            "((timestamp / 86400 + 3) / 7) STORED, "
+            "user_id INTEGER, meme_url VARCHAR, moderated BOOLEAN)"
+        ))
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(add_missing_columns)
+        await conn.run_sync(create_missing_indexes)
+
+        names = await conn.run_sync(
+            lambda c: {i["name"] for i in inspect(c).get_indexes("screams")}
+        )
+    await engine.dispose()
+
+    assert {"ix_screams_day_id_votes", "ix_screams_week_id_id",
+            "ix_screams_user_id_timestamp"} <= names
+
+
+async def test_legacy_database_upgraded():
+    """
+    A database storing user hashes and DATETIME timestamps is moved to
+    integer user IDs and epoch seconds, keeps every row, and gains scream
+    counters computed from its reactions; emojis become registry codes,
+    ❌ reactions become skips and archive rows get snapshots.
+    """
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    apply_sqlite_profile(engine, "performance")
+    async with engine.begin() as conn:
+        await conn.execute(text(
+            "CREATE TABLE screams (id INTEGER PRIMARY KEY, content VARCHAR, "
+            "timestamp DATETIME, user_hash VARCHAR, meme_url VARCHAR, "
+            "moderated BOOLEAN)"
+        ))
+        await conn.execute(text(
+            "CREATE INDEX ix_screams_timestamp ON screams (timestamp)"
+        ))
+        await conn.execute(text(
+            "CREATE TABLE reactions (id INTEGER PRIMARY KEY, emoji VARCHAR, "
+            "timestamp DATETIME, scream_id INTEGER REFERENCES screams(id) "
+            "ON DELETE CASCADE, user_hash VARCHAR)"
+        ))
+        await conn.execute(text(
+            "CREATE TABLE archives (id INTEGER PRIMARY KEY, "
+            "scream_id INTEGER REFERENCES screams(id) ON DELETE CASCADE, "
+            "week_id INTEGER NOT NULL, place INTEGER NOT NULL)"
+        ))
+        await conn.execute(text(
+            "INSERT INTO screams (id, content, timestamp, user_hash, "
+            "moderated) VALUES (1, 'old', '2025-05-05 10:00:00', 'author', 0)"
+        ))
+        await conn.execute(text(
+            "INSERT INTO archives (scream_id, week_id, place) "
+            "VALUES (1, 202519, 1)"
+        ))
+        await conn.execute(text(
+            "INSERT INTO reactions (emoji, timestamp, scream_id, user_hash) "
+            "VALUES ('🔥', '2025-05-05 11:00:00', 1, 'a'), "
+            "('❌', '2025-05-05 11:00:00', 1, 'b')"
+        ))
+
+    with patch.object(migration, "engine", engine):
+        await migration.init_db()
+
+    async with engine.connect() as conn:
+        row = (await conn.execute(text(
+            "SELECT votes, fire_count, skip_count, users.user_hash, "
+            "timestamp, day_id, week_id "
+            "FROM screams JOIN users ON users.id = screams.user_id"
+        ))).one()
+        reactions = await conn.scalar(text("SELECT count(*) FROM reactions"))
+        skips = await conn.scalar(text("SELECT count(*) FROM skips"))
+        archive = (await conn.execute(text(
+            "SELECT content, votes FROM archives"
+        ))).one()
+        await conn.execute(text("DELETE FROM screams"))
+        orphaned = await conn.scalar(text("SELECT scream_id FROM archives"))
+        violations = (await conn.execute(
+            text("PRAGMA foreign_key_check")
+        )).all()
+    await engine.dispose()
+
+    assert tuple(row) == (1, 1, 1, "author", 1746439200, 20213, 2888)
+    assert reactions == 1
+    assert skips == 1
+    assert tuple(archive) == ("old", 1)
+    assert orphaned is None
+    assert violations == []
+
+
+async def test_legacy_migration_refuses_unknown_emojis():
+    """
+    Reactions with emojis outside the registry abort the migration with
+    the offending values listed, and the legacy tables stay untouched.
+    """
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.execute(text(
+            "CREATE TABLE screams (id INTEGER PRIMARY KEY, content VARCHAR, "
+            "timestamp DATETIME, user_hash VARCHAR, meme_url VARCHAR, "
+            "moderated BOOLEAN)"
+        ))
+        await conn.execute(text(
+            "CREATE TABLE reactions (id INTEGER PRIMARY KEY, emoji VARCHAR, "
+            "timestamp DATETIME, scream_id INTEGER, user_hash VARCHAR)"
+        ))
+        await conn.execute(text(
+            "INSERT INTO screams (id, content, timestamp, user_hash, "
+            "moderated) VALUES (1, 'old', '2025-05-05 10:00:00', 'author', 0)"
+        ))
+        await conn.execute(text(
+            "INSERT INTO reactions (emoji, timestamp, scream_id, user_hash) "
+            "VALUES ('🔥', '2025-05-05 11:00:00', 1, 'a'), "
+            "('👍', '2025-05-05 11:00:00', 1, 'b'), "
+            "('👍', '2025-05-05 11:00:00', 1, 'c')"
+        ))
+
+    with patch.object(migration, "engine", engine), \
+            pytest.raises(ValueError, match="reactions.emoji='👍' \\(2 rows"):
+        await migration.init_db()
+
+    async with engine.connect() as conn:
+        columns = await conn.run_sync(
+            lambda c: {i["name"] for i in inspect(c).get_columns("screams")}
+        )
+        reactions = await conn.scalar(text("SELECT count(*) FROM reactions"))
+    await engine.dispose()
+
+    assert "user_hash" in columns
+    assert reactions == 3
@@ -0,0 +1,171 @@
+# Standard library
+from datetime import datetime, timezone
+
+# Third‑party
+import pytest
+from sqlalchemy import delete
+
+# Local application
+from app_fastapi.api import endpoints
+from app_fastapi.models.admin import Admin
+from app_fastapi.models.scream import Scream
+from app_fastapi.tools.crypt import hash_user_id
+from app_fastapi.tools.moderation import (
+    LEASE_SECONDS,
+    claim_batch,
+    count_available,
+)
+from app_fastapi.tools.time import day_bucket, epoch_seconds, week_of_day
+from .conftest import TestingSessionLocal, make_user
+
+
+QUEUE_TIME = int(datetime(2023, 8, 16, tzinfo=timezone.utc).timestamp())
+QUEUE_WEEK = week_of_day(day_bucket(QUEUE_TIME))
+
+
+@pytest.fixture
+async def queue(monkeypatch):
+    """Seed five unmoderated screams and one reviewed in a past week."""
+    monkeypatch.setattr(endpoints, "current_week_id", lambda: QUEUE_WEEK)
+    author = await make_user(hash_user_id("queue_author"))
+    admin = await make_user(hash_user_id("queue_admin"))
+    async with TestingSessionLocal() as session:
+        await session.execute(
+            delete(Scream).where(Scream.week_id == QUEUE_WEEK)
+        )
+        await session.execute(delete(Admin).where(Admin.user_id == admin))
+        session.add(Admin(user_id=admin))
+        screams = [
+            Scream(content=f"queued {n}", user_id=author,
+                   timestamp=QUEUE_TIME, moderated=n == 2)
+            for n in range(6)
+        ]
+        session.add_all(screams)
+        await session.commit()
+        return [scream.id for scream in screams if not scream.moderated]
+
+
+def page(client, **cursor):
+    resp = client.post("/screams/admin",
+                       json={"user_id": "queue_admin", **cursor})
+    assert resp.status_code == 200
+    body = resp.json()
+    return [s["scream_id"] for s in body["screams"]], body["total"]
+
+
+def test_moderation_pages_by_keyset(client, queue):
+    """Pages walk the unmoderated screams forward and backward by ID."""
+    assert page(client, limit=2) == (queue[:2], 5)
+    assert page(client, limit=2, after_id=queue[1]) == (queue[2:4], 5)
+    assert page(client, limit=2, after_id=queue[-1]) == ([], 5)
+    assert page(client, limit=2, before_id=queue[3]) == (queue[1:3], 5)
+
+
+def test_moderation_queue_empty(client, queue, monkeypatch):
+    """A week without unmoderated screams is reported as 404."""
+    monkeypatch.setattr(endpoints, "current_week_id",
+                        lambda: QUEUE_WEEK + 1)
+    resp = client.post("/screams/admin", json={"user_id": "queue_admin"})
+    assert resp.status_code == 404
+
+
+def test_moderation_page_limit(client, queue):
+    """Page sizes above the maximum are rejected."""
+    resp = client.post("/screams/admin",
+                       json={"user_id": "queue_admin", "limit": 1000})
+    assert resp.status_code == 422
+
+
+async def test_bulk_moderation(client, queue):
+    """
+    One request confirms and deletes many screams, skipping unknowns,
+    and releases the leases of the confirmed ones.
+    """
+    assert page(client) == (queue, 5)
+    resp = client.post("/moderate", json={
+        "user_id": "queue_admin",
+        "confirm": [queue[0], queue[1]],
+        "delete": [queue[2], 10 ** 9],
+    })
+    assert resp.status_code == 200
+    assert resp.json() == {"confirmed": queue[:2], "deleted": [queue[2]]}
+
+    async with TestingSessionLocal() as session:
+        assert await session.get(Scream, queue[2]) is None
+        confirmed = await session.get(Scream, queue[0])
+        assert confirmed.moderated
+        assert (confirmed.claimed_by, confirmed.lease_expires) == (None, None)
+    assert page(client) == (queue[3:], 2)
+
+
+def test_bulk_moderation_rejects_conflicts(client, queue):
+    """A scream cannot be both confirmed and deleted."""
+    resp = client.post("/moderate", json={
+        "user_id": "queue_admin", "confirm": [queue[0]], "delete": [queue[0]]
+    })
+    assert resp.status_code == 422
+
+
+def test_bulk_moderation_requires_admin(client, queue):
+    resp = client.post("/moderate", json={"user_id": "queue_author",
+                                          "confirm": [queue[0]]})
+    assert resp.status_code == 403
+
+
+async def test_admins_claim_disjoint_batches(client, queue):
+    """Concurrent admins get disjoint batches until a lease lapses."""
+    other = await make_user(hash_user_id("queue_admin_2"))
+    async with TestingSessionLocal() as session:
+        await session.execute(delete(Admin).where(Admin.user_id == other))
+        session.add(Admin(user_id=other))
+        await session.commit()
+
+    assert page(client, limit=2) == (queue[:2], 5)
+    resp = client.post("/screams/admin",
+                       json={"user_id": "queue_admin_2", "limit": 2})
+    body = resp.json()
+    assert [s["scream_id"] for s in body["screams"]] == queue[2:4]
+    assert body["total"] == 3
+
+    # The first admin's next batch skips the second admin's lease.
+    assert page(client, limit=2, after_id=queue[1]) == (queue[4:], 3)
+
+    lapsed = epoch_seconds() + LEASE_SECONDS + 60
+    async with TestingSessionLocal() as session:
+        admin = await make_user(hash_user_id("queue_admin"))
+        assert await count_available(session, admin, QUEUE_WEEK,
+                                     now=lapsed) == 5
+        batch = await claim_batch(session, admin, QUEUE_WEEK, 2,
+                                  now=lapsed)
+        assert [row[0] for row in batch] == queue[:2]
+        await session.commit()
+
+
+async def test_moderation_respects_other_admins_leases(client, queue):
+    """Screams leased to another admin are rejected or skipped."""
+    other = await make_user(hash_user_id("queue_admin_3"))
+    async with TestingSessionLocal() as session:
+        await session.execute(delete(Admin).where(Admin.user_id == other))
+        session.add(Admin(user_id=other))
+        await session.commit()
+    resp = client.post("/screams/admin",
+                       json={"user_id": "queue_admin_3", "limit": 2})
+    assert resp.status_code == 200
+
+    for path in ("/confirm", "/delete"):
+        resp = client.post(path, json={"user_id": "queue_admin",
+                                       "scream_id": queue[0]})
+        assert resp.status_code == 409
+    resp = client.post("/moderate", json={
+        "user_id": "queue_admin",
+        "confirm": [queue[0], queue[2]],
+        "delete": [queue[1], queue[3]],
+    })
+    assert resp.json() == {"confirmed": [queue[2]], "deleted": [queue[3]]}
+
+    resp = client.post("/confirm", json={"user_id": "queue_admin_3",
+                                         "scream_id": queue[0]})
+    assert resp.status_code == 200
+    async with TestingSessionLocal() as session:
+        confirmed = await session.get(Scream, queue[0])
+        assert (confirmed.claimed_by, confirmed.lease_expires) == (None, None)
@@ -6,10 +6,11 @@ import pytest
 from sqlalchemy import select
 
 # Local application
+from app_fastapi.models.emoji import Emoji
 from app_fastapi.models.scream import Scream
 from app_fastapi.models.reaction import Reaction
 from app_fastapi.tools.crypt import hash_user_id
-from .conftest import TestingSessionLocal
+from .conftest import TestingSessionLocal, make_user
 
 
 @pytest.mark.parametrize("missing_id", [999, 123456])
@@ -20,7 +21,7 @@ def test_react_not_found(client, missing_id):
     """
     resp = client.post(
         "/react",
-        json={"user_id": "user1", "scream_id": missing_id, "emoji": "👍"}
+        json={"user_id": "user1", "scream_id": missing_id, "emoji": "🔥"}
     )
     assert resp.status_code == 404
     assert resp.json()["detail"] == "Scream not found"
@@ -36,10 +37,11 @@ def test_react_success_and_duplicate(client):
         Seed a scream in the database, perform a reaction, verify persistence,
         then test duplicate rejection.
         """
+        author_id = await make_user(hash_user_id("author"))
         async with TestingSessionLocal() as session:
             scream = Scream(
                 content="Test Scream",
-                user_hash=hash_user_id("author")
+                user_id=author_id
             )
             session.add(scream)
             await session.commit()
@@ -47,7 +49,7 @@ def test_react_success_and_duplicate(client):
 
         r1 = client.post(
             "/react",
-            json={"user_id": "reactor", "scream_id": scream_id, "emoji": "🎉"}
+            json={"user_id": "reactor", "scream_id": scream_id, "emoji": "🤡"}
         )
         assert r1.status_code == 200
         assert r1.json()["status"] == "ok"
@@ -56,16 +58,18 @@ def test_react_success_and_duplicate(client):
             result = await session.execute(
                 select(Reaction).where(
                     Reaction.scream_id == scream_id,
-                    Reaction.user_hash == hash_user_id("reactor")
+                    Reaction.user_id == await make_user(
+                        hash_user_id("reactor")
+                    )
                 )
             )
             react_obj = result.scalar_one_or_none()
             assert react_obj is not None
-            assert react_obj.emoji == "🎉"
+            assert react_obj.emoji is Emoji.CLOWN
 
         r2 = client.post(
             "/react",
-            json={"user_id": "reactor", "scream_id": scream_id, "emoji": "🎉"}
+            json={"user_id": "reactor", "scream_id": scream_id, "emoji": "🤡"}
         )
         assert r2.status_code == 409
         assert r2.json()["detail"] == "Already reacted"
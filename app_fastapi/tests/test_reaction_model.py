@@ -5,6 +5,7 @@ from datetime import datetime, timezone
 import pytest
 
 # Local application
+from app_fastapi.models.emoji import Emoji
 from app_fastapi.models.reaction import Reaction
 
 
@@ -13,9 +14,9 @@ def example_reaction():
     """
     Create a Reaction instance with fixed attributes for repr/str testing.
     """
-    r = Reaction(emoji="🔥", scream_id=7, user_hash="deadbeef")
+    r = Reaction(emoji=Emoji.FIRE, scream_id=7, user_id=3)
     r.id = 99
-    r.timestamp = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    r.timestamp = int(datetime(2025, 1, 1, tzinfo=timezone.utc).timestamp())
     return r
 
 
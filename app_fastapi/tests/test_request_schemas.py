@@ -6,12 +6,15 @@ import pytest
 from pydantic import ValidationError
 
 # Local application
+from app_fastapi.models.emoji import Emoji
 from app_fastapi.schemas.requests import (
     CreateScreamRequest,
     CreateAdminRequest,
     GetIdRequest,
     ReactionRequest,
     DeleteRequest,
+    ModerateRequest,
+    ModerationRequest,
     UserRequest,
 )
 
@@ -64,12 +67,20 @@ def test_reaction_request_and_repr(caplog):
     repr abbreviates user_id.
     """
     caplog.set_level("DEBUG", logger="app_fastapi.schemas")
-    req = ReactionRequest(scream_id=5, emoji="👍", user_id="reactorXYZ")
+    req = ReactionRequest(scream_id=5, emoji="💀", user_id="reactorXYZ")
     assert req.scream_id == 5
-    assert req.emoji == "👍"
+    assert req.emoji is Emoji.SKULL
     assert "<ReactionRequest(user=" in repr(req)
 
 
+def test_reaction_request_rejects_unknown_emoji():
+    """
+    Emojis outside the registry are rejected at the API boundary.
+    """
+    with pytest.raises(ValidationError):
+        ReactionRequest(scream_id=5, emoji="👍", user_id="reactorXYZ")
+
+
 def test_delete_request_and_repr(caplog):
     """
     DeleteRequest should require scream_id and user_id;
@@ -89,3 +100,29 @@ def test_user_request_and_repr(caplog):
     req = UserRequest(user_id="somebody")
     assert req.user_id == "somebody"
     assert "<UserRequest(user=" in repr(req)
+
+
+def test_moderation_request_defaults_and_bounds(caplog):
+    """
+    ModerationRequest starts at the head of the queue and bounds limit.
+    """
+    caplog.set_level("DEBUG", logger="app_fastapi.schemas")
+    req = ModerationRequest(user_id="moderator")
+    assert (req.after_id, req.before_id, req.limit) == (0, None, 10)
+    assert "<ModerationRequest(user=" in repr(req)
+    with pytest.raises(ValidationError):
+        ModerationRequest(user_id="moderator", limit=0)
+    with pytest.raises(ValidationError):
+        ModerationRequest(user_id="moderator", after_id=-1)
+
+
+def test_moderate_request_disjoint(caplog):
+    """
+    ModerateRequest defaults to empty lists and rejects overlapping IDs.
+    """
+    caplog.set_level("DEBUG", logger="app_fastapi.schemas")
+    req = ModerateRequest(user_id="moderator", delete=[3])
+    assert (req.confirm, req.delete) == ([], [3])
+    assert "confirm=0, delete=1" in repr(req)
+    with pytest.raises(ValidationError):
+        ModerateRequest(user_id="moderator", confirm=[1, 2], delete=[2])
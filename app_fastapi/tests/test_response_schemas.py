@@ -14,6 +14,9 @@ from app_fastapi.schemas.responses import (
     DeleteResponse,
     StressStatsResponse,
     ScreamResponse,
+    ModerationPageResponse,
+    ModerateResponse,
+    CacheStatsResponse,
 )
 
 logger = logging.getLogger("app_fastapi.schemas")
@@ -130,3 +133,33 @@ def test_scream_response_repr(caplog):
     caplog.set_level("DEBUG", logger="app_fastapi.schemas")
     r = ScreamResponse(scream_id=99, content="hello")
     assert repr(r) == "<ScreamResponse(99)>"
+
+
+def test_moderation_page_response_repr(caplog):
+    """
+    ModerationPageResponse repr shows the page size and queue total.
+    """
+    caplog.set_level("DEBUG", logger="app_fastapi.schemas")
+    r = ModerationPageResponse(
+        screams=[ScreamResponse(scream_id=1, content="x")], total=12
+    )
+    assert repr(r) == "<ModerationPageResponse(1 of 12)>"
+
+
+def test_moderate_response_repr(caplog):
+    """
+    ModerateResponse repr counts confirmed and deleted screams.
+    """
+    caplog.set_level("DEBUG", logger="app_fastapi.schemas")
+    r = ModerateResponse(confirmed=[1, 2], deleted=[3])
+    assert repr(r) == "<ModerateResponse(2 confirmed, 1 deleted)>"
+
+
+def test_cache_stats_response_repr(caplog):
+    """
+    CacheStatsResponse repr shows hits and misses.
+    """
+    caplog.set_level("DEBUG", logger="app_fastapi.schemas")
+    r = CacheStatsResponse(hits=3, stale_hits=0, misses=1, coalesced=2,
+                           evictions=0, entries=1)
+    assert repr(r) == "<CacheStatsResponse(3 hits, 1 misses)>"
@@ -0,0 +1,91 @@
+# Standard library
+from datetime import datetime, timezone
+
+# Third‑party
+from sqlalchemy import delete
+
+# Local application
+from app_fastapi.models.activity import (
+    ActivityDaily,
+    ActivityHourly,
+    UserActivityDaily,
+)
+from app_fastapi.models.emoji import Emoji
+from app_fastapi.models.reaction import Reaction
+from app_fastapi.models.scream import Scream
+from app_fastapi.models.skip import Skip
+from app_fastapi.tools.rollups import daily_screams, rebuild_rollups
+from app_fastapi.tools.time import (
+    SECONDS_PER_DAY,
+    day_bucket,
+    epoch_seconds,
+    hour_bucket,
+)
+from .conftest import TestingSessionLocal, make_user
+
+
+# A fixed day far from other tests' data.
+DAY = epoch_seconds(datetime(2001, 3, 5, 10, 30, tzinfo=timezone.utc))
+
+
+async def test_rollups_follow_writes():
+    """
+    Screams and non-skip reactions increment the hourly and daily rows.
+    """
+    author = await make_user("roll_u")
+    fans = [await make_user("r1"), await make_user("r2")]
+    async with TestingSessionLocal() as session:
+        scream = Scream(content="busy", user_id=author, timestamp=DAY)
+        session.add(scream)
+        session.add(Scream(content="later", user_id=author,
+                           timestamp=DAY + 2 * SECONDS_PER_DAY))
+        await session.commit()
+        session.add_all([
+            Reaction(scream_id=scream.id, emoji=Emoji.FIRE, user_id=fans[0],
+                     timestamp=DAY),
+            Skip(scream_id=scream.id, user_id=fans[1]),
+        ])
+        await session.commit()
+
+        daily = await session.get(ActivityDaily, day_bucket(DAY))
+        hourly = await session.get(ActivityHourly, hour_bucket(DAY))
+        user_days = await daily_screams(session, day_bucket(DAY), 3,
+                                        user_id=author)
+
+    assert (daily.screams, daily.reactions) == (1, 1)
+    assert (hourly.screams, hourly.reactions) == (1, 1)
+    assert user_days == [1, 0, 1]
+
+
+async def test_rebuild_rollups_from_raw_rows():
+    """
+    The backfill recreates rollups that were lost or never written,
+    bucketing screams and reactions by hour, day and user in SQL.
+    """
+    day = DAY + 30 * SECONDS_PER_DAY
+    author = await make_user("raw_u")
+    fan = await make_user("raw_fan")
+    async with TestingSessionLocal() as session:
+        scream = Scream(content="raw", user_id=author, timestamp=day)
+        session.add(scream)
+        await session.commit()
+        session.add(Reaction(scream_id=scream.id, emoji=Emoji.FIRE,
+                             user_id=fan, timestamp=day + SECONDS_PER_DAY))
+        await session.commit()
+        for model in (ActivityDaily, ActivityHourly, UserActivityDaily):
+            await session.execute(delete(model))
+        await session.commit()
+
+        await rebuild_rollups(session)
+        await session.commit()
+
+        counts = await daily_screams(session, day_bucket(day), 1)
+        later = await session.get(ActivityDaily, day_bucket(day) + 1)
+        hourly = await session.get(ActivityHourly, hour_bucket(day))
+        fan_day = await session.get(UserActivityDaily,
+                                    (fan, day_bucket(day) + 1))
+
+    assert counts == [1]
+    assert (later.screams, later.reactions) == (0, 1)
+    assert (hourly.screams, hourly.reactions) == (1, 0)
+    assert (fan_day.screams, fan_day.reactions) == (0, 1)
@@ -11,14 +11,14 @@ from app_fastapi.models.scream import Scream
 @pytest.fixture
 def example_scream():
     """
-    Return a Scream instance with known values for id, content, and user_hash.
+    Return a Scream instance with known values for id, content, and user_id.
     """
     s = Scream(
         content="This is a test scream content",
-        user_hash="abcdef123456")
+        user_id=5)
 
     s.id = 99
-    s.timestamp = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    s.timestamp = int(datetime(2025, 1, 1, tzinfo=timezone.utc).timestamp())
     return s
 
 
@@ -35,7 +35,7 @@ def test_str(example_scream, caplog):
 
 def test_repr(example_scream, caplog):
     """
-    __repr__ should include id, truncated content, and user hash prefix;
+    __repr__ should include id, truncated content, and user id;
     """
     caplog.set_level("DEBUG", logger="app_fastapi.models")
 
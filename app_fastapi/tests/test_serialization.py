@@ -0,0 +1,40 @@
+# Local application
+from app_fastapi.models.archive import Archive
+from app_fastapi.schemas.responses import TopScreamItem
+from app_fastapi.tools.serialization import GZIP_MINIMUM_SIZE, FastJSONResponse
+from .conftest import TestingSessionLocal
+
+
+def test_fast_json_response_renders_compact_utf8():
+    """Dicts and models are encoded compactly, without escaping text."""
+    resp = FastJSONResponse({
+        "posts": [TopScreamItem(id=1, content="крик 😱", votes=2,
+                                meme_url=None)],
+    })
+    assert resp.body == ('{"posts":[{"id":1,"content":"крик 😱",'
+                         '"votes":2,"meme_url":null}]}').encode()
+    assert resp.media_type == "application/json"
+
+
+async def test_large_responses_are_gzipped_on_request(client):
+    """Bodies above the threshold are compressed when clients accept it."""
+    async with TestingSessionLocal() as session:
+        session.add_all([
+            Archive(week_id=199905, place=place, content="x" * 40, votes=1)
+            for place in range(1, 41)
+        ])
+        await session.commit()
+
+    plain = client.get("/history/199905",
+                       headers={"Accept-Encoding": "identity"})
+    assert len(plain.content) > GZIP_MINIMUM_SIZE
+    assert "content-encoding" not in plain.headers
+
+    packed = client.get("/history/199905",
+                        headers={"Accept-Encoding": "gzip"})
+    assert packed.headers["content-encoding"] == "gzip"
+    assert int(packed.headers["content-length"]) < len(plain.content)
+    assert packed.json() == plain.json()
+
+    small = client.get("/history", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
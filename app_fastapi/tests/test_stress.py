@@ -5,7 +5,7 @@ from fastapi.testclient import TestClient
 
 from app_fastapi.main import app
 from app_fastapi.models.scream import Scream
-from app_fastapi.tests.conftest import TestingSessionLocal
+from app_fastapi.tests.conftest import TestingSessionLocal, make_user
 
 client = TestClient(app)
 
@@ -20,8 +20,8 @@ async def test_get_weekly_stress_graph_all():
             ts = week_ago + timedelta(days=i)
             scream = Scream(
                 content=f"s{i}",
-                user_hash=f"u{i}",
-                timestamp=ts
+                user_id=await make_user(f"u{i}"),
+                timestamp=int(ts.timestamp())
             )
             session.add(scream)
         await session.commit()
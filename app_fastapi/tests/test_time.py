@@ -6,7 +6,12 @@ import pytest
 
 # Local application
 import app_fastapi.tools.time as time_module
-from app_fastapi.tools.time import get_bounds, get_week_start
+from app_fastapi.tools.time import (
+    current_day_id,
+    current_week_id,
+    day_label,
+    epoch_seconds,
+)
 
 
 class FakeDateTime(real_datetime):
@@ -32,83 +37,27 @@ def reset_module_datetime(monkeypatch):
     FakeDateTime.now = _original_fake_now
 
 
-def test_get_bounds_addition_true(monkeypatch):
+def test_current_week_starts_on_monday(monkeypatch):
     """
-    get_bounds should return today’s
-    midnight and midnight plus days when addition=True.
+    current_week_id should change at Monday midnight UTC, not on the
+    Thursday the epoch started on.
     """
-    fixed = real_datetime(2025, 5, 3, 15, 30, tzinfo=timezone.utc)
-    FakeDateTime._fixed_now = fixed
+    sunday = real_datetime(2025, 5, 4, 23, 59, tzinfo=timezone.utc)
+    FakeDateTime._fixed_now = sunday
     monkeypatch.setattr(time_module, "datetime", FakeDateTime)
+    previous = current_week_id()
 
-    start, end = get_bounds(days=2, addition=True)
-    expected_start = real_datetime(2025, 5, 3, 0, 0, tzinfo=timezone.utc)
-    expected_end = expected_start + timedelta(days=2)
-    assert start == expected_start
-    assert end == expected_end
+    FakeDateTime._fixed_now = sunday + timedelta(minutes=1)
+    assert current_week_id() == previous + 1
+    assert day_label(current_day_id()) == "Mon"
 
 
-def test_get_bounds_addition_false(monkeypatch):
-    """
-    get_bounds should return today’s
-    midnight and midnight minus days when addition=False.
-    """
-    fixed = real_datetime(2025, 5, 3, 9, 0, tzinfo=timezone.utc)
-    FakeDateTime._fixed_now = fixed
-    monkeypatch.setattr(time_module, "datetime", FakeDateTime)
-
-    start, end = get_bounds(days=5, addition=False)
-    expected_start = real_datetime(2025, 5, 3, 0, 0, tzinfo=timezone.utc)
-    expected_end = expected_start - timedelta(days=5)
-    assert start == expected_start
-    assert end == expected_end
-
-
-def test_get_bounds_exception(monkeypatch, caplog):
-    """
-    get_bounds should log an error and re‑raise if datetime.now() fails.
-    """
-    class Boom(Exception):
-        pass
-
-    def boom_now(cls, tz=None):
-        raise Boom("fail")
-
-    FakeDateTime.now = classmethod(boom_now)
-    monkeypatch.setattr(time_module, "datetime", FakeDateTime)
-    caplog.set_level("ERROR", logger="app_fastapi.tools")
-
-    with pytest.raises(Boom):
-        get_bounds()
-
-    assert "Failed to calculate time bounds" in caplog.text
-
-
-def test_get_week_start_monday(monkeypatch):
-    """
-    get_week_start should return Monday midnight when today is mid‑week.
-    """
-    fixed = real_datetime(2025, 5, 7, 14, 0, tzinfo=timezone.utc)
-    FakeDateTime._fixed_now = fixed
-    monkeypatch.setattr(time_module, "datetime", FakeDateTime)
-
-    ws = get_week_start()
-    assert ws == real_datetime(2025, 5, 5, 0, 0, tzinfo=timezone.utc)
-
-
-@pytest.mark.parametrize("weekday, expected_date", [
-    (0, "2025-05-05"),
-    (6, "2025-05-05"),
+@pytest.mark.parametrize("ts, expected", [
+    (real_datetime(1970, 1, 1, 1), 3600),
+    (real_datetime(1970, 1, 2, tzinfo=timezone.utc), 86400),
 ])
-def test_get_week_start_various(monkeypatch, weekday, expected_date):
+def test_epoch_seconds_treats_naive_as_utc(ts, expected):
     """
-    get_week_start should always roll back to the Monday of the current week.
+    epoch_seconds should read naive datetimes as UTC.
     """
-    base = real_datetime(2025, 5, 5, tzinfo=timezone.utc)
-    fixed = base + timedelta(days=weekday, hours=18)
-    FakeDateTime._fixed_now = fixed
-    monkeypatch.setattr(time_module, "datetime", FakeDateTime)
-
-    ws = get_week_start()
-    assert ws.date().isoformat() == expected_date
-    assert (ws.hour, ws.minute, ws.second) == (0, 0, 0)
+    assert epoch_seconds(ts) == expected
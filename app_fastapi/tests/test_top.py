@@ -3,8 +3,8 @@ from fastapi.testclient import TestClient
 
 from app_fastapi.main import app
 from app_fastapi.models.scream import Scream
-from app_fastapi.models.reaction import Reaction
-from .conftest import TestingSessionLocal
+from app_fastapi.models.skip import Skip
+from .conftest import TestingSessionLocal, make_user
 
 client = TestClient(app)
 
@@ -23,11 +23,12 @@ async def test_top_excludes_negative(monkeypatch):
         "app_fastapi.api.endpoints.generate_meme_url", fake_gen
         )
 
+    user_id = await make_user("u0")
     async with TestingSessionLocal() as session:
-        s = Scream(content="neg", user_hash="u0")
+        s = Scream(content="neg", user_id=user_id)
         session.add(s)
         await session.commit()
-        session.add(Reaction(scream_id=s.id, emoji="❌", user_hash="u0"))
+        session.add(Skip(scream_id=s.id, user_id=user_id))
         await session.commit()
 
     resp = client.get("/top")
@@ -0,0 +1,93 @@
+# Third‑party
+from sqlalchemy import delete
+
+# Local application
+from app_fastapi.models.emoji import Emoji
+from app_fastapi.models.reaction import Reaction
+from app_fastapi.models.scream import Scream
+from app_fastapi.models.skip import Skip
+from app_fastapi.models.user_stats import UserStats
+from app_fastapi.tools.crypt import hash_user_id
+from app_fastapi.tools.user_stats import rebuild_user_stats
+from .conftest import TestingSessionLocal, make_user
+
+
+async def _seed(author, fan):
+    author_id = await make_user(author)
+    fan_id = await make_user(fan)
+    skipper_id = await make_user(fan + "_skip")
+    async with TestingSessionLocal() as session:
+        scream = Scream(content="stats", user_id=author_id)
+        session.add(scream)
+        await session.commit()
+        session.add_all([
+            Reaction(scream_id=scream.id, emoji=Emoji.FIRE, user_id=fan_id),
+            Skip(scream_id=scream.id, user_id=skipper_id),
+        ])
+        await session.commit()
+    return author_id, fan_id, skipper_id
+
+
+async def test_stats_follow_writes(client):
+    """
+    Scream and reaction inserts update the stats served by /stats.
+    """
+    _, fan_id, skipper_id = await _seed(hash_user_id("stats_author"),
+                                        "stats_fan")
+
+    async with TestingSessionLocal() as session:
+        fan = await session.get(UserStats, fan_id)
+        skipper = await session.get(UserStats, skipper_id)
+    assert fan.reactions_given == 1
+    assert skipper is None
+
+    resp = client.get("/stats/stats_author")
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["screams_posted"] == 1
+    assert body["reactions_got"] == 1
+    assert body["reactions_given"] == 0
+
+
+async def test_rebuild_user_stats_restores_rows():
+    """
+    The batch rebuild recomputes totals from raw screams and reactions.
+    """
+    author_id, _, _ = await _seed("rebuild_author", "rebuild_fan")
+    async with TestingSessionLocal() as session:
+        await session.execute(delete(UserStats))
+        await session.commit()
+
+        await rebuild_user_stats(session)
+        await session.commit()
+
+        author = await session.get(UserStats, author_id)
+
+    assert author.screams_posted == 1
+    assert author.reactions_got == 1
+    assert author.histogram() == {"🔥": 1}
+
+
+async def test_rebuild_user_stats_overwrites_drift():
+    """
+    The rebuild corrects drifted rows in place and resets totals of
+    users whose activity is gone.
+    """
+    author_id, fan_id, _ = await _seed("drift_author", "drift_fan")
+    idle_id = await make_user("drift_idle")
+    async with TestingSessionLocal() as session:
+        session.add(UserStats(user_id=idle_id, screams_posted=5))
+        author = await session.get(UserStats, author_id)
+        author.reactions_got = 40
+        await session.commit()
+
+        assert await rebuild_user_stats(session) >= 3
+        await session.commit()
+
+        author = await session.get(UserStats, author_id,
+                                   populate_existing=True)
+        idle = await session.get(UserStats, idle_id, populate_existing=True)
+        fan = await session.get(UserStats, fan_id, populate_existing=True)
+    assert (author.screams_posted, author.reactions_got) == (1, 1)
+    assert idle.screams_posted == 0
+    assert fan.reactions_given == 1
@@ -0,0 +1,22 @@
+# Local application
+from app_fastapi.tools import users as users_module
+from app_fastapi.tools.users import lookup_user_id
+from .conftest import TestingSessionLocal, make_user
+
+
+async def test_user_cache_evicts_least_recently_used(monkeypatch):
+    """
+    The hash-to-ID cache keeps at most USER_CACHE_SIZE entries, evicting
+    the least recently used one, and still resolves evicted users.
+    """
+    ids = {name: await make_user(f"lru_{name}") for name in "abc"}
+    monkeypatch.setattr(users_module, "USER_CACHE_SIZE", 2)
+    async with TestingSessionLocal() as session:
+        cache = users_module._engine_cache(session)
+        cache.clear()
+        for name in "abac":
+            await lookup_user_id(session, f"lru_{name}")
+        assert list(cache) == ["lru_a", "lru_c"]
+
+        assert await lookup_user_id(session, "lru_b") == ids["b"]
+        assert list(cache) == ["lru_c", "lru_b"]
@@ -0,0 +1,98 @@
+# Standard library
+import asyncio
+
+# Third‑party
+from fastapi import HTTPException
+from sqlalchemy import func, select
+
+# Local application
+from app_fastapi.initializers.writer import GroupCommitWriter
+from app_fastapi.models.emoji import Emoji
+from app_fastapi.models.scream import Scream
+from app_fastapi.tools.writes import insert_reaction, insert_scream
+from .conftest import TestingSessionLocal, make_user
+
+
+class CountingFactory:
+    """Session factory wrapper counting opened transactions."""
+
+    def __init__(self):
+        self.sessions = 0
+
+    def __call__(self):
+        self.sessions += 1
+        return TestingSessionLocal()
+
+
+async def test_concurrent_inserts_share_one_commit():
+    """
+    Screams submitted together are committed in a single transaction.
+    """
+    user_id = await make_user("burst_user")
+    factory = CountingFactory()
+    writer = GroupCommitWriter(factory, max_batch=50, max_delay=0.05)
+
+    ids = await asyncio.gather(*[
+        writer.submit(insert_scream(f"burst {i}", user_id))
+        for i in range(10)
+    ])
+    await writer.stop()
+
+    assert len(set(ids)) == 10
+    assert factory.sessions == 1
+    async with TestingSessionLocal() as session:
+        count = await session.scalar(
+            select(func.count(Scream.id))
+            .where(Scream.user_id == user_id)
+        )
+    assert count == 10
+
+
+async def test_rejected_job_does_not_fail_its_group():
+    """
+    A conflict is raised to its caller only; the rest of the group commits.
+    """
+    author, fan1, fan2, fan3 = [
+        await make_user(name) for name in ("author", "fan1", "fan2", "fan3")
+    ]
+    writer = GroupCommitWriter(TestingSessionLocal, max_delay=0.05)
+    scream_id = await writer.submit(insert_scream("target", author))
+
+    results = await asyncio.gather(
+        writer.submit(insert_reaction(scream_id, Emoji.FIRE, fan1)),
+        writer.submit(insert_reaction(scream_id, Emoji.FIRE, fan1)),
+        writer.submit(insert_reaction(10 ** 6, Emoji.FIRE, fan2)),
+        writer.submit(insert_reaction(scream_id, Emoji.SKULL, fan3)),
+        return_exceptions=True,
+    )
+    await writer.stop()
+
+    assert isinstance(results[0], int)
+    assert results[1].status_code == 409
+    assert results[2].status_code == 404
+    assert isinstance(results[3], int)
+
+
+async def test_database_error_retries_jobs_individually():
+    """
+    A failing statement aborts only its own job after the group retry.
+    """
+    user_id = await make_user("ok_user")
+    writer = GroupCommitWriter(TestingSessionLocal, max_delay=0.05)
+
+    def broken_job():
+        async def job(session):
+            session.add(Scream(content=None, user_id=user_id))
+            await session.flush()
+        return job
+
+    results = await asyncio.gather(
+        writer.submit(insert_scream("survivor", user_id)),
+        writer.submit(broken_job()),
+        return_exceptions=True,
+    )
+    await writer.stop()
+
+    assert isinstance(results[0], int)
+    assert isinstance(results[1], Exception)
+    assert not isinstance(results[1], HTTPException)
@@ -0,0 +1,102 @@
+# Standard library
+import asyncio
+import logging
+import time
+from os import getenv
+
+# Third‑party
+from sqlalchemy import select
+
+# Local application
+from app_fastapi.models.admin import Admin
+from app_fastapi.models.user import User
+
+
+logger = logging.getLogger("app_fastapi.tools")
+
+ADMIN_REFRESH_SECONDS = float(getenv("ADMIN_REFRESH_SECONDS", "60"))
+
+
+class AdminRegistry:
+    """
+    In-memory set of the user hashes of all admins.
+
+    Loaded at startup and updated by `create_admin`, so authorizing an
+    admin request, and rejecting a non-admin one, is a set lookup instead
+    of a database query. The set is authoritative until it is older than
+    `ttl` seconds; the next check then reloads it. This bounds how long
+    an admin granted by another API replica or directly in the database
+    waits, and how long a revoked admin stays authorized. The set is per
+    process, like the group commit writer.
+
+    Attributes:
+        ttl (float): Seconds after which the next check reloads the set.
+    """
+
+    def __init__(self, ttl: float = ADMIN_REFRESH_SECONDS,
+                 clock=time.monotonic):
+        """
+        Create an empty registry.
+
+        Args:
+            ttl (float): Seconds after which the set is reloaded.
+            clock (Callable[[], float]): Monotonic clock, for tests.
+        """
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = asyncio.Lock()
+        self.reset()
+
+    def reset(self):
+        """Forget the set so the next check reloads it."""
+        self._hashes = frozenset()
+        self._expires = None
+
+    async def load(self, session) -> int:
+        """
+        Read the hashes of all admins.
+
+        Args:
+            session (AsyncSession): Database session.
+
+        Returns:
+            int: Number of admins.
+        """
+        result = await session.scalars(
+            select(User.user_hash).join(Admin, Admin.user_id == User.id)
+        )
+        self._hashes = frozenset(result.all())
+        self._expires = self._clock() + self.ttl
+        logger.info(f"Loaded {len(self._hashes)} admins")
+        return len(self._hashes)
+
+    def add(self, user_hash: str):
+        """
+        Register a new admin.
+
+        Args:
+            user_hash (str): Salted hash of the admin's user ID.
+        """
+        self._hashes = self._hashes | {user_hash}
+
+    async def is_admin(self, session, user_hash: str) -> bool:
+        """
+        Check whether a user is an admin.
+
+        Answered from memory; the set is reloaded first when expired.
+
+        Args:
+            session (AsyncSession): Session used to reload the set.
+            user_hash (str): Salted hash of the user ID.
+
+        Returns:
+            bool: True if the user is an admin.
+        """
+        if self._expires is None or self._expires <= self._clock():
+            async with self._lock:
+                if self._expires is None or self._expires <= self._clock():
+                    await self.load(session)
+        return user_hash in self._hashes
+
+
+admin_registry = AdminRegistry()
@@ -1,29 +1,90 @@
 # Standard library
 import asyncio
 import logging
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 
 # Third-party
-from sqlalchemy import func, select
+from sqlalchemy import insert, select, update
 
 # Local application
 from app_fastapi.models.archive import Archive
-from app_fastapi.models.reaction import Reaction
 from app_fastapi.models.scream import Scream
 from app_fastapi.initializers.engine import asyncSession
+from app_fastapi.tools.cache import response_cache
+from app_fastapi.tools.time import day_bucket, epoch_seconds, week_of_day
 
 
 logger = logging.getLogger("app_fastapi")
 
+# Number of screams kept per archived week.
+ARCHIVE_SIZE = 3
+
+
+async def archive_week(session, week_id: int, source_week: int) -> int:
+    """
+    Snapshot the top screams of a week into the Archive table.
+
+    Selects the best voted screams of `source_week` (indexed `week_id`
+    lookup ordered by the maintained vote counter) and writes their
+    content, votes and meme with their place in a single bulk insert.
+    The caller commits.
+
+    Args:
+        session (AsyncSession): Database session.
+        week_id (int): Identifier the snapshot is stored under.
+        source_week (int): Generated `Scream.week_id` of the ranked week.
+
+    Returns:
+        int: Number of archived screams.
+    """
+    result = await session.execute(
+        select(Scream.id, Scream.content, Scream.votes, Scream.meme_url)
+        .where(Scream.week_id == source_week, Scream.votes > 0)
+        .order_by(Scream.votes.desc(), Scream.id)
+        .limit(ARCHIVE_SIZE)
+    )
+    rows = [
+        {"week_id": week_id, "place": place, "scream_id": scream_id,
+         "content": content, "votes": votes, "meme_url": meme_url}
+        for place, (scream_id, content, votes, meme_url)
+        in enumerate(result.all(), 1)
+    ]
+    if rows:
+        await session.execute(insert(Archive), rows)
+    return len(rows)
+
+
+def backfill_archives_statement():
+    """
+    Build an UPDATE filling snapshot columns of pre-snapshot archive rows.
+
+    Archives written before the snapshot columns existed only reference
+    their scream; their content, votes and meme are copied from it.
+
+    Returns:
+        Update: Statement to execute on any connection.
+    """
+    def source(column):
+        return select(column).where(
+            Scream.id == Archive.scream_id
+        ).scalar_subquery()
+
+    return (
+        update(Archive)
+        .where(Archive.content == "", Archive.scream_id.isnot(None))
+        .values(content=source(Scream.content),
+                votes=source(Scream.votes),
+                meme_url=source(Scream.meme_url))
+    )
+
 
 def archive_top_job():
     """
     Archive top 3 screams from past week into Archive table.
 
     This function:
-    - Computes current ISO week identifier in format "YYYY-WW"
-    - Queries top 3 screams by positive reaction count (excluding ❌)
-    - Creates Archive records for each top scream with ordinal place
+    - Computes current ISO week identifier in format "YYYYWW"
+    - Snapshots the top 3 screams of the current week with `archive_week`
     - Commits new Archive entries to database
     Raises:
         Exception: If any error occurs during database operations
@@ -35,27 +96,12 @@ def archive_top_job():
                 now = datetime.now(timezone.utc)
                 year, week_num, _ = now.isocalendar()
                 week_id = int(f"{year}{week_num:02d}")
-                stmt = (
-                    select(Scream.id, func.count(Reaction.id).label("votes"))
-                    .join(Reaction, Scream.id == Reaction.scream_id)
-                    .where(
-                        Scream.timestamp >= now - timedelta(weeks=1),
-                        Reaction.emoji != "❌"
-                    )
-                    .group_by(Scream.id)
-                    .order_by(func.count(Reaction.id).desc())
-                    .limit(3)
+                await archive_week(
+                    session, week_id,
+                    week_of_day(day_bucket(epoch_seconds(now)))
                 )
-                result = await session.execute(stmt)
-                top_screams = result.all()
-                for idx, (scream_id, votes) in enumerate(top_screams, 1):
-                    archive = Archive(
-                        scream_id=scream_id,
-                        week_id=week_id,
-                        place=idx
-                    )
-                    session.add(archive)
                 await session.commit()
+                response_cache.invalidate("archives")
                 logger.info(f"Archived top for week {week_id}")
             except Exception as e:
                 logger.error(f"Archive failed: {str(e)}", exc_info=True)
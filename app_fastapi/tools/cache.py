@@ -0,0 +1,294 @@
+# Standard library
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+
+
+logger = logging.getLogger("app_fastapi.tools")
+
+CACHE_MAX_ENTRIES = 256
+CACHE_TTL = 60.0
+CACHE_STALE = 300.0
+
+
+class SingleFlight:
+    """
+    Collapse concurrent calls with the same key onto one task.
+
+    The first caller starts the computation as a task; callers arriving
+    while it runs await the same task instead of repeating the work. The
+    task is shielded, so a cancelled caller does not cancel it for the
+    others, and it is forgotten once done.
+    """
+
+    def __init__(self):
+        """Create a group with no computation in flight."""
+        self._tasks = {}
+        self.joined = 0
+
+    def __contains__(self, key) -> bool:
+        return key in self._tasks
+
+    def start(self, key, compute) -> asyncio.Task:
+        """
+        Return the running task of a key, starting it if needed.
+
+        Args:
+            key (Hashable): Identity of the computation.
+            compute (Callable[[], Awaitable]): Coroutine function run
+                when no task of the key is in flight.
+
+        Returns:
+            asyncio.Task: Task producing the result.
+        """
+        task = self._tasks.get(key)
+        if task is not None:
+            self.joined += 1
+            return task
+        task = asyncio.ensure_future(compute())
+        self._tasks[key] = task
+        task.add_done_callback(lambda done: self._finish(key, done))
+        return task
+
+    async def do(self, key, compute):
+        """
+        Run a computation once for all concurrent callers of a key.
+
+        Args:
+            key (Hashable): Identity of the computation.
+            compute (Callable[[], Awaitable]): Coroutine function.
+
+        Returns:
+            Any: Result of the shared computation.
+        """
+        return await asyncio.shield(self.start(key, compute))
+
+    def _finish(self, key, task):
+        """Forget a finished task and mark its error as retrieved."""
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug(f"Shared computation {key} failed: "
+                         f"{task.exception()!r}")
+
+
+class ResponseCache:
+    """
+    Bounded in-process cache of read endpoint responses.
+
+    Entries are keyed by endpoint, parameters and time bucket (e.g. the
+    current day), expire after a TTL and are evicted least recently used
+    once the cache is full. Each entry carries tags naming the data it
+    was computed from; write endpoints and the archive job invalidate
+    those tags after committing, so reads are fresh within a process
+    and at most `ttl + stale` seconds stale across processes.
+
+    Concurrent misses of a key share one computation. An entry past its
+    TTL but within the `stale` window is still served while a single
+    background task recomputes it, so expiry never blocks readers.
+    Computations must therefore not depend on the request that started
+    them, e.g. they open their own database sessions.
+
+    Every tag counts its invalidations. A response computed while one
+    of its own tags was invalidated is not stored, and misses after such
+    an invalidation never join a computation started before it, so a
+    slow read that started before a write cannot serve or cache data the
+    write already changed. Writes to other tags do not affect it.
+
+    Attributes:
+        max_entries (int): Number of entries kept.
+        ttl (float): Seconds an entry stays fresh.
+        stale (float): Seconds an expired entry is still served while
+            it is refreshed.
+        hits (int): Lookups served from the cache, fresh or stale.
+        stale_hits (int): Hits that served an expired entry.
+        misses (int): Lookups that had to compute the response.
+        evictions (int): Entries dropped because the cache was full.
+    """
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES,
+                 ttl: float = CACHE_TTL, stale: float = CACHE_STALE,
+                 clock=time.monotonic):
+        """
+        Create an empty cache.
+
+        Args:
+            max_entries (int): Number of entries kept.
+            ttl (float): Seconds an entry stays fresh.
+            stale (float): Seconds an expired entry is still served.
+            clock (Callable[[], float]): Monotonic clock, for tests.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stale = stale
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._flights = SingleFlight()
+        self._generations = {}
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """
+        Return a fresh cached value and count the lookup.
+
+        Args:
+            key (tuple): Cache key.
+
+        Returns:
+            Optional[Any]: The cached value, None on a miss.
+        """
+        entry = self._lookup(key)
+        if entry is not None and entry[0] > self._clock():
+            self.hits += 1
+            return entry[3]
+        self.misses += 1
+        return None
+
+    def _lookup(self, key):
+        """Return the servable entry of a key, dropping a dead one."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key, value, tags=(), generation: int = None):
+        """
+        Store a value, evicting the least recently used entries.
+
+        Args:
+            key (tuple): Cache key.
+            value (Any): Value to cache, not None.
+            tags (Iterable[str]): Data the value was computed from.
+            generation (tuple, optional): `generation(tags)` read before
+                the value was computed; the value is dropped if any of
+                its tags was invalidated since.
+        """
+        if generation is not None and generation != self.generation(tags):
+            return
+        now = self._clock()
+        self._entries[key] = (now + self.ttl, now + self.ttl + self.stale,
+                              frozenset(tags), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def generation(self, tags) -> tuple:
+        """
+        Return the invalidation counts of tags.
+
+        Args:
+            tags (Iterable[str]): Data a value is computed from.
+
+        Returns:
+            tuple: Counts in tag order, to pass to `set`.
+        """
+        return tuple(self._generations.get(tag, 0) for tag in sorted(tags))
+
+    def invalidate(self, *tags) -> int:
+        """
+        Drop every entry computed from any of the given tags.
+
+        Args:
+            *tags (str): Names of the written data, e.g. "screams".
+
+        Returns:
+            int: Number of dropped entries.
+        """
+        written = set(tags)
+        for tag in written:
+            self._generations[tag] = self._generations.get(tag, 0) + 1
+        stale = [key for key, entry in self._entries.items()
+                 if entry[2] & written]
+        for key in stale:
+            del self._entries[key]
+        if stale:
+            logger.debug(f"Invalidated {len(stale)} cached responses "
+                         f"for {sorted(written)}")
+        return len(stale)
+
+    async def cached(self, key, tags, compute):
+        """
+        Return the cached value of a key, computing it on a miss.
+
+        A stale entry is returned at once and refreshed in the
+        background; misses wait for the one computation of the key.
+
+        Args:
+            key (tuple): Cache key.
+            tags (Iterable[str]): Data the value is computed from.
+            compute (Callable[[], Awaitable]): Coroutine function
+                producing the value without request-bound resources.
+
+        Returns:
+            Any: Cached or freshly computed value.
+        """
+        entry = self._lookup(key)
+        if entry is not None:
+            self.hits += 1
+            if entry[0] <= self._clock():
+                self.stale_hits += 1
+                flight, load = self._flight(key, tags, compute)
+                if flight not in self._flights:
+                    task = self._flights.start(flight, load)
+                    task.add_done_callback(self._refreshed)
+            return entry[3]
+        self.misses += 1
+        return await self._flights.do(*self._flight(key, tags, compute))
+
+    def _flight(self, key, tags, compute):
+        """
+        Build the shared computation of a key for its tags' generation.
+
+        Returns:
+            tuple: Flight key and coroutine function storing the value.
+        """
+        generation = self.generation(tags)
+
+        async def load():
+            value = await compute()
+            self.set(key, value, tags, generation)
+            return value
+        return (key, generation), load
+
+    @staticmethod
+    def _refreshed(task):
+        """Log a failed background refresh, which no caller awaits."""
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Failed to refresh cached response: "
+                           f"{task.exception()!r}")
+
+    def clear(self):
+        """Drop every entry, forget computations and reset counters."""
+        self._entries.clear()
+        self._flights = SingleFlight()
+        self.hits = self.stale_hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        """
+        Return the cache counters.
+
+        Returns:
+            dict: `hits`, `stale_hits`, `misses`, `coalesced` callers
+            that joined a running computation, `evictions` and current
+            `entries`.
+        """
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "coalesced": self._flights.joined,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+        }
+
+
+response_cache = ResponseCache()
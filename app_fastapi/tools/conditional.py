@@ -0,0 +1,98 @@
+# Standard library
+import hashlib
+import logging
+from typing import Optional
+
+# Third‑party
+from fastapi import Request, Response
+
+
+logger = logging.getLogger("app_fastapi.tools")
+
+CACHE_CONTROL = "no-cache"
+
+
+class RenderedResponse:
+    """
+    Serialized JSON body of a response with its strong ETag.
+
+    Cached read endpoints store rendered responses, so a cache hit is
+    answered without validating or serializing the payload again, and
+    a matching `If-None-Match` without sending it at all.
+
+    Attributes:
+        body (bytes): JSON body.
+        etag (str): Quoted digest of the body.
+    """
+
+    __slots__ = ("body", "etag")
+
+    def __init__(self, body: bytes):
+        """
+        Wrap a body and derive its ETag.
+
+        Args:
+            body (bytes): JSON body.
+        """
+        self.body = body
+        self.etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def render(model, data) -> RenderedResponse:
+    """
+    Validate and serialize a payload with its response model.
+
+    Args:
+        model (Type[BaseModel]): Response model of the endpoint.
+        data (dict): Payload returned by the endpoint.
+
+    Returns:
+        RenderedResponse: Serialized payload.
+    """
+    return RenderedResponse(model.model_validate(data).model_dump_json()
+                            .encode())
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an `If-None-Match` header against an ETag.
+
+    Uses the weak comparison RFC 9110 prescribes for `If-None-Match`:
+    a `W/` prefix is ignored and `*` matches any current response.
+
+    Args:
+        if_none_match (Optional[str]): Header value, None when absent.
+        etag (str): Quoted ETag of the current response.
+
+    Returns:
+        bool: True if the client already holds the response.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag
+               for tag in if_none_match.split(","))
+
+
+def conditional_response(request: Request, rendered: RenderedResponse,
+                         cache_control: str = CACHE_CONTROL) -> Response:
+    """
+    Answer a read request with its rendered body or 304 Not Modified.
+
+    Args:
+        request (Request): Incoming request.
+        rendered (RenderedResponse): Current response.
+        cache_control (str): `Cache-Control` header value; the default
+            lets clients store the response but revalidate every use.
+
+    Returns:
+        Response: 304 without body if the client's ETag matches,
+        otherwise 200 with the JSON body.
+    """
+    headers = {"ETag": rendered.etag, "Cache-Control": cache_control}
+    if etag_matches(request.headers.get("if-none-match"), rendered.etag):
+        logger.debug(f"Not modified: {request.url.path}")
+        return Response(status_code=304, headers=headers)
+    return Response(rendered.body, media_type="application/json",
+                    headers=headers)
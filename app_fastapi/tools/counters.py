@@ -0,0 +1,84 @@
+# Standard library
+import asyncio
+import logging
+
+# Third‑party
+from sqlalchemy import func, select, update
+
+# Local application
+from app_fastapi.models.reaction import COUNTER_COLUMNS, Reaction
+from app_fastapi.models.scream import Scream
+from app_fastapi.models.skip import Skip
+
+
+logger = logging.getLogger("app_fastapi.tools")
+
+
+def _count_reactions(*conditions):
+    """
+    Build a correlated subquery counting reactions of the outer scream.
+
+    Args:
+        *conditions: Extra filters on the Reaction table.
+
+    Returns:
+        ScalarSelect: Reaction count per scream.
+    """
+    return (
+        select(func.count(Reaction.id))
+        .where(Reaction.scream_id == Scream.id, *conditions)
+        .scalar_subquery()
+    )
+
+
+def rebuild_counters_statement():
+    """
+    Build an UPDATE recomputing every scream counter from raw rows.
+
+    Returns:
+        Update: Statement setting `votes`, the per-emoji counters and
+        `skip_count`.
+    """
+    values = {"votes": _count_reactions()}
+    for emoji, column in COUNTER_COLUMNS.items():
+        values[column] = _count_reactions(Reaction.emoji == emoji)
+    values["skip_count"] = (
+        select(func.count())
+        .where(Skip.scream_id == Scream.id)
+        .scalar_subquery()
+    )
+    return update(Scream).values(**values)
+
+
+async def rebuild_counters(session) -> int:
+    """
+    Recompute the reaction counters of all screams.
+
+    The caller commits the session.
+
+    Args:
+        session (AsyncSession): Database session.
+
+    Returns:
+        int: Number of screams updated.
+    """
+    result = await session.execute(rebuild_counters_statement())
+    logger.info(f"Rebuilt reaction counters of {result.rowcount} screams")
+    return result.rowcount
+
+
+async def _repair():
+    """Rebuild counters on the configured database and commit."""
+    from app_fastapi.initializers.engine import asyncSession
+
+    async with asyncSession() as session:
+        count = await rebuild_counters(session)
+        await session.commit()
+    logger.info(f"Rebuilt counters of {count} screams")
+
+
+if __name__ == "__main__":
+    from app_fastapi.logger import setup_fastapi_logger
+
+    setup_fastapi_logger()
+    asyncio.run(_repair())
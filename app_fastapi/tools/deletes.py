@@ -0,0 +1,139 @@
+# Standard library
+import logging
+
+# Third‑party
+from sqlalchemy import and_, delete, func, select, update
+
+# Local application
+from app_fastapi.models.activity import (
+    ActivityDaily,
+    ActivityHourly,
+    UserActivityDaily,
+)
+from app_fastapi.models.reaction import COUNTER_COLUMNS, Reaction
+from app_fastapi.models.scream import Scream
+from app_fastapi.models.user_stats import RECEIVED_COLUMNS, UserStats
+from app_fastapi.tools.time import SECONDS_PER_DAY, SECONDS_PER_HOUR
+
+
+logger = logging.getLogger("app_fastapi.tools")
+
+
+def _subtract(model, source, keys, totals: dict):
+    """
+    Build an UPDATE subtracting per-key aggregates of a row set.
+
+    Args:
+        model (Base): Rollup or stats model to decrement.
+        source (Subquery): Rows being removed, with columns named after
+            the model's key columns.
+        keys (tuple): Key columns shared by `model` and `source`.
+        totals (dict): Mapping of model column to the aggregate over
+            `source` to subtract from it.
+
+    Returns:
+        Update: Statement touching only rows with matching keys.
+    """
+    match = and_(*(source.c[key] == getattr(model, key) for key in keys))
+    values = {
+        column: getattr(model, column) - (
+            select(func.coalesce(total, 0)).select_from(source)
+            .where(match).scalar_subquery()
+        )
+        for column, total in totals.items()
+    }
+    return (
+        update(model)
+        .where(select(1).select_from(source).where(match).exists())
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _activity_rows(model, scream_id, scream_ids):
+    """Select the (hour, day, user_id) buckets of removed rows."""
+    return select(
+        (model.timestamp // SECONDS_PER_HOUR).label("hour"),
+        (model.timestamp // SECONDS_PER_DAY).label("day"),
+        model.user_id,
+    ).where(scream_id.in_(scream_ids)).subquery()
+
+
+def uncount_statements(scream_ids: list) -> list:
+    """
+    Build the statements removing screams from stats and rollups.
+
+    They mirror the `after_delete` events of screams and reactions, one
+    set-based statement per table and source instead of one per row.
+    Scream counters and skip counts need no update since their screams
+    go away.
+
+    Args:
+        scream_ids (list): IDs of the screams about to be deleted.
+
+    Returns:
+        list: Update statements to execute before the delete.
+    """
+    screams = select(
+        Scream.user_id, Scream.votes,
+        *(getattr(Scream, column) for column in COUNTER_COLUMNS.values())
+    ).where(Scream.id.in_(scream_ids)).subquery()
+    givers = (select(Reaction.user_id)
+              .where(Reaction.scream_id.in_(scream_ids)).subquery())
+    received = {"screams_posted": func.count(),
+                "reactions_got": func.sum(screams.c.votes)}
+    for emoji, column in RECEIVED_COLUMNS.items():
+        received[column] = func.sum(screams.c[COUNTER_COLUMNS[emoji]])
+
+    statements = [
+        _subtract(UserStats, screams, ("user_id",), received),
+        _subtract(UserStats, givers, ("user_id",),
+                  {"reactions_given": func.count()}),
+    ]
+    for source, scream_id, column in (
+        (Scream, Scream.id, "screams"),
+        (Reaction, Reaction.scream_id, "reactions"),
+    ):
+        rows = _activity_rows(source, scream_id, scream_ids)
+        for model, keys in ((ActivityHourly, ("hour",)),
+                            (ActivityDaily, ("day",)),
+                            (UserActivityDaily, ("user_id", "day"))):
+            statements.append(
+                _subtract(model, rows, keys, {column: func.count()})
+            )
+    return statements
+
+
+async def delete_screams(session, scream_ids: list) -> list:
+    """
+    Delete screams with set-based statements.
+
+    Nothing is loaded into the session: stats and rollups are adjusted
+    with one UPDATE each, then a single DELETE removes the screams and
+    the database cascades to their reactions and skips and detaches
+    their archive snapshots. The number of statements does not depend on
+    how many reactions the screams have. The caller commits.
+
+    Args:
+        session (AsyncSession): Database session.
+        scream_ids (list): IDs of the screams to delete.
+
+    Returns:
+        list: IDs of the screams that existed and were deleted, sorted.
+    """
+    if not scream_ids:
+        return []
+    deleted = sorted((await session.scalars(
+        select(Scream.id).where(Scream.id.in_(scream_ids))
+    )).all())
+    if not deleted:
+        return []
+
+    for statement in uncount_statements(deleted):
+        await session.execute(statement)
+    await session.execute(
+        delete(Scream).where(Scream.id.in_(deleted))
+        .execution_options(synchronize_session=False)
+    )
+    logger.info(f"Deleted {len(deleted)} screams")
+    return deleted
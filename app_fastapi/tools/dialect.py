@@ -0,0 +1,147 @@
+# Standard library
+import logging
+
+# Third‑party
+from sqlalchemy import case
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+
+logger = logging.getLogger("app_fastapi.tools")
+
+_INSERTS = {
+    "postgresql": postgresql_insert,
+    "sqlite": sqlite_insert,
+}
+
+
+def insert_for(dialect_name: str, model):
+    """
+    Build an INSERT supporting ON CONFLICT for a named dialect.
+
+    Both SQLite and PostgreSQL implement `ON CONFLICT`, but SQLAlchemy
+    exposes it through dialect-specific `insert` constructs.
+
+    Args:
+        dialect_name (str): SQLAlchemy dialect name, e.g. "sqlite".
+        model (Base): ORM model to insert into.
+
+    Returns:
+        Insert: Dialect-specific insert statement.
+
+    Raises:
+        NotImplementedError: If the database dialect has no upsert support.
+    """
+    if dialect_name not in _INSERTS:
+        raise NotImplementedError(
+            f"Upserts are not supported on {dialect_name}"
+        )
+    return _INSERTS[dialect_name](model)
+
+
+def dialect_name(session) -> str:
+    """
+    Return the name of the database dialect behind a session.
+
+    Args:
+        session (AsyncSession | AsyncConnection): Session or connection.
+
+    Returns:
+        str: SQLAlchemy dialect name, e.g. "sqlite".
+    """
+    if isinstance(session, AsyncConnection):
+        return session.dialect.name
+    return session.get_bind().dialect.name
+
+
+def dialect_insert(session, model):
+    """
+    Build an INSERT supporting ON CONFLICT for the session's database.
+
+    Args:
+        session (AsyncSession | AsyncConnection): Session or connection
+            whose bind decides the dialect.
+        model (Base): ORM model to insert into.
+
+    Returns:
+        Insert: Dialect-specific insert statement.
+
+    Raises:
+        NotImplementedError: If the database dialect has no upsert support.
+    """
+    return insert_for(dialect_name(session), model)
+
+
+def upsert_increment(connection, model, keys: dict, deltas: dict):
+    """
+    Add amounts to counter columns, creating their row if needed.
+
+    Args:
+        connection (Connection): Synchronous connection, e.g. the one
+            passed to mapper events.
+        model (Base): ORM model holding the counters.
+        keys (dict): Primary key values of the counter row.
+        deltas (dict): Mapping of counter column name to amount to add.
+    """
+    stmt = (
+        insert_for(connection.dialect.name, model)
+        .values(**keys, **deltas)
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(keys),
+        set_={column: getattr(model, column) + delta
+              for column, delta in deltas.items()},
+    )
+    connection.execute(stmt)
+
+
+def upsert_max(connection, model, keys: dict, values: dict):
+    """
+    Raise columns to the given values, creating their row if needed.
+
+    Columns already holding a larger value are left unchanged, so
+    concurrent or out-of-order updates never move them backwards.
+
+    Args:
+        connection (Connection): Synchronous connection, e.g. the one
+            passed to mapper events.
+        model (Base): ORM model holding the columns.
+        keys (dict): Primary key values of the row.
+        values (dict): Mapping of column name to candidate value.
+    """
+    stmt = (
+        insert_for(connection.dialect.name, model)
+        .values(**keys, **values)
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(keys),
+        set_={column: case((getattr(model, column) < value, value),
+                           else_=getattr(model, column))
+              for column, value in values.items()},
+    )
+    connection.execute(stmt)
+
+
+async def insert_ignore(session, model, values: dict, index_elements):
+    """
+    Insert a row unless it conflicts with an existing unique key.
+
+    Args:
+        session (AsyncSession): Database session.
+        model (Base): ORM model to insert into.
+        values (dict): Column values of the new row.
+        index_elements (list): Columns of the unique key to check.
+
+    Returns:
+        bool: True if the row was inserted, False if it already existed.
+    """
+    stmt = (
+        dialect_insert(session, model)
+        .values(**values)
+        .on_conflict_do_nothing(index_elements=index_elements)
+    )
+    result = await session.execute(stmt)
+    logger.debug(f"Insert-or-ignore into {model.__tablename__}: "
+                 f"{result.rowcount} row(s)")
+    return result.rowcount > 0
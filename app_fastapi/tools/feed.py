@@ -0,0 +1,300 @@
+# Standard library
+import asyncio
+import logging
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from os import getenv
+
+# Third‑party
+from sqlalchemy import func, insert, select, union_all
+
+# Local application
+from app_fastapi.models.reaction import Reaction
+from app_fastapi.models.scream import Scream
+from app_fastapi.models.skip import Skip
+from app_fastapi.models.user_feed import UserFeedProgress
+from app_fastapi.tools.time import current_week_id
+
+
+logger = logging.getLogger("app_fastapi.tools")
+
+FEED_SYNC_SECONDS = float(getenv("FEED_SYNC_SECONDS", "5"))
+
+
+async def feed_cursor(session, user_id) -> int:
+    """
+    Return the ID of the last scream a user reacted to or skipped.
+
+    Args:
+        session (AsyncSession): Database session.
+        user_id (Optional[int]): Internal user ID, None for unknown users.
+
+    Returns:
+        int: The user's cursor, 0 if the user has no progress yet.
+    """
+    if user_id is None:
+        return 0
+    cursor = await session.scalar(
+        select(UserFeedProgress.last_seen_id)
+        .where(UserFeedProgress.user_id == user_id)
+    )
+    return cursor or 0
+
+
+def rebuild_feed_progress_statement():
+    """
+    Build an INSERT deriving feed cursors from reactions and skips.
+
+    Each user's cursor becomes the highest scream ID they reacted to
+    or skipped. Meant for an empty user_feed_progress table.
+
+    Returns:
+        Insert: Statement to execute on any connection.
+    """
+    seen = union_all(
+        select(Reaction.user_id, Reaction.scream_id),
+        select(Skip.user_id, Skip.scream_id),
+    ).subquery()
+    return insert(UserFeedProgress).from_select(
+        ["user_id", "last_seen_id"],
+        select(seen.c.user_id, func.max(seen.c.scream_id))
+        .group_by(seen.c.user_id)
+    )
+
+
+def _lowest_clear_bit(mask: int) -> int:
+    """Return the position of the lowest zero bit of a non-negative int."""
+    return (~mask & (mask + 1)).bit_length() - 1
+
+
+class WeekFeed:
+    """
+    In-memory snapshot of the current week's feed.
+
+    Every user walks the same screams of the week in posting order, so
+    their IDs, authors and contents are kept once in arrays indexed by
+    position. Each user has a bitset of positions already seen, and each
+    author a bitset of own positions; the next unseen scream is the
+    lowest position clear in both, found with integer bit operations.
+
+    The week's screams are read when the snapshot is empty or the week
+    rolled over, and a user's feed cursor the first time the user reads
+    the feed. The endpoints keep the snapshot current by reporting new
+    screams, reactions and deletions. The snapshot is per process, like
+    the group commit writer, so once it is older than `sync_seconds` the
+    next read syncs it with the database: screams posted or deleted by
+    other API replicas are picked up, and seen bitsets are derived from
+    the cursors again.
+
+    Attributes:
+        week_id (Optional[int]): Week held by the snapshot, None if empty.
+        sync_seconds (float): Seconds after which the next read syncs.
+    """
+
+    def __init__(self, sync_seconds: float = FEED_SYNC_SECONDS,
+                 clock=time.monotonic):
+        """
+        Create an empty snapshot.
+
+        Args:
+            sync_seconds (float): Seconds after which the next read syncs
+                the snapshot with the database.
+            clock (Callable[[], float]): Monotonic clock, for tests.
+        """
+        self.week_id = None
+        self.sync_seconds = sync_seconds
+        self._clock = clock
+        self._lock = asyncio.Lock()
+        self._pending = None
+        self._clear()
+
+    def _clear(self):
+        """Drop every scream and bitset."""
+        self._ids = array("q")
+        self._contents = []
+        self._own = {}
+        self._seen = {}
+        self._removed = 0
+        self._synced = None
+
+    def reset(self):
+        """Empty the snapshot so the next read reloads it."""
+        self.week_id = None
+        self._clear()
+
+    def _append(self, scream_id: int, user_id: int, content: str) -> bool:
+        """
+        Add a scream at the next position.
+
+        Returns:
+            bool: False if the scream does not come after the last one,
+            which would break the ID order positions rely on.
+        """
+        if self._ids and scream_id <= self._ids[-1]:
+            return scream_id in self._ids
+        position = len(self._ids)
+        self._ids.append(scream_id)
+        self._contents.append(content)
+        self._own[user_id] = self._own.get(user_id, 0) | 1 << position
+        return True
+
+    async def _load(self, session, week_id: int):
+        """Read the week's screams, keeping screams posted meanwhile."""
+        self._pending = []
+        try:
+            result = await session.execute(
+                select(Scream.id, Scream.user_id, Scream.content)
+                .where(Scream.week_id == week_id)
+                .order_by(Scream.id)
+            )
+            self._clear()
+            for row in [*result.all(), *sorted(self._pending)]:
+                self._append(*row)
+            self.week_id = week_id
+            self._synced = self._clock()
+            logger.info(f"Feed snapshot of week {week_id} loaded with "
+                        f"{len(self._ids)} screams")
+        finally:
+            self._pending = None
+
+    async def _sync(self, session):
+        """
+        Catch up with writes made by other processes.
+
+        Appends the week's screams after the last one held, hides held
+        screams no longer in the database and drops the seen bitsets so
+        they are derived from the current cursors.
+        """
+        self._pending = []
+        try:
+            last = self._ids[-1] if self._ids else 0
+            result = await session.execute(
+                select(Scream.id, Scream.user_id, Scream.content)
+                .where(Scream.week_id == self.week_id, Scream.id > last)
+            )
+            kept = set(await session.scalars(
+                select(Scream.id)
+                .where(Scream.week_id == self.week_id, Scream.id <= last)
+            ))
+            held = bisect_right(self._ids, last)
+            for position in range(held):
+                if self._ids[position] not in kept:
+                    self._removed |= 1 << position
+            rows = {tuple(row) for row in result.all()}
+            for row in sorted(rows.union(self._pending)):
+                self._append(*row)
+            self._seen.clear()
+            self._synced = self._clock()
+            logger.debug(f"Feed snapshot synced, {len(self._ids) - held} "
+                         f"new screams")
+        finally:
+            self._pending = None
+
+    def _sync_due(self) -> bool:
+        """Check whether the snapshot is older than `sync_seconds`."""
+        return self._synced is None \
+            or self._synced + self.sync_seconds <= self._clock()
+
+    async def _ensure_week(self, session):
+        """Load the current week, or sync it when it is due."""
+        week_id = current_week_id()
+        if self.week_id == week_id and not self._sync_due():
+            return
+        async with self._lock:
+            if self.week_id != week_id:
+                await self._load(session, week_id)
+            elif self._sync_due():
+                await self._sync(session)
+
+    async def _seen_mask(self, session, user_id) -> int:
+        """
+        Return a user's seen bitset, deriving it from the cursor once.
+
+        Every scream up to the stored feed cursor counts as seen.
+        """
+        if user_id is None:
+            return 0
+        if user_id not in self._seen:
+            cursor = await feed_cursor(session, user_id)
+            self._seen[user_id] = (1 << bisect_right(self._ids, cursor)) - 1
+        return self._seen[user_id]
+
+    async def next_screams(self, session, user_id, limit: int = 1,
+                           after: int = 0) -> list:
+        """
+        Return the next unseen screams of a user's feed.
+
+        Args:
+            session (AsyncSession): Session used on a cold start.
+            user_id (Optional[int]): Internal ID of the reading user.
+            limit (int): Maximum number of screams.
+            after (int): Only return screams with a greater ID.
+
+        Returns:
+            list: (scream ID, content) tuples in feed order.
+        """
+        await self._ensure_week(session)
+        mask = (
+            await self._seen_mask(session, user_id)
+            | self._own.get(user_id, 0)
+            | self._removed
+            | (1 << bisect_right(self._ids, after)) - 1
+        )
+        screams = []
+        while len(screams) < limit:
+            position = _lowest_clear_bit(mask)
+            if position >= len(self._ids):
+                break
+            screams.append((self._ids[position], self._contents[position]))
+            mask |= 1 << position
+        return screams
+
+    def _position(self, scream_id: int):
+        """Return the position of a scream, or None if not held."""
+        position = bisect_left(self._ids, scream_id)
+        if position < len(self._ids) and self._ids[position] == scream_id:
+            return position
+        return None
+
+    def add_scream(self, scream_id: int, user_id: int, content: str):
+        """
+        Record a scream committed in the current week.
+
+        Args:
+            scream_id (int): ID of the new scream.
+            user_id (int): Internal ID of its author.
+            content (str): Text of the scream.
+        """
+        if self._pending is not None:
+            self._pending.append((scream_id, user_id, content))
+        elif self.week_id == current_week_id() \
+                and not self._append(scream_id, user_id, content):
+            # Concurrent inserts committed out of order: reload lazily.
+            self.reset()
+
+    def mark_seen(self, user_id: int, scream_id: int):
+        """
+        Record that a user reacted to or skipped a scream.
+
+        Args:
+            user_id (int): Internal ID of the user.
+            scream_id (int): ID of the scream.
+        """
+        position = self._position(scream_id)
+        if position is not None and user_id in self._seen:
+            self._seen[user_id] |= 1 << position
+
+    def remove_scream(self, scream_id: int):
+        """
+        Hide a deleted scream from every feed.
+
+        Args:
+            scream_id (int): ID of the deleted scream.
+        """
+        position = self._position(scream_id)
+        if position is not None:
+            self._removed |= 1 << position
+
+
+week_feed = WeekFeed()
@@ -7,6 +7,9 @@ import random
 import httpx
 from fastapi import HTTPException
 
+# Local application
+from app_fastapi.tools.cache import SingleFlight
+
 
 logger = logging.getLogger("app_fastapi.tools")
 
@@ -88,3 +91,7 @@ async def generate_meme_url(content: str) -> str:
             status_code=500,
             detail="Failed to generate meme"
         )
+
+
+# Concurrent /top computations generate a scream's meme only once.
+meme_flights = SingleFlight()
@@ -0,0 +1,165 @@
+# Standard library
+import logging
+
+# Third‑party
+from fastapi import HTTPException
+from sqlalchemy import and_, func, or_, select, update
+
+# Local application
+from app_fastapi.models.scream import Scream
+from app_fastapi.tools.time import epoch_seconds
+
+
+logger = logging.getLogger("app_fastapi.tools")
+
+LEASE_SECONDS = 600
+
+
+def _queue(week_id: int):
+    """Return the filters selecting a week's unmoderated screams."""
+    return (Scream.moderated.is_(False), Scream.week_id == week_id)
+
+
+def _claimable(admin_id: int, now: int):
+    """
+    Build the filter of screams an admin may claim.
+
+    A scream is claimable when nobody holds it, its lease has lapsed or
+    the admin already holds it.
+    """
+    return or_(
+        Scream.claimed_by.is_(None),
+        Scream.lease_expires < now,
+        Scream.claimed_by == admin_id,
+    )
+
+
+async def count_available(session, admin_id: int, week_id: int,
+                          now: int = None) -> int:
+    """
+    Count the unmoderated screams of a week not leased to other admins.
+
+    Args:
+        session (AsyncSession): Database session.
+        admin_id (int): Internal ID of the admin.
+        week_id (int): Week of the moderation queue.
+        now (int, optional): Current epoch second, defaults to now.
+
+    Returns:
+        int: Screams the admin could claim.
+    """
+    now = epoch_seconds() if now is None else now
+    return await session.scalar(
+        select(func.count()).select_from(Scream)
+        .where(*_queue(week_id), _claimable(admin_id, now))
+    )
+
+
+async def leased_to_others(session, admin_id: int, scream_ids: list,
+                           now: int = None) -> set:
+    """
+    Find the screams other admins hold an unexpired lease on.
+
+    Confirming or deleting them would act on a scream another admin is
+    reviewing, so the moderation endpoints reject or skip them.
+
+    Args:
+        session (AsyncSession): Database session.
+        admin_id (int): Internal ID of the acting admin.
+        scream_ids (list): IDs of the screams to check.
+        now (int, optional): Current epoch second, defaults to now.
+
+    Returns:
+        set: IDs among `scream_ids` leased to other admins.
+    """
+    if not scream_ids:
+        return set()
+    now = epoch_seconds() if now is None else now
+    result = await session.scalars(
+        select(Scream.id).where(
+            Scream.id.in_(scream_ids),
+            Scream.claimed_by.is_not(None),
+            Scream.claimed_by != admin_id,
+            Scream.lease_expires >= now,
+        )
+    )
+    return set(result.all())
+
+
+async def ensure_not_leased(session, admin_id: int, scream_id: int):
+    """
+    Reject acting on a scream another admin is reviewing.
+
+    Args:
+        session (AsyncSession): Database session.
+        admin_id (int): Internal ID of the acting admin.
+        scream_id (int): ID of the scream.
+
+    Raises:
+        HTTPException: 409 if another admin holds an unexpired lease on
+        the scream.
+    """
+    if await leased_to_others(session, admin_id, [scream_id]):
+        logger.warning(f"Scream {scream_id} is leased to another admin")
+        raise HTTPException(status_code=409,
+                            detail="Scream is leased to another admin")
+
+
+async def claim_batch(session, admin_id: int, week_id: int, limit: int,
+                      after_id: int = 0, before_id: int = None,
+                      now: int = None) -> list:
+    """
+    Lease the next batch of the moderation queue to an admin.
+
+    The admin's previous batch is released first, so every admin holds
+    at most one batch. The batch is the first `limit` claimable screams
+    after `after_id`, or the last ones before `before_id`; screams leased
+    to other admins are skipped, so concurrent admins never review the
+    same scream until a lease lapses. The claim re-checks the lease in
+    the UPDATE itself and skips rows locked by a concurrent claim on
+    PostgreSQL. The caller commits the session.
+
+    Args:
+        session (AsyncSession): Database session.
+        admin_id (int): Internal ID of the claiming admin.
+        week_id (int): Week of the moderation queue.
+        limit (int): Maximum batch size.
+        after_id (int): Claim screams after this scream ID.
+        before_id (Optional[int]): Claim the screams right before this
+            scream ID instead.
+        now (int, optional): Current epoch second, defaults to now.
+
+    Returns:
+        list: (scream ID, content) tuples of the batch in ID order.
+    """
+    now = epoch_seconds() if now is None else now
+    await session.execute(
+        update(Scream)
+        .where(Scream.claimed_by == admin_id)
+        .values(claimed_by=None, lease_expires=None)
+    )
+
+    candidates = select(Scream.id).where(*_queue(week_id),
+                                         _claimable(admin_id, now))
+    if before_id is None:
+        candidates = (candidates.where(Scream.id > after_id)
+                      .order_by(Scream.id))
+    else:
+        candidates = (candidates.where(Scream.id < before_id)
+                      .order_by(Scream.id.desc()))
+    candidates = candidates.limit(limit).with_for_update(skip_locked=True)
+
+    await session.execute(
+        update(Scream)
+        .where(and_(Scream.id.in_(candidates), _claimable(admin_id, now)))
+        .values(claimed_by=admin_id, lease_expires=now + LEASE_SECONDS)
+        .execution_options(synchronize_session=False)
+    )
+    result = await session.execute(
+        select(Scream.id, Scream.content)
+        .where(Scream.claimed_by == admin_id, *_queue(week_id))
+        .order_by(Scream.id)
+    )
+    batch = result.all()
+    logger.info(f"Admin {admin_id} claimed {len(batch)} screams")
+    return batch
@@ -0,0 +1,154 @@
+# Standard library
+import asyncio
+import logging
+
+# Third‑party
+from sqlalchemy import (
+    delete,
+    func,
+    insert,
+    literal_column,
+    select,
+    text,
+    union_all,
+)
+
+# Local application
+from app_fastapi.models.activity import (
+    ActivityDaily,
+    ActivityHourly,
+    UserActivityDaily,
+)
+from app_fastapi.models.reaction import Reaction
+from app_fastapi.models.scream import Scream
+from app_fastapi.tools.dialect import dialect_name
+from app_fastapi.tools.time import SECONDS_PER_DAY, SECONDS_PER_HOUR
+
+
+logger = logging.getLogger("app_fastapi.tools")
+
+# Primary key expressions of each rollup table on screams and on
+# reactions. Screams carry a generated day_id; reactions only store
+# their epoch timestamp, which is bucketed the same way.
+_BUCKETS = {
+    ActivityHourly: (
+        (Scream.timestamp // SECONDS_PER_HOUR,),
+        (Reaction.timestamp // SECONDS_PER_HOUR,),
+    ),
+    ActivityDaily: (
+        (Scream.day_id,),
+        (Reaction.timestamp // SECONDS_PER_DAY,),
+    ),
+    UserActivityDaily: (
+        (Scream.user_id, Scream.day_id),
+        (Reaction.user_id, Reaction.timestamp // SECONDS_PER_DAY),
+    ),
+}
+
+
+def _rollup_select(model):
+    """
+    Build a SELECT counting screams and reactions per bucket of a table.
+
+    Args:
+        model (Base): Rollup model, a key of `_BUCKETS`.
+
+    Returns:
+        tuple: Column names of the model and the grouped SELECT.
+    """
+    keys = [c.name for c in model.__table__.primary_key.columns]
+    scream_keys, reaction_keys = _BUCKETS[model]
+    events = union_all(
+        select(*(k.label(n) for k, n in zip(scream_keys, keys)),
+               literal_column("1").label("screams"),
+               literal_column("0").label("reactions"))
+        .where(Scream.timestamp.isnot(None)),
+        select(*(k.label(n) for k, n in zip(reaction_keys, keys)),
+               literal_column("0").label("screams"),
+               literal_column("1").label("reactions"))
+        .where(Reaction.timestamp.isnot(None)),
+    ).subquery()
+    grouped = [events.c[key] for key in keys]
+    return [*keys, "screams", "reactions"], (
+        select(*grouped, func.sum(events.c.screams),
+               func.sum(events.c.reactions))
+        .group_by(*grouped)
+    )
+
+
+async def rebuild_rollups(conn) -> int:
+    """
+    Recompute all activity rollup tables from screams and reactions.
+
+    Existing rollup rows are replaced by `INSERT ... SELECT ... GROUP BY`
+    statements, so rows are bucketed by the database. Writes to screams
+    and reactions must not commit between the DELETE and the INSERT, or
+    their increments would be lost: PostgreSQL locks both tables against
+    writes for the transaction, and on SQLite the first DELETE takes the
+    database's single write lock. The caller commits.
+
+    Args:
+        conn (AsyncConnection | AsyncSession): Database connection.
+
+    Returns:
+        int: Number of daily rows written.
+    """
+    if dialect_name(conn) == "postgresql":
+        await conn.execute(
+            text("LOCK TABLE screams, reactions IN SHARE MODE")
+        )
+    days = 0
+    for model in _BUCKETS:
+        await conn.execute(delete(model))
+        columns, source = _rollup_select(model)
+        result = await conn.execute(insert(model).from_select(columns,
+                                                              source))
+        if model is ActivityDaily:
+            days = result.rowcount
+
+    logger.info(f"Rebuilt rollups for {days} days")
+    return days
+
+
+async def daily_screams(session, first_day: int, days: int = 7,
+                        user_id: int = None) -> list:
+    """
+    Read per-day scream counts from the daily rollups.
+
+    Args:
+        session (AsyncSession): Database session.
+        first_day (int): Day bucket of the first day.
+        days (int): Number of consecutive days.
+        user_id (int, optional): Restrict to one user's screams.
+
+    Returns:
+        list: Scream count of each day, zero for days without a row.
+    """
+    model = ActivityDaily if user_id is None else UserActivityDaily
+    stmt = select(model.day, model.screams).where(
+        model.day >= first_day, model.day < first_day + days
+    )
+    if user_id is not None:
+        stmt = stmt.where(model.user_id == user_id)
+
+    counts = [0] * days
+    for day, screams in (await session.execute(stmt)).all():
+        counts[day - first_day] = screams
+    return counts
+
+
+async def _backfill():
+    """Rebuild the rollups on the configured database and commit."""
+    from app_fastapi.initializers.engine import asyncSession
+
+    async with asyncSession() as session:
+        days = await rebuild_rollups(session)
+        await session.commit()
+    logger.info(f"Rebuilt activity rollups for {days} days")
+
+
+if __name__ == "__main__":
+    from app_fastapi.logger import setup_fastapi_logger
+
+    setup_fastapi_logger()
+    asyncio.run(_backfill())
@@ -0,0 +1,29 @@
+# Standard library
+import logging
+from os import getenv
+
+# Third‑party
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+logger = logging.getLogger("app_fastapi.tools")
+
+# Responses smaller than this many bytes are sent uncompressed.
+GZIP_MINIMUM_SIZE = int(getenv("GZIP_MINIMUM_SIZE", "1000"))
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response encoded by pydantic-core's Rust serializer.
+
+    Used as the application's default response class. It encodes dicts,
+    lists and Pydantic models in one native pass, like orjson, without
+    adding a dependency beyond Pydantic. Endpoints returning trusted
+    rows may return it directly to skip `response_model` validation and
+    FastAPI's `jsonable_encoder` altogether.
+    """
+
+    def render(self, content) -> bytes:
+        """Encode the content as compact UTF-8 JSON."""
+        return to_json(content)
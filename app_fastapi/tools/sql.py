@@ -0,0 +1,28 @@
+# Third‑party
+from sqlalchemy import Integer
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+
+
+class epoch_now(FunctionElement):
+    """
+    Current time as integer Unix epoch seconds, computed by the database.
+
+    Used as a server default, so rows are stamped at insert time in one
+    clock instead of by the application.
+    """
+
+    type = Integer()
+    inherit_cache = True
+
+
+@compiles(epoch_now)
+def _epoch_now_default(element, compiler, **kw):
+    """Render epoch_now for dialects with a Unix epoch extract."""
+    return "CAST(EXTRACT(EPOCH FROM now()) AS INTEGER)"
+
+
+@compiles(epoch_now, "sqlite")
+def _epoch_now_sqlite(element, compiler, **kw):
+    """Render epoch_now for SQLite."""
+    return "(CAST(strftime('%s', 'now') AS INTEGER))"
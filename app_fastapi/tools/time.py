@@ -1,58 +1,107 @@
 # Standard library
 import logging
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone
 
 
 logger = logging.getLogger("app_fastapi.tools")
 
 
-def get_bounds(days=1, addition=True):
-    """Calculate time range starting from today's beginning in UTC.
+SECONDS_PER_HOUR = 3600
+SECONDS_PER_DAY = 86400
+
+
+def epoch_seconds(ts: datetime = None) -> int:
+    """
+    Convert a datetime (default: now) to integer Unix epoch seconds.
+
+    Args:
+        ts (datetime, optional): Timezone-aware timestamp; naive values
+            are taken as UTC.
+
+    Returns:
+        int: Seconds since 1970-01-01 00:00:00 UTC.
+    """
+    if ts is None:
+        ts = datetime.now(timezone.utc)
+    elif ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return int(ts.timestamp())
+
+
+def hour_bucket(ts: int) -> int:
+    """
+    Return the number of whole hours between the Unix epoch and `ts`.
+
+    Args:
+        ts (int): Epoch seconds.
+
+    Returns:
+        int: Hour bucket used by the hourly rollup tables.
+    """
+    return ts // SECONDS_PER_HOUR
+
+
+def day_bucket(ts: int) -> int:
+    """
+    Return the day ID (days since the Unix epoch) of `ts`.
+
+    Matches the generated `day_id` column of screams. Reactions store
+    only their epoch timestamp and are bucketed with this function.
+
+    Args:
+        ts (int): Epoch seconds.
+
+    Returns:
+        int: Day ID.
+    """
+    return ts // SECONDS_PER_DAY
+
+
+def week_of_day(day_id: int) -> int:
+    """
+    Return the Monday-based week ID containing a day.
+
+    1970-01-01 was a Thursday, so shifting by three days aligns weeks
+    to start on Monday. Matches the generated `week_id` column.
 
     Args:
-        days (int): Number of days to add/subtract from today. Default 1.
-        addition (bool): If True adds days, False subtracts. Default True.
+        day_id (int): Days since the Unix epoch.
+
+    Returns:
+        int: Week ID.
+    """
+    return (day_id + 3) // 7
+
+
+def current_day_id() -> int:
+    """
+    Return today's day ID in UTC.
+
+    Returns:
+        int: Day ID.
+    """
+    return day_bucket(epoch_seconds())
+
+
+def current_week_id() -> int:
+    """
+    Return the current week ID in UTC.
 
     Returns:
-        tuple: Two datetime objects (start, end):
-            - start: Today at 00:00:00 UTC
-            - end: Today ± days at 00:00:00 UTC
-    """
-    try:
-        now = datetime.now(timezone.utc)
-        today = now.replace(
-            hour=0,
-            minute=0,
-            second=0,
-            microsecond=0
-        )
-        if addition:
-            result = (today, today + timedelta(days=days))
-        else:
-            result = (today, today - timedelta(days=days))
-        logger.debug(f"Calculated time bounds: {result}")
-        return result
-    except Exception as e:
-        logger.error(
-            f"Failed to calculate time bounds: {str(e)}",
-            exc_info=True
-        )
-        raise
-
-
-def get_week_start():
-    """
-    Get UTC datetime for start of current week (Monday 00:00:00).
+        int: Week ID.
+    """
+    return week_of_day(current_day_id())
+
+
+def day_label(day_id: int) -> str:
+    """
+    Return the short weekday name of a day ID, e.g. "Mon".
+
+    Args:
+        day_id (int): Days since the Unix epoch.
 
     Returns:
-        datetime:
-            Timezone-aware datetime (UTC) for most recent Monday midnight.
-    """
-    now = datetime.now(timezone.utc)
-    week_start = now - timedelta(days=now.weekday())
-    return week_start.replace(
-        hour=0,
-        minute=0,
-        second=0,
-        microsecond=0
-    )
+        str: Abbreviated weekday name.
+    """
+    return datetime.fromtimestamp(day_id * SECONDS_PER_DAY,
+                                  tz=timezone.utc).strftime('%a')
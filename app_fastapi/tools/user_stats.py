@@ -0,0 +1,132 @@
+# Standard library
+import asyncio
+import logging
+
+# Third‑party
+from sqlalchemy import case, func, select, text, true, union
+
+# Local application
+from app_fastapi.initializers.engine import asyncSession
+from app_fastapi.models.reaction import Reaction
+from app_fastapi.models.scream import Scream
+from app_fastapi.models.user_stats import RECEIVED_COLUMNS, UserStats
+from app_fastapi.tools.dialect import dialect_insert, dialect_name
+
+
+logger = logging.getLogger("app_fastapi.tools")
+
+
+def _totals():
+    """
+    Build a SELECT of per-user totals from the screams and reactions.
+
+    Covers every user with screams, given reactions or an existing stats
+    row, so stale rows are reset to zero rather than left behind.
+
+    Returns:
+        Select: Rows matching the columns of UserStats.
+    """
+    posted = (
+        select(Scream.user_id, func.count().label("n"))
+        .group_by(Scream.user_id).subquery()
+    )
+    given = (
+        select(Reaction.user_id, func.count().label("n"))
+        .group_by(Reaction.user_id).subquery()
+    )
+    received = (
+        select(Scream.user_id, func.count().label("reactions_got"),
+               *[func.sum(case((Reaction.emoji == emoji, 1), else_=0))
+                 .label(column)
+                 for emoji, column in RECEIVED_COLUMNS.items()])
+        .join(Scream, Scream.id == Reaction.scream_id)
+        .group_by(Scream.user_id).subquery()
+    )
+    users = union(
+        select(Scream.user_id), select(Reaction.user_id),
+        select(UserStats.user_id),
+    ).subquery()
+    return (
+        select(
+            users.c.user_id,
+            func.coalesce(posted.c.n, 0),
+            func.coalesce(given.c.n, 0),
+            func.coalesce(received.c.reactions_got, 0),
+            *[func.coalesce(received.c[column], 0)
+              for column in RECEIVED_COLUMNS.values()],
+        )
+        .outerjoin(posted, posted.c.user_id == users.c.user_id)
+        .outerjoin(given, given.c.user_id == users.c.user_id)
+        .outerjoin(received, received.c.user_id == users.c.user_id)
+        # SQLite needs a WHERE to parse ON CONFLICT after a join.
+        .where(true())
+    )
+
+
+async def rebuild_user_stats(conn) -> int:
+    """
+    Overwrite the user_stats table with totals computed from raw rows.
+
+    The totals are computed and written by one INSERT ... SELECT ... ON
+    CONFLICT DO UPDATE, which SQLite runs under its single write lock.
+    PostgreSQL first locks the table against concurrent writers, so an
+    increment committed while the statement runs is not overwritten
+    with a total computed before it. The caller commits.
+
+    Args:
+        conn (AsyncConnection | AsyncSession): Database connection.
+
+    Returns:
+        int: Number of users written.
+    """
+    columns = ["user_id", "screams_posted", "reactions_given",
+               "reactions_got", *RECEIVED_COLUMNS.values()]
+    stmt = dialect_insert(conn, UserStats).from_select(columns, _totals())
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["user_id"],
+        set_={column: stmt.excluded[column] for column in columns[1:]},
+    )
+    if dialect_name(conn) == "postgresql":
+        await conn.execute(
+            text("LOCK TABLE user_stats IN SHARE ROW EXCLUSIVE MODE")
+        )
+    result = await conn.execute(stmt)
+    logger.info(f"Rebuilt stats of {result.rowcount} users")
+    return result.rowcount
+
+
+def rebuild_user_stats_job():
+    """
+    Rebuild the user_stats table in the background.
+
+    Scheduled nightly so any drift of the incrementally maintained
+    counters (e.g. after manual database edits) is corrected.
+
+    Raises:
+        Exception: If any error occurs during database operations
+    """
+    async def _inner():
+        async with asyncSession() as session:
+            try:
+                await rebuild_user_stats(session)
+                await session.commit()
+            except Exception as e:
+                logger.error(f"User stats rebuild failed: {str(e)}",
+                             exc_info=True)
+                raise
+    asyncio.create_task(_inner())
+
+
+async def _rebuild():
+    """Rebuild user stats on the configured database and commit."""
+    async with asyncSession() as session:
+        count = await rebuild_user_stats(session)
+        await session.commit()
+    logger.info(f"Rebuilt stats of {count} users")
+
+
+if __name__ == "__main__":
+    from app_fastapi.logger import setup_fastapi_logger
+
+    setup_fastapi_logger()
+    asyncio.run(_rebuild())
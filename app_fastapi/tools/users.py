@@ -0,0 +1,91 @@
+# Standard library
+import logging
+from collections import OrderedDict
+from os import getenv
+from typing import Optional
+from weakref import WeakKeyDictionary
+
+# Third‑party
+from sqlalchemy import select
+
+# Local application
+from app_fastapi.models.user import User
+from app_fastapi.tools.dialect import insert_ignore
+
+
+logger = logging.getLogger("app_fastapi.tools")
+
+USER_CACHE_SIZE = int(getenv("USER_CACHE_SIZE", "100000"))
+
+# Engine -> {user_hash: user_id} in least recently used order. Users are
+# never deleted, so a committed mapping stays valid for the lifetime of
+# the process; only the least recently used ones are evicted.
+_cache = WeakKeyDictionary()
+
+
+def _engine_cache(session) -> OrderedDict:
+    """
+    Return the hash-to-ID cache of the session's database.
+
+    Args:
+        session (AsyncSession): Database session.
+
+    Returns:
+        OrderedDict: Mutable cache for that engine.
+    """
+    return _cache.setdefault(session.get_bind(), OrderedDict())
+
+
+async def lookup_user_id(session, user_hash: str) -> Optional[int]:
+    """
+    Resolve a user hash to its ID without creating a user.
+
+    Args:
+        session (AsyncSession): Database session (read-only is enough).
+        user_hash (str): Hashed external user ID.
+
+    Returns:
+        Optional[int]: The user ID, or None if the user never wrote.
+    """
+    cache = _engine_cache(session)
+    if user_hash in cache:
+        cache.move_to_end(user_hash)
+        return cache[user_hash]
+    user_id = await session.scalar(
+        select(User.id).where(User.user_hash == user_hash)
+    )
+    if user_id is not None:
+        cache[user_hash] = user_id
+        if len(cache) > USER_CACHE_SIZE:
+            cache.popitem(last=False)
+    return user_id
+
+
+async def get_or_create_user_id(session, user_hash: str) -> int:
+    """
+    Resolve a user hash to its ID, registering the user if needed.
+
+    A new user is committed immediately, so the cached ID never refers
+    to a rolled-back row.
+
+    Args:
+        session (AsyncSession): Write session; committed if a user is added.
+        user_hash (str): Hashed external user ID.
+
+    Returns:
+        int: The user ID.
+    """
+    user_id = await lookup_user_id(session, user_hash)
+    if user_id is not None:
+        return user_id
+
+    if await insert_ignore(session, User, {"user_hash": user_hash},
+                           index_elements=["user_hash"]):
+        logger.info(f"Registered user {user_hash[:5]}...")
+    await session.commit()
+    return await lookup_user_id(session, user_hash)
+
+
+def clear_user_cache():
+    """Forget all cached hash-to-ID mappings."""
+    _cache.clear()
@@ -0,0 +1,130 @@
+# Standard library
+import logging
+
+# Third-party
+from fastapi import HTTPException
+from sqlalchemy import select, update
+
+# Local application
+from app_fastapi.models.emoji import Emoji
+from app_fastapi.models.reaction import Reaction
+from app_fastapi.models.scream import Scream
+from app_fastapi.models.skip import Skip
+
+
+logger = logging.getLogger("app_fastapi.tools")
+
+
+def insert_scream(content: str, user_id: int):
+    """
+    Build a writer job that inserts a scream.
+
+    Args:
+        content (str): Text of the scream.
+        user_id (int): ID of the author.
+
+    Returns:
+        Callable: Job returning the new scream ID.
+    """
+    async def job(session):
+        scream = Scream(content=content, user_id=user_id)
+        session.add(scream)
+        await session.flush()
+        return scream.id
+    return job
+
+
+async def _check_unanswered(session, scream_id: int, user_id: int):
+    """
+    Ensure a scream exists and the user neither reacted nor skipped it.
+
+    Raises:
+        HTTPException: 404 if the scream does not exist,
+        409 if the user already reacted or skipped.
+    """
+    scream = await session.get(Scream, scream_id)
+    if not scream:
+        logger.warning(f"Scream not found: {scream_id}")
+        raise HTTPException(status_code=404, detail="Scream not found")
+
+    reacted = await session.scalar(
+        select(Reaction.id).where(
+            Reaction.scream_id == scream_id,
+            Reaction.user_id == user_id
+        )
+    )
+    skipped = reacted or await session.get(Skip, (user_id, scream_id))
+    if skipped:
+        logger.warning(f"User already reacted to scream {scream_id}")
+        raise HTTPException(status_code=409, detail="Already reacted")
+
+
+def insert_reaction(scream_id: int, emoji: Emoji, user_id: int):
+    """
+    Build a writer job that records a reaction.
+
+    The existence and duplicate checks run before anything is added to
+    the session, so a rejected reaction leaves the shared group
+    transaction untouched.
+
+    Args:
+        scream_id (int): ID of the scream reacted to.
+        emoji (Emoji): Emoji reaction.
+        user_id (int): ID of the reacting user.
+
+    Returns:
+        Callable: Job returning the new reaction ID.
+
+    Raises:
+        HTTPException: 404 if the scream does not exist,
+        409 if the user already reacted or skipped.
+    """
+    async def job(session):
+        await _check_unanswered(session, scream_id, user_id)
+        reaction = Reaction(emoji=emoji, scream_id=scream_id,
+                            user_id=user_id)
+        session.add(reaction)
+        await session.flush()
+        return reaction.id
+    return job
+
+
+def insert_skip(scream_id: int, user_id: int):
+    """
+    Build a writer job that records a feed skip.
+
+    Args:
+        scream_id (int): ID of the skipped scream.
+        user_id (int): ID of the skipping user.
+
+    Returns:
+        Callable: Job returning None.
+
+    Raises:
+        HTTPException: 404 if the scream does not exist,
+        409 if the user already reacted or skipped.
+    """
+    async def job(session):
+        await _check_unanswered(session, scream_id, user_id)
+        session.add(Skip(scream_id=scream_id, user_id=user_id))
+        await session.flush()
+    return job
+
+
+def set_meme_url(scream_id: int, meme_url: str):
+    """
+    Build a writer job that stores the generated meme of a scream.
+
+    Args:
+        scream_id (int): ID of the scream.
+        meme_url (str): URL of the meme image.
+
+    Returns:
+        Callable: Job returning None.
+    """
+    async def job(session):
+        await session.execute(
+            update(Scream).where(Scream.id == scream_id)
+            .values(meme_url=meme_url)
+        )
+    return job